@@ -16,3 +16,46 @@ from . import profile
 from . import utils
 from . import processors
 from . import reader
+
+# The following submodules, and the names they export, are imported upon first
+# access only, so that importing fitdecode does not cost the import of their
+# own dependencies (concurrent.futures, multiprocessing, asyncio, ...)
+_LAZY_SUBMODULES = (
+    'scanner', 'decoder', 'aio', 'index', 'parallel', 'batch', 'transport')
+
+_LAZY_NAMES = {
+    'ScannedFrame': 'scanner',
+    'FitScanner': 'scanner',
+    'FitDecoder': 'decoder',
+    'AsyncFitReader': 'aio',
+    'IndexedFitFile': 'index',
+    'IndexCheckpoint': 'index',
+    'FitIndex': 'index',
+    'ParallelFitReader': 'parallel',
+    'BatchResult': 'batch',
+    'ColumnarResult': 'batch',
+    'decode_files': 'batch',
+    'decode_columns': 'batch',
+    'pack_frames': 'transport',
+    'unpack_frames': 'transport',
+    'share_columns': 'transport',
+    'SharedColumns': 'transport'}
+
+
+def __getattr__(name):
+    import importlib
+
+    if name in _LAZY_SUBMODULES:
+        return importlib.import_module('.' + name, __name__)
+
+    try:
+        mod_name = _LAZY_NAMES[name]
+    except KeyError:
+        raise AttributeError(
+            f'module {__name__!r} has no attribute {name!r}') from None
+
+    return getattr(importlib.import_module('.' + mod_name, __name__), name)
+
+
+def __dir__():
+    return sorted({*globals(), *_LAZY_SUBMODULES, *_LAZY_NAMES})
@@ -0,0 +1,70 @@
+# Copyright (c) Jean-Charles Lefebvre
+# SPDX-License-Identifier: MIT
+
+from .decoder import FitDecoder
+from .reader import DEFAULT_BLOCK_SIZE
+
+__all__ = ['AsyncFitReader']
+
+
+class AsyncFitReader(FitDecoder):
+    """
+    Asynchronous version of `FitReader`, to decode a FIT stream from an
+    `asyncio` event loop.
+
+    *stream* is an `asyncio.StreamReader` object, or any object with an
+    awaitable ``read(n)`` method that returns at most *n* bytes, and an empty
+    bytes object once EOF is reached.
+
+    Data is read by blocks of *block_size* bytes at most, and decoded by the
+    calling coroutine directly, the same way `FitDecoder` does. That is,
+    without blocking the event loop while waiting for data, and without
+    involving any thread.
+
+    Usage::
+
+        import fitdecode
+
+        async def decode(stream):
+            async with fitdecode.AsyncFitReader(stream) as fit:
+                async for frame in fit:
+                    ...
+
+    *stream* is not closed by this object.
+
+    The other arguments have the same meaning than for `FitReader`.
+    """
+
+    def __init__(self, stream, *, block_size=DEFAULT_BLOCK_SIZE, **kwargs):
+        assert isinstance(block_size, int) and block_size > 0
+
+        super().__init__(**kwargs)
+
+        self._stream = stream
+        self._block_size = block_size
+
+    def __aiter__(self):
+        return self._aread_next()
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *_):
+        self.close()
+
+    def close(self):
+        super().close()
+        self._stream = None
+
+    # ONLY PRIVATE METHODS BELOW ***********************************************
+
+    async def _aread_next(self):
+        while self._stream is not None:
+            data = await self._stream.read(self._block_size)
+            if not data:
+                break
+
+            for frame in self.feed(data):
+                yield frame
+
+        self.end_of_stream()
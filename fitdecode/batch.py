@@ -0,0 +1,388 @@
+# Copyright (c) Jean-Charles Lefebvre
+# SPDX-License-Identifier: MIT
+
+import array
+import collections
+import concurrent.futures
+import datetime
+import functools
+import os
+import pickle
+
+from . import profile
+from . import records
+from . import transport
+from . import utils
+from .reader import FitReader
+
+__all__ = ['BatchResult', 'ColumnarResult', 'decode_files', 'decode_columns']
+
+# the maximum number of jobs submitted to a pool of worker processes and whose
+# result has not been yielded yet, per worker, see _run_jobs()
+_PENDING_JOBS_PER_WORKER = 2
+
+
+#: The outcome of the decoding of a file by `decode_files`.
+#:
+#: * ``index``: the position of the file in the *paths* passed to
+#:   `decode_files`
+#: * ``path``: the path of the file
+#: * ``frames``: the list of the frames decoded from the file. In case of
+#:   error, the frames decoded up to the error.
+#: * ``error``: `None` if the file has been decoded entirely, or the
+#:   exception that stopped its decoding (typically a `FitError` or an
+#:   `OSError`, but also any exception raised by the data processor). With
+#:   worker processes, an exception that cannot be pickled is replaced by a
+#:   `RuntimeError` holding its `repr`, and the error that prevented a result
+#:   from being transferred (e.g. unpicklable values) is reported along with
+#:   no frames.
+BatchResult = collections.namedtuple(
+    'BatchResult', ('index', 'path', 'frames', 'error'))
+
+
+def decode_files(paths, *, workers=None, processor_factory=None,
+                 reader_kwargs=None, executor=None):
+    """
+    Decode many FIT files using a pool of worker processes, and yield a
+    `BatchResult` per file, as soon as the file has been decoded. That is,
+    **not** necessarily in the order of *paths*, see ``BatchResult.index``.
+
+    A file that cannot be decoded does not stop the batch: its error is
+    reported by its `BatchResult`, as well as the frames decoded up to the
+    error.
+
+    Usage::
+
+        import fitdecode
+        import fitdecode.batch
+
+        for result in fitdecode.batch.decode_files(paths, workers=4):
+            if result.error is not None:
+                print(f'{result.path}: {result.error}')
+            else:
+                ...
+
+    *workers* is the number of worker processes, which defaults to the number
+    of processors of the machine. Workers are started once (and the FIT
+    profile loaded once per worker), then reused for every file. An existing
+    `concurrent.futures.Executor` can be passed as *executor* instead, in
+    which case *workers* is only used to limit the number of pending files.
+
+    *processor_factory* is a callable that takes no argument and returns the
+    data processor of a file (see the *processor* argument of `FitReader`). It
+    is called in the worker process, once per file, and so must be picklable
+    (e.g. a class, or a function defined at module level). The default data
+    processor is used if it is `None`.
+
+    *reader_kwargs* are the other keyword arguments passed to the `FitReader`
+    of each file.
+
+    If *workers* is ``1``, files are decoded by the calling process.
+    """
+    if workers is None:
+        workers = os.cpu_count() or 1
+
+    assert isinstance(workers, int) and workers > 0
+
+    if reader_kwargs is None:
+        reader_kwargs = {}
+
+    jobs = (
+        (idx, os.fspath(path), processor_factory, reader_kwargs)
+        for idx, path in enumerate(paths))
+
+    if workers < 2 and executor is None:
+        for job in jobs:
+            yield _decode_file_job(*job)
+        return
+
+    for result in _run_jobs(
+            _decode_file_job_packed, jobs, workers, executor,
+            failed=_failed_file_job):
+        yield result._replace(frames=transport.unpack_frames(result.frames))
+
+
+class ColumnarResult:
+    """
+    The outcome of the decoding of a file by `decode_columns`.
+
+    `columns` is a ``{mesg: {field: column}}`` `dict`, where *mesg* and
+    *field* are the keys of the *columns* argument of `decode_columns`, and
+    *column* is a `memoryview` of ``'d'`` format. The other attributes have the
+    same meaning than for `BatchResult`.
+
+    Columns may be views of a shared memory block, which is released by
+    `close`. `ColumnarResult` can be used as a context manager.
+    """
+
+    __slots__ = ('index', 'path', 'columns', 'error', '_shared_columns')
+
+    def __init__(self, index, path, columns, error, shared_columns=None):
+        self.index = index
+        self.path = path
+        self.columns = columns
+        self.error = error
+        self._shared_columns = shared_columns
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *_):
+        self.close()
+
+    def close(self):
+        """
+        Release the columns. See `fitdecode.transport.SharedColumns.close`.
+        """
+        if self._shared_columns is not None:
+            self._shared_columns.close()
+            self._shared_columns = None
+        else:
+            for named_columns in self.columns.values():
+                for column in named_columns.values():
+                    column.release()
+        self.columns = {}
+
+
+def decode_columns(paths, columns, *, workers=None, processor_factory=None,
+                   reader_kwargs=None, executor=None):
+    """
+    Like `decode_files`, but yield a `ColumnarResult` per file, which holds
+    numeric columns of values rather than frames.
+
+    *columns* is a `dict` that maps message names (or global numbers) to the
+    names (or definition numbers) of the fields to extract, like the *fields*
+    argument of `FitReader`, by which fields are projected. There is a row per
+    data message of each requested message type, and a column per requested
+    field.
+
+    Values are converted to `float`: `datetime.datetime` objects to POSIX
+    timestamps, and non-numeric values (e.g. strings) as well as missing or
+    invalid ones to *NaN*.
+
+    Columns are sent by workers through shared memory, and accessed without
+    copy by the calling process, so that the cost of moving many values does
+    not depend on pickling. Each `ColumnarResult` must be closed to release
+    its shared memory.
+
+    Usage::
+
+        import fitdecode.batch
+
+        for result in fitdecode.batch.decode_columns(
+                paths, {'record': ('timestamp', 'heart_rate', 'power')}):
+            with result:
+                heart_rate = result.columns['record']['heart_rate']
+                ...
+
+    Requires Python 3.8+ if *workers* is greater than 1.
+    """
+    if workers is None:
+        workers = os.cpu_count() or 1
+
+    assert isinstance(workers, int) and workers > 0
+
+    reader_kwargs = dict(reader_kwargs or {}, fields=columns)
+    reader_kwargs.setdefault('include_mesgs', tuple(columns))
+
+    jobs = (
+        (idx, os.fspath(path), columns, processor_factory, reader_kwargs)
+        for idx, path in enumerate(paths))
+
+    if workers < 2 and executor is None:
+        for job in jobs:
+            idx, path, named_columns, error = _decode_columns_job(*job)
+            for mesg_columns in named_columns.values():
+                for name, column in mesg_columns.items():
+                    mesg_columns[name] = memoryview(column)
+            yield ColumnarResult(idx, path, named_columns, error)
+        return
+
+    # workers keep the shared memory blocks of the results that may not have
+    # been attached yet (Windows)
+    function = functools.partial(
+        _decode_columns_job_shared, _PENDING_JOBS_PER_WORKER * workers)
+
+    for idx, path, descriptor, error in _run_jobs(
+            function, jobs, workers, executor,
+            failed=_failed_columns_job, discard=_discard_shared_columns):
+        shared_columns = transport.SharedColumns(descriptor)
+        yield ColumnarResult(
+            idx, path, shared_columns.columns, error, shared_columns)
+
+
+def _run_jobs(function, jobs, workers, executor, *, failed, discard=None):
+    # Run *function* in a pool of worker processes for each job of *jobs* and
+    # yield the results as soon as they are available. *failed(job, exc)*
+    # returns the result of a job whose result could not be received (e.g.
+    # not picklable). *discard* is called with the results that could not be
+    # yielded, if any.
+    owned_executor = executor is None
+    if owned_executor:
+        executor = concurrent.futures.ProcessPoolExecutor(
+            max_workers=workers, initializer=_init_worker)
+
+    submitted = {}  # {future: job}
+    pending = set()
+    done = set()
+    try:
+        while True:
+            # keep a limited number of files pending so that memory usage does
+            # not depend on the number of files
+            for job in jobs:
+                future = executor.submit(function, *job)
+                submitted[future] = job
+                pending.add(future)
+                if len(pending) >= _PENDING_JOBS_PER_WORKER * workers:
+                    break
+
+            if not pending:
+                break
+
+            done, pending = concurrent.futures.wait(
+                pending, return_when=concurrent.futures.FIRST_COMPLETED)
+
+            while done:
+                future = done.pop()
+                job = submitted.pop(future)
+
+                # a failure of the transfer of a result does not stop the
+                # whole batch either
+                try:
+                    result = future.result()
+                except Exception as exc:
+                    result = failed(job, exc)
+
+                yield result
+    finally:
+        pending.update(done)
+        for future in pending:
+            future.cancel()
+
+        # results are discarded before the workers exit since they may hold
+        # resources released along with their process
+        if discard is not None:
+            concurrent.futures.wait(pending)
+            for future in pending:
+                if not future.cancelled() and future.exception() is None:
+                    discard(future.result())
+
+        if owned_executor:
+            executor.shutdown(wait=True)
+
+
+def _init_worker():
+    # make sure the FIT profile is built once and for all by each worker
+    # process, rather than upon its first jobs
+    for _mesg_type in profile.MESSAGE_TYPES.values():
+        pass
+
+
+def _decode_file_job_packed(*args):
+    # entry point of the worker processes: frames are packed to speed up their
+    # transfer to the calling process
+    result = _decode_file_job(*args)
+    return result._replace(
+        frames=transport.pack_frames(result.frames),
+        error=_picklable_error(result.error))
+
+
+def _failed_file_job(job, exc):
+    idx, path, _processor_factory, _reader_kwargs = job
+    return BatchResult(idx, path, transport.pack_frames(()), exc)
+
+
+def _decode_file_job(idx, path, processor_factory, reader_kwargs):
+    frames = []
+
+    # any exception is reported by the result of the file, so that it does
+    # not stop the whole batch
+    try:
+        kwargs = reader_kwargs
+        if processor_factory is not None:
+            kwargs = dict(reader_kwargs, processor=processor_factory())
+
+        with FitReader(path, **kwargs) as reader:
+            for frame in reader:
+                frames.append(frame)
+    except Exception as exc:
+        return BatchResult(idx, path, frames, exc)
+
+    return BatchResult(idx, path, frames, None)
+
+
+def _decode_columns_job_shared(keep_blocks, *args):
+    # entry point of the worker processes: columns are sent through shared
+    # memory
+    idx, path, columns, error = _decode_columns_job(*args)
+    descriptor = transport.share_columns(columns, keep_blocks=keep_blocks)
+    return idx, path, descriptor, _picklable_error(error)
+
+
+def _failed_columns_job(job, exc):
+    idx, path, columns, _processor_factory, _reader_kwargs = job
+    return idx, path, transport.share_columns({
+        key: {name: array.array('d') for name in field_names}
+        for key, field_names in columns.items()}), exc
+
+
+def _decode_columns_job(idx, path, columns, processor_factory, reader_kwargs):
+    # map global message numbers to the keys of *columns*
+    mesg_keys = {}
+    for key in columns:
+        if isinstance(key, int) and not isinstance(key, bool):
+            mesg_keys[key] = key
+        else:
+            mesg_keys[utils.get_mesg_num(key)] = key
+
+    named_columns = {
+        key: {name: array.array('d') for name in field_names}
+        for key, field_names in columns.items()}
+
+    # any exception is reported by the result of the file, so that it does
+    # not stop the whole batch
+    try:
+        kwargs = reader_kwargs
+        if processor_factory is not None:
+            kwargs = dict(reader_kwargs, processor=processor_factory())
+
+        with FitReader(path, **kwargs) as reader:
+            for frame in reader:
+                if frame.frame_type != records.FIT_FRAME_DATA:
+                    continue
+
+                key = mesg_keys.get(frame.global_mesg_num)
+                if key is None:
+                    continue
+
+                for name, column in named_columns[key].items():
+                    column.append(_to_float(
+                        frame.get_value(name, fallback=None)))
+    except Exception as exc:
+        return idx, path, named_columns, exc
+
+    return idx, path, named_columns, None
+
+
+def _to_float(value):
+    if isinstance(value, (int, float)):
+        return float(value)
+    if isinstance(value, datetime.datetime):
+        return value.timestamp()
+    return float('nan')
+
+
+def _picklable_error(error):
+    # An exception raised by a data processor may not survive its transfer to
+    # the calling process, in which case it is reported by its repr() instead
+    if error is not None:
+        try:
+            pickle.loads(pickle.dumps(error))  # noqa: DUO103
+        except Exception:
+            return RuntimeError(f'unpicklable exception: {error!r}')
+
+    return error
+
+
+def _discard_shared_columns(result):
+    transport.SharedColumns(result[2]).close()
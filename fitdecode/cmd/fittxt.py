@@ -321,6 +321,25 @@ def parse_filter_args(arg_parser, filter_opt):
     return filtr, default_include_policy
 
 
+def filter_to_reader_args(filtr, default_include_policy):
+    """
+    Convert the output of `parse_filter_args` to the *include_mesgs* and
+    *exclude_mesgs* arguments of `fitdecode.FitReader`
+    """
+    if not filtr:
+        return None, None
+
+    include_mesgs = None
+    if not default_include_policy:
+        include_mesgs = [
+            mesg_num for mesg_num, include in filtr.items() if include]
+
+    exclude_mesgs = [
+        mesg_num for mesg_num, include in filtr.items() if not include]
+
+    return include_mesgs, exclude_mesgs
+
+
 def parse_args(args=None):
     parser = argparse.ArgumentParser(
         description='Dump a FIT file to TXT format that ease debugging',
@@ -370,6 +389,8 @@ def parse_args(args=None):
 
 def main(args=None):
     options = parse_args(args)
+    include_mesgs, exclude_mesgs = \
+        filter_to_reader_args(options.filter, options.default_filter)
 
     def _echo(*objects, sep=' ', end='\n', file=options.output, flush=False):
         print(*objects, sep=sep, end=end, file=file, flush=flush)
@@ -391,7 +412,9 @@ def main(args=None):
                 options.infile,
                 processor=fitdecode.StandardUnitsDataProcessor(),
                 check_crc=options.nocrc,
-                keep_raw_chunks=True) as fit:
+                keep_raw_chunks=True,
+                include_mesgs=include_mesgs,
+                exclude_mesgs=exclude_mesgs) as fit:
             for frame in fit:
                 if (options.nodef and
                         frame.frame_type == fitdecode.FIT_FRAME_DEFINITION):
@@ -0,0 +1,214 @@
+# Copyright (c) Jean-Charles Lefebvre
+# SPDX-License-Identifier: MIT
+
+from . import records
+from .exceptions import FitError
+from .reader import CrcCheck, ErrorHandling, FitReader, _UNSET
+
+__all__ = ['FitDecoder']
+
+
+class FitDecoder(FitReader):
+    """
+    A *push* (or *sans-IO*) parser of FIT streams: data is fed to the decoder
+    as it comes, in chunks of any size, and the frames that can be decoded
+    entirely so far are returned. Unlike `FitReader`, the decoder never reads
+    nor waits for data by itself.
+
+    Usage::
+
+        import fitdecode
+
+        decoder = fitdecode.FitDecoder()
+
+        for data in some_stream_of_bytes:
+            for frame in decoder.feed(data):
+                ...
+
+        decoder.end_of_stream()
+
+    Frames are the same than the ones `FitReader` yields for the same data,
+    chained FIT files included.
+
+    The arguments have the same meaning than for `FitReader`. Note that a
+    frame is decoded (and the data processor called) only once all its bytes
+    have been fed, so chunks of `FitChunk` objects are not affected by the
+    boundaries of the fed data. Likewise, with *batch_size*, runs of data
+    messages do not span several calls to `feed`.
+
+    `FitDecoder` is a subclass of `FitReader` so the properties of the latter
+    can be used too, but it must not be iterated.
+    """
+
+    def __init__(
+            self, *, processor=_UNSET, check_crc=CrcCheck.WARN,
+            error_handling=ErrorHandling.WARN, keep_raw_chunks=False,
+            data_bag=_UNSET, include_mesgs=None, exclude_mesgs=None,
+            fields=None, batch_size=None, lazy_fields=False):
+        # the source stream is always empty: data is appended to the
+        # read-ahead buffer by feed() instead, and a frame is decoded only once
+        # it is entirely buffered
+        super().__init__(
+            b'', processor=processor, check_crc=check_crc,
+            error_handling=error_handling, keep_raw_chunks=keep_raw_chunks,
+            data_bag=data_bag, include_mesgs=include_mesgs,
+            exclude_mesgs=exclude_mesgs, fields=fields, batch_size=batch_size,
+            lazy_fields=lazy_fields)
+
+        # the error that stopped decoding, once the frames that precede it
+        # have been returned
+        self._error = None
+
+    def __iter__(self):
+        raise TypeError('FitDecoder is not iterable, see feed()')
+
+    def feed(self, data):
+        """
+        Feed the decoder with *data*, a bytes-like object, and return the list
+        of the frames that have been decoded.
+
+        A `FitError` exception may be raised, like `FitReader` would do when
+        decoding the same data. In which case the frames that precede the error
+        are returned first, and the exception is raised by the next call to
+        `feed` or `end_of_stream`.
+        """
+        if self._error is not None:
+            raise self._error
+
+        if self._fd is None:
+            raise ValueError('decoder is closed')
+
+        if data:
+            # the consumed part of the buffer is about to be discarded
+            self._update_crc()
+
+            self._buffer = self._buffer[self._buffer_pos:] + bytes(data)
+            self._buffer_pos = 0
+            self._crc_pos = 0
+
+        frames = []
+        self._batching = self._batch_size is not None
+        try:
+            while True:
+                frame_size = self._get_next_frame_size()
+                if (frame_size is None or
+                        frame_size > len(self._buffer) - self._buffer_pos):
+                    break
+
+                try:
+                    frame = self._decode_next_frame()
+                except FitError as exc:
+                    if not frames:
+                        raise
+                    self._error = exc
+                    break
+
+                if frame is not None:
+                    frames.append(frame)
+        finally:
+            self._batching = False
+
+        if self._batch_size is not None:
+            frames = list(self._process_batches(frames))
+
+        return frames
+
+    def end_of_stream(self):
+        """
+        Tell the decoder that no more data is to be fed, and close it.
+
+        `FitEOFError` (or `FitHeaderError`) is raised if the data fed so far
+        ends in the middle of a FIT file, like `FitReader` would do.
+        """
+        if self._error is not None:
+            self.close()
+            raise self._error
+
+        if self._fd is None:
+            return
+
+        try:
+            # the missing bytes are read from the (empty) source stream, so
+            # that the same exception is raised than by FitReader
+            while (self._header is not None or
+                    self._buffer_pos < len(self._buffer)):
+                self._decode_next_frame()
+        finally:
+            self.close()
+
+    # ONLY PRIVATE METHODS BELOW ***********************************************
+
+    def _get_next_frame_size(self):
+        # Get the size of the next frame, given the bytes buffered so far.
+        # None if there are not enough bytes to know it yet.
+        buffer = self._buffer
+        pos = self._buffer_pos
+        available = len(buffer) - pos
+        if not available:
+            return None
+
+        if self._header is None:
+            # the first byte of a FIT header is its size, which is 12 bytes at
+            # least
+            return max(buffer[pos], 12)
+
+        if self._body_bytes_left <= 0:
+            return 2  # CRC
+
+        record_header = buffer[pos]
+        if record_header & 0x80:  # compressed timestamp
+            local_mesg_num = (record_header >> 5) & 0x3
+        elif not record_header & 0x40:
+            local_mesg_num = record_header & 0xf
+        else:
+            # definition message: 5 bytes, then 3 bytes per field, then the
+            # number of developer fields and 3 bytes per developer field
+            if available < 6:
+                return None
+            size = 6 + 3 * buffer[pos + 5]
+
+            if record_header & 0x20:
+                if available < size + 1:
+                    return None
+                size += 1 + 3 * buffer[pos + size]
+
+            return size
+
+        def_mesg = self._local_mesg_defs.get(local_mesg_num)
+        if def_mesg is None:
+            # let _read_record() raise the error
+            return 1
+
+        return 1 + def_mesg.decode_plan.size
+
+    def _decode_next_frame(self):
+        # Decode the next frame like FitReader._read_next does. Return None if
+        # the frame is filtered out.
+        assert self._chunk_size == 0
+
+        if self._header is None:
+            assert self._body_bytes_left == 0
+
+            self._reset_per_fit_state()
+            self._read_header()
+            if self._header is None:
+                return None
+
+            self._fit_file_index += 1
+            frame = self._header
+
+        elif self._body_bytes_left > 0:
+            frame = self._read_record()
+
+            assert self._chunk_size <= self._body_bytes_left
+            self._body_bytes_left -= self._chunk_size
+
+        else:
+            frame = self._read_crc()
+
+        self._next_chunk()
+
+        if frame is not None and frame.frame_type == records.FIT_FRAME_CRC:
+            self._reset_per_fit_state()
+
+        return frame
@@ -1,9 +1,14 @@
 # Copyright (c) Jean-Charles Lefebvre
 # SPDX-License-Identifier: MIT
 
+import copyreg
+
 
 class FitError(Exception):
-    pass
+    def __reduce__(self):
+        # bypass the __init__ method of derived classes since their signature
+        # differs, so that errors can be passed between processes
+        return (copyreg.__newobj__, (type(self), ) + self.args, self.__dict__)
 
 
 class FitHeaderError(FitError):
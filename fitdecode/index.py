@@ -0,0 +1,496 @@
+# Copyright (c) Jean-Charles Lefebvre
+# SPDX-License-Identifier: MIT
+
+import bisect
+import collections
+import os
+import struct
+
+from . import profile
+from . import records
+from . import types
+from .reader import CrcCheck, ErrorHandling, FitReader, _ALWAYS_DECODED_MESGS
+
+__all__ = ['IndexedFitFile', 'IndexCheckpoint', 'FitIndex']
+
+
+#: The header of a FIT file, as stored in a `FitIndex`.
+#:
+#: * ``offset``: the offset of the header in the source stream
+#: * the other fields are the same than `FitHeader`'s
+IndexedFitFile = collections.namedtuple(
+    'IndexedFitFile',
+    ('offset', 'header_size', 'proto_ver', 'profile_ver', 'body_size', 'crc',
+     'crc_matched'))
+
+#: The state of a `FitReader` at a record boundary, as stored in a `FitIndex`.
+#:
+#: * ``mesg_index``: the zero-based index, in the data stream, of the data
+#:   message that follows the checkpoint
+#: * ``min_timestamp`` and ``max_timestamp``: the bounds of the raw time
+#:   values of the data messages that follow the checkpoint, up to the next
+#:   checkpoint (`None` if there is none)
+#: * ``time_ordered``: true if the time of the data messages that follow the
+#:   checkpoint, up to the next checkpoint, is non-decreasing
+#: * ``offset``: the offset of the record that follows the checkpoint
+#: * ``file_index``: the index of the FIT file in ``FitIndex.files``
+#: * ``chunk_index``, ``body_bytes_left``, ``crc``,
+#:   ``compressed_ts_accumulator``, ``last_timestamp`` and
+#:   ``hr_start_timestamp``: the internal state of `FitReader`
+#: * ``definitions``: the offsets of the active definition messages
+#: * ``accumulators``: ``(global_mesg_num, ((def_num, value), ...))`` pairs
+#: * ``dev_types``: ``(dev_data_index, application_id, fields)`` tuples, where
+#:   ``fields`` are ``(def_num, base_type_num, name, units, native_field_num)``
+#:   tuples
+IndexCheckpoint = collections.namedtuple(
+    'IndexCheckpoint',
+    ('mesg_index', 'min_timestamp', 'max_timestamp', 'time_ordered', 'offset',
+     'file_index', 'chunk_index',
+     'body_bytes_left', 'crc', 'compressed_ts_accumulator', 'last_timestamp',
+     'hr_start_timestamp', 'definitions', 'accumulators', 'dev_types'))
+
+
+_INDEX_MAGIC = b'FITX'
+_INDEX_VERSION = 1
+_INDEX_HEADER = struct.Struct('<4sB')
+
+
+class FitIndex:
+    """
+    A random access index of a FIT stream or storage, to be used with
+    `FitReader.jump_to`.
+
+    It holds the header of every chained FIT file, and a checkpoint at the
+    beginning of the body of each of them, as well as every *interval* data
+    messages. A checkpoint is the internal state of `FitReader` at this point
+    (active definition messages, developer types, accumulators, time) so that
+    decoding can be resumed from there instead of from the header of the FIT
+    file.
+
+    An index is built once with `build`, by a single pass over the source that
+    only decodes the few fields needed to keep track of this state, and can be
+    saved in a compact binary *sidecar* file next to the FIT file.
+
+    Usage::
+
+        import fitdecode
+
+        index = fitdecode.FitIndex.load_or_build('file.fit')
+
+        with fitdecode.FitReader('file.fit') as fit:
+            fit.jump_to(index, timestamp=some_datetime)
+            for frame in fit:
+                ...
+
+    Checkpoints are located by binary search.
+
+    The *time* of a data message is the raw value of its ``timestamp`` field,
+    or the one given by its *compressed timestamp header*, or the time of the
+    previous data message if it has neither.
+    """
+
+    #: Default number of data messages between two checkpoints
+    DEFAULT_INTERVAL = 1000
+
+    #: Extension appended to the path of a FIT file to get its sidecar path
+    SIDECAR_EXT = '.fitidx'
+
+    def __init__(self, files, checkpoints, *, interval=DEFAULT_INTERVAL,
+                 source_size=None):
+        #: `IndexedFitFile` objects
+        self.files = tuple(files)
+
+        #: `IndexCheckpoint` objects, sorted by offset
+        self.checkpoints = tuple(checkpoints)
+
+        #: the number of data messages between two checkpoints
+        self.interval = interval
+
+        #: the size of the indexed source, if known
+        self.source_size = source_size
+
+        self._mesg_indexes = [cp.mesg_index for cp in self.checkpoints]
+        # for each checkpoint, the greatest time of the data messages that
+        # precede it, and the smallest time of the data messages that follow it
+        self._max_timestamps = []
+        self._min_timestamps = []
+
+        max_timestamp = -float('inf')
+        for cp in self.checkpoints:
+            self._max_timestamps.append(max_timestamp)
+            if cp.max_timestamp is not None:
+                max_timestamp = max(max_timestamp, cp.max_timestamp)
+
+        min_timestamp = float('inf')
+        for cp in reversed(self.checkpoints):
+            if cp.min_timestamp is not None:
+                min_timestamp = min(min_timestamp, cp.min_timestamp)
+            self._min_timestamps.append(min_timestamp)
+        self._min_timestamps.reverse()
+
+    @classmethod
+    def build(cls, fileish, *, interval=DEFAULT_INTERVAL,
+              check_crc=CrcCheck.WARN, error_handling=ErrorHandling.WARN,
+              **kwargs):
+        """
+        Build the index of *fileish* (same meaning than for `FitReader`) by
+        reading it entirely.
+
+        The CRC must be computed in order to be stored in checkpoints, so
+        `CrcCheck.DISABLED` is the same as `CrcCheck.READONLY` here.
+
+        Extra keyword arguments are passed to `FitReader`, except *processor*,
+        *include_mesgs* and *exclude_mesgs* since data messages are neither
+        processed nor filtered while building an index: every one of them is
+        counted so that checkpoints match the data message numbers of
+        `FitReader` (a `TypeError` is raised).
+        """
+        assert isinstance(interval, int) and interval > 0
+
+        for name in ('processor', 'include_mesgs', 'exclude_mesgs'):
+            if name in kwargs:
+                raise TypeError(f'build() does not support *{name}*')
+
+        if check_crc is CrcCheck.DISABLED or check_crc is False:
+            check_crc = CrcCheck.READONLY
+
+        files = []
+        checkpoints = []
+        segments = []  # [min_time, max_time, is_ordered] of the data messages that follow each checkpoint  # noqa: E501
+        mesg_index = 0
+        definitions = {}
+
+        with _IndexBuilder(
+                fileish, check_crc=check_crc, error_handling=error_handling,
+                **kwargs) as reader:
+            for frame in reader:
+                if frame.frame_type == records.FIT_FRAME_HEADER:
+                    files.append(IndexedFitFile(
+                        reader._chunk_offset, frame.header_size,
+                        frame.proto_ver, frame.profile_ver, frame.body_size,
+                        frame.crc, frame.crc_matched))
+                    definitions = {}
+                    checkpoints.append(
+                        reader._make_checkpoint(mesg_index, definitions))
+                    segments.append([None, None, True])
+
+                elif frame.frame_type == records.FIT_FRAME_DEFINITION:
+                    definitions[frame.local_mesg_num] = reader._chunk_offset
+
+                elif frame.frame_type == records.FIT_FRAME_DATA:
+                    mesg_index += 1
+                    timestamp = reader._compressed_ts_accumulator
+
+                    segment = segments[-1]
+                    if segment[0] is None:
+                        segment[0] = timestamp
+                        segment[1] = timestamp
+                    elif timestamp < segment[1]:
+                        segment[0] = min(segment[0], timestamp)
+                        segment[2] = False
+                    else:
+                        segment[1] = timestamp
+
+                    if not mesg_index % interval and reader._body_bytes_left:
+                        checkpoints.append(
+                            reader._make_checkpoint(mesg_index, definitions))
+                        segments.append([None, None, True])
+
+            source_size = reader._read_offset
+
+        checkpoints = [
+            cp._replace(
+                min_timestamp=min_timestamp, max_timestamp=max_timestamp,
+                time_ordered=time_ordered)
+            for cp, (min_timestamp, max_timestamp, time_ordered)
+            in zip(checkpoints, segments)]
+
+        return cls(
+            files, checkpoints, interval=interval, source_size=source_size)
+
+    @classmethod
+    def load(cls, fileish):
+        """Load an index saved by `save` from a path or a file-like object"""
+        if hasattr(fileish, 'read'):
+            data = fileish.read()
+        else:
+            with open(fileish, mode='rb') as fd:
+                data = fd.read()
+
+        try:
+            magic, version = _INDEX_HEADER.unpack_from(data)
+        except struct.error:
+            raise ValueError('not a FIT index')
+        if magic != _INDEX_MAGIC:
+            raise ValueError('not a FIT index')
+        if version != _INDEX_VERSION:
+            raise ValueError(f'unsupported FIT index version {version}')
+
+        # whatever the corruption, the error is a ValueError
+        try:
+            (interval, source_size, files, checkpoints), offset = \
+                _unpack_value(data, _INDEX_HEADER.size)
+            if offset != len(data):
+                raise ValueError('trailing data')
+
+            return cls(
+                (IndexedFitFile(*file) for file in files),
+                (IndexCheckpoint(*cp) for cp in checkpoints),
+                interval=interval, source_size=source_size)
+        except Exception as exc:
+            raise ValueError('corrupted FIT index') from exc
+
+    @classmethod
+    def load_or_build(cls, path, *, sidecar_path=None, **kwargs):
+        """
+        Load the index of the FIT file at *path* from its sidecar file, if it
+        exists and is up-to-date, or build it and save it to the sidecar file
+        otherwise. If the sidecar file cannot be written, the built index is
+        returned anyway.
+
+        *sidecar_path* defaults to `get_sidecar_path`. Extra keyword arguments
+        are passed to `build`.
+        """
+        if sidecar_path is None:
+            sidecar_path = cls.get_sidecar_path(path)
+
+        source_stat = os.stat(path)
+        try:
+            if os.stat(sidecar_path).st_mtime >= source_stat.st_mtime:
+                index = cls.load(sidecar_path)
+                if index.source_size == source_stat.st_size:
+                    return index
+        except (OSError, ValueError):
+            pass
+
+        index = cls.build(path, **kwargs)
+        try:
+            index.save(sidecar_path)
+        except OSError:
+            # e.g. read-only directory
+            pass
+
+        return index
+
+    @classmethod
+    def get_sidecar_path(cls, path):
+        """The default path of the sidecar index file of a FIT file"""
+        return os.fspath(path) + cls.SIDECAR_EXT
+
+    def save(self, fileish):
+        """Save this index to a path or to a file-like object"""
+        data = bytearray(_INDEX_HEADER.pack(_INDEX_MAGIC, _INDEX_VERSION))
+        _pack_value(data, (
+            self.interval, self.source_size, self.files, self.checkpoints))
+
+        if hasattr(fileish, 'write'):
+            fileish.write(data)
+        else:
+            with open(fileish, mode='wb') as fd:
+                fd.write(data)
+
+    def find_mesg_index(self, mesg_index):
+        """
+        Get the last `IndexCheckpoint` that precedes the data message at
+        *mesg_index*. `None` if index is empty.
+        """
+        idx = bisect.bisect_right(self._mesg_indexes, mesg_index)
+        return self.checkpoints[idx - 1] if idx else None
+
+    def find_timestamp(self, timestamp):
+        """
+        Get the last `IndexCheckpoint` that precedes every data message which
+        raw time value is equal to or greater than *timestamp*. `None` if index
+        is empty.
+        """
+        if not self.checkpoints:
+            return None
+
+        idx = bisect.bisect_left(self._max_timestamps, timestamp)
+        return self.checkpoints[max(0, idx - 1)]
+
+    def find_time_range(self, start, end=None):
+        """
+        Get the positions, in `checkpoints`, of the checkpoints that are
+        followed by some data messages which raw time value is within the range
+        [*start*, *end*). *end* can be `None`.
+
+        Checkpoints are located by binary search. The ones in-between are
+        filtered by their time bounds, so that data messages with unordered
+        time (e.g. summary messages written first) are found too.
+        """
+        first = max(0, bisect.bisect_left(self._max_timestamps, start) - 1)
+        if end is None:
+            last = len(self.checkpoints)
+        else:
+            last = bisect.bisect_left(self._min_timestamps, end)
+
+        return [
+            pos for pos in range(first, last)
+            if self.checkpoints[pos].max_timestamp is not None and
+            self.checkpoints[pos].max_timestamp >= start and
+            (end is None or self.checkpoints[pos].min_timestamp < end)]
+
+
+class _IndexBuilder(FitReader):
+    # A FitReader that only decodes what is needed to keep track of its own
+    # internal state
+
+    def __init__(self, fileish, **kwargs):
+        super().__init__(fileish, processor=None, **kwargs)
+
+    def _make_decode_plan(
+            self, mesg_type, global_mesg_num, endian, all_field_defs):
+        if global_mesg_num in _ALWAYS_DECODED_MESGS:
+            return None
+
+        needed_nums = {profile.FIELD_NUM_TIMESTAMP}
+        if global_mesg_num == profile.MESG_NUM_HR:
+            needed_nums.add(profile.FIELD_NUM_HR_EVENT_TIMESTAMP)
+
+        if mesg_type is not None:
+            # the source fields of accumulated components, and their reference
+            # fields since the components of a subfield may differ
+            for field in mesg_type.fields.values():
+                if any(cmp.accumulate for cmp in field.components or ()):
+                    needed_nums.add(field.def_num)
+                    for sub_field in field.subfields or ():
+                        for ref_field in sub_field.ref_fields:
+                            needed_nums.add(ref_field.def_num)
+
+        return types.DecodePlan(
+            endian, all_field_defs,
+            only=(
+                idx for idx, field_def in enumerate(all_field_defs)
+                if not field_def.is_dev and field_def.def_num in needed_nums),
+            emit=(), field_nums=frozenset())
+
+    def _make_checkpoint(self, mesg_index, definitions):
+        # to be called while the generator of this reader is suspended, that
+        # is, once the current frame has been read entirely
+        self._update_crc()
+
+        return IndexCheckpoint(
+            mesg_index=mesg_index,
+            # time bounds are known once the next checkpoint is reached
+            min_timestamp=None,
+            max_timestamp=None,
+            time_ordered=True,
+            offset=self._chunk_offset + self._chunk_size,
+            file_index=self._fit_file_index,
+            chunk_index=self._chunk_index + 1,
+            body_bytes_left=self._body_bytes_left,
+            crc=self._crc,
+            compressed_ts_accumulator=self._compressed_ts_accumulator,
+            last_timestamp=self._last_timestamp,
+            hr_start_timestamp=self._hr_start_timestamp,
+            definitions=tuple(
+                definitions[local_mesg_num]
+                for local_mesg_num in sorted(definitions)),
+            accumulators=tuple(
+                (global_mesg_num, tuple(sorted(values.items())))
+                for global_mesg_num, values in self._accumulators.items()),
+            dev_types=tuple(
+                (dev_type['dev_data_index'], dev_type['application_id'],
+                 tuple(
+                     (field.def_num, field.type.identifier, field.name,
+                      field.units, field.native_field_num)
+                     for field in dev_type['fields'].values()))
+                for dev_type in self._local_dev_types.values()))
+
+
+# Values of the index file are encoded as a one-byte tag followed by a payload
+_TAG_NONE = 0
+_TAG_FALSE = 1
+_TAG_TRUE = 2
+_TAG_UINT8 = 3
+_TAG_INT32 = 4
+_TAG_INT64 = 5
+_TAG_FLOAT = 6
+_TAG_STR = 7
+_TAG_BYTES = 8
+_TAG_TUPLE = 9
+
+_STRUCT_TAG = struct.Struct('<B')
+_STRUCT_INT32 = struct.Struct('<i')
+_STRUCT_INT64 = struct.Struct('<q')
+_STRUCT_FLOAT = struct.Struct('<d')
+_STRUCT_SIZE = struct.Struct('<I')
+
+
+def _pack_value(output, value):
+    if value is None:
+        output.append(_TAG_NONE)
+    elif value is False:
+        output.append(_TAG_FALSE)
+    elif value is True:
+        output.append(_TAG_TRUE)
+    elif isinstance(value, int):
+        if 0 <= value <= 0xff:
+            output.append(_TAG_UINT8)
+            output.append(value)
+        elif -0x80000000 <= value <= 0x7fffffff:
+            output.append(_TAG_INT32)
+            output += _STRUCT_INT32.pack(value)
+        else:
+            output.append(_TAG_INT64)
+            output += _STRUCT_INT64.pack(value)
+    elif isinstance(value, float):
+        output.append(_TAG_FLOAT)
+        output += _STRUCT_FLOAT.pack(value)
+    elif isinstance(value, str):
+        value = value.encode('utf-8')
+        output.append(_TAG_STR)
+        output += _STRUCT_SIZE.pack(len(value))
+        output += value
+    elif isinstance(value, (bytes, bytearray, memoryview)):
+        output.append(_TAG_BYTES)
+        output += _STRUCT_SIZE.pack(len(value))
+        output += value
+    elif isinstance(value, (tuple, list)):
+        output.append(_TAG_TUPLE)
+        output += _STRUCT_SIZE.pack(len(value))
+        for item in value:
+            _pack_value(output, item)
+    else:
+        raise TypeError(f'cannot index value of type {type(value).__name__}')
+
+
+def _unpack_value(data, offset):
+    tag = data[offset]
+    offset += 1
+
+    if tag == _TAG_NONE:
+        return None, offset
+    elif tag == _TAG_FALSE:
+        return False, offset
+    elif tag == _TAG_TRUE:
+        return True, offset
+    elif tag == _TAG_UINT8:
+        return data[offset], offset + 1
+    elif tag == _TAG_INT32:
+        return _STRUCT_INT32.unpack_from(data, offset)[0], offset + 4
+    elif tag == _TAG_INT64:
+        return _STRUCT_INT64.unpack_from(data, offset)[0], offset + 8
+    elif tag == _TAG_FLOAT:
+        return _STRUCT_FLOAT.unpack_from(data, offset)[0], offset + 8
+
+    (size, ) = _STRUCT_SIZE.unpack_from(data, offset)
+    offset += _STRUCT_SIZE.size
+    if tag != _TAG_TUPLE and offset + size > len(data):
+        raise ValueError('truncated data')
+
+    if tag == _TAG_STR:
+        end = offset + size
+        return data[offset:end].decode('utf-8'), end
+    elif tag == _TAG_BYTES:
+        end = offset + size
+        return bytes(data[offset:end]), end
+    elif tag == _TAG_TUPLE:
+        items = []
+        for _ in range(size):
+            item, offset = _unpack_value(data, offset)
+            items.append(item)
+        return tuple(items), offset
+
+    raise ValueError(f'unknown tag {tag}')
@@ -0,0 +1,329 @@
+# Copyright (c) Jean-Charles Lefebvre
+# SPDX-License-Identifier: MIT
+
+import collections
+import concurrent.futures
+import io
+import os
+
+from . import records
+from . import transport
+from .exceptions import FitError
+from .reader import FitReader
+from .scanner import FitScanner
+
+__all__ = ['ParallelFitReader']
+
+
+class ParallelFitReader:
+    """
+    Decode the so-called *chained FIT files* of a FIT stream or storage in
+    parallel, using a pool of worker processes.
+
+    The boundaries of the chained FIT files are located first by a quick
+    structural scan of the source (see `FitScanner`), then each FIT file is
+    decoded by a `FitReader` in a worker process. Frames are yielded in their
+    original order, as if the source was read by a single `FitReader`.
+
+    Usage::
+
+        import fitdecode
+
+        for frame in fitdecode.ParallelFitReader('antfs-dump.fit', workers=8):
+            ...
+
+    *fileish* has the same meaning than for `FitReader`. If it is a path, each
+    worker reads its own part of the file. Otherwise, the source is read
+    entirely first and each worker is handed its part of it.
+
+    *workers* is the number of worker processes, which defaults to the number
+    of processors of the machine. An existing `concurrent.futures.Executor`
+    can be passed as *executor* instead, in which case *workers* is only used
+    to limit the number of pending FIT files.
+
+    The other keyword arguments are passed to the `FitReader` object of each
+    FIT file. Note that *processor* and *data_bag* are pickled to each worker
+    process, so changes made to them in a worker are not reflected in the
+    calling process.
+
+    A single large FIT file can be split too, by passing its *index*: a
+    `FitIndex` of *fileish*, which must be a path in this case. Each worker
+    then restores the state of the reader at a checkpoint of the index, and
+    decodes the data messages up to the next checkpoint. So the number of jobs
+    depends on the ``interval`` the index has been built with::
+
+        index = fitdecode.FitIndex.load_or_build('huge.fit', interval=20_000)
+
+        for frame in fitdecode.ParallelFitReader('huge.fit', index=index):
+            ...
+
+    Note that `FitReader.file_id` is `None` in the workers that do not start
+    at the header of a FIT file, and that ``on_header`` is called on the data
+    processor of the workers that do only.
+
+    If there is a single job, the source is decoded by the calling process
+    directly.
+
+    If a FIT file cannot be decoded, its frames are yielded up to the error,
+    which is then raised, like `FitReader` would do.
+    """
+
+    def __init__(self, fileish, *, workers=None, executor=None, index=None,
+                 **reader_kwargs):
+        if workers is None:
+            workers = os.cpu_count() or 1
+
+        assert isinstance(workers, int) and workers > 0
+
+        if index is not None and not (
+                isinstance(fileish, str) or hasattr(fileish, '__fspath__')):
+            raise ValueError('fileish must be a path to be split by index')
+
+        self._fileish = fileish
+        self._workers = workers
+        self._executor = executor
+        self._index = index
+        self._reader_kwargs = reader_kwargs
+
+    def __iter__(self):
+        yield from self._read_next()
+
+    # ONLY PRIVATE METHODS BELOW ***********************************************
+
+    def _read_next(self):
+        if self._index is not None:
+            jobs_count, jobs = self._make_segment_jobs()
+        else:
+            jobs_count, jobs = self._make_fit_file_jobs()
+
+        if jobs_count < 2 or self._workers < 2:
+            for job in jobs:
+                frames, exc = job[0](*job[1:])
+                yield from frames
+                if exc is not None:
+                    raise exc
+            return
+
+        executor = self._executor
+        if executor is None:
+            executor = concurrent.futures.ProcessPoolExecutor(
+                max_workers=self._workers)
+
+        try:
+            # keep a limited number of FIT files pending so that memory usage
+            # does not depend on the size of the source
+            pending = collections.deque()
+
+            while True:
+                for job in jobs:
+                    pending.append(executor.submit(_run_packed_job, *job))
+                    if len(pending) >= 2 * self._workers:
+                        break
+
+                if not pending:
+                    break
+
+                packed_frames, exc = pending.popleft().result()
+                yield from transport.unpack_frames(packed_frames)
+                if exc is not None:
+                    raise exc
+        finally:
+            for future in pending:
+                future.cancel()
+            if executor is not self._executor:
+                executor.shutdown(wait=True)
+
+    def _make_fit_file_jobs(self):
+        # Return the number of jobs, and a generator of jobs, one per FIT file.
+        # A job is a (function, *args) tuple.
+        source, fit_files = self._locate_fit_files()
+
+        def _jobs():
+            for offset, size, chunk_index in fit_files:
+                if isinstance(source, str):
+                    # the worker reads its own part of the file
+                    yield (
+                        _decode_fit_file_job, source, None, offset, size,
+                        chunk_index, self._reader_kwargs)
+                else:
+                    yield (
+                        _decode_fit_file_job, None,
+                        _read_source(source, offset, size), offset, size,
+                        chunk_index, self._reader_kwargs)
+
+        return len(fit_files), _jobs()
+
+    def _make_segment_jobs(self):
+        # Return the number of jobs, and a generator of jobs, one per
+        # checkpoint of the index
+        path = os.fspath(self._fileish)
+        files = self._index.files
+        checkpoints = self._index.checkpoints
+
+        # workers only need the headers of the index
+        headers_index = type(self._index)(files, ())
+
+        def _jobs():
+            for pos, checkpoint in enumerate(checkpoints):
+                from_header = (
+                    not pos or
+                    checkpoints[pos - 1].file_index != checkpoint.file_index)
+
+                # the first frame that does not belong to the segment, if any
+                if pos + 1 < len(checkpoints):
+                    next_checkpoint = checkpoints[pos + 1]
+                    if next_checkpoint.file_index == checkpoint.file_index:
+                        end_offset = next_checkpoint.offset
+                    else:
+                        end_offset = files[next_checkpoint.file_index].offset
+                else:
+                    # let the last worker read up to the end of the source,
+                    # like FitReader would do
+                    end_offset = None
+
+                yield (
+                    _decode_segment_job, path, headers_index, checkpoint,
+                    from_header, end_offset, self._reader_kwargs)
+
+        return len(checkpoints), _jobs()
+
+    def _locate_fit_files(self):
+        # Return the source to be read by workers (a path or a `_SliceIO`
+        # object) and a list of (offset, size, chunk_index) tuples, one per FIT
+        # file. *size* is None if the FIT file extends to the end of the source
+        if hasattr(self._fileish, 'read'):
+            offset = self._fileish.tell()
+            source = _SliceIO(self._fileish.read(), offset)
+        elif (isinstance(self._fileish, str) or
+                hasattr(self._fileish, '__fspath__')):
+            source = os.fspath(self._fileish)
+        else:
+            source = _SliceIO(bytes(self._fileish), 0)
+
+        fit_files = []
+        chunk_index = 0
+        next_offset = source.tell() if isinstance(source, _SliceIO) else 0
+        complete = True  # is the last FIT file complete?
+
+        try:
+            with FitScanner(source) as scanner:
+                for frame in scanner:
+                    if frame.frame_type == records.FIT_FRAME_HEADER:
+                        fit_files.append([frame.offset, 0, chunk_index])
+                    fit_files[-1][1] = (
+                        frame.offset + frame.size - fit_files[-1][0])
+                    next_offset = frame.offset + frame.size
+                    chunk_index += 1
+                    complete = frame.frame_type == records.FIT_FRAME_CRC
+        except FitError:
+            # let the error be raised by the FitReader of the FIT file it
+            # belongs to, in order
+            if complete:
+                fit_files.append([next_offset, None, chunk_index])
+            else:
+                fit_files[-1][1] = None
+
+        return source, [tuple(fit_file) for fit_file in fit_files]
+
+
+class _SliceIO(io.BytesIO):
+    # A slice of a data stream, which reports the positions of the data stream
+    # so that FitReader yields the offsets of the data stream
+
+    def __init__(self, data, offset):
+        super().__init__(data)
+        self._offset = offset
+
+    def tell(self):
+        return super().tell() + self._offset
+
+    def seek(self, pos, whence=io.SEEK_SET):
+        if whence == io.SEEK_SET:
+            pos -= self._offset
+        return super().seek(pos, whence) + self._offset
+
+
+class _SegmentReader(FitReader):
+    # A FitReader that decodes the part of a FIT file that sits between two
+    # checkpoints of a FitIndex
+
+    def _read_segment(self, index, checkpoint, from_header, end_offset):
+        if from_header:
+            # read the header too, as if the FIT file was read from the start
+            self._seek_source(index.files[checkpoint.file_index].offset)
+            self._fit_file_index = checkpoint.file_index - 1
+            self._data_mesg_count = checkpoint.mesg_index
+            self._chunk_index = checkpoint.chunk_index - 1
+        else:
+            self._restore_checkpoint(index, checkpoint)
+
+        # checked by _read_next() before every frame, skipped ones included,
+        # so that the segment is never read past its end
+        self._read_limit = (None, None, end_offset)
+        try:
+            yield from self._read_next()
+        finally:
+            self._read_limit = None
+
+
+def _read_source(source, offset, size):
+    if isinstance(source, str):
+        with open(source, mode='rb') as fd:
+            fd.seek(offset)
+            return fd.read(-1 if size is None else size)
+
+    start = offset - source._offset
+    end = None if size is None else start + size
+    data = source.getbuffer()
+    try:
+        return bytes(data[start:end])
+    finally:
+        data.release()
+
+
+def _run_packed_job(function, *args):
+    # entry point of the worker processes: run a job and pack its frames to
+    # speed up their transfer to the calling process
+    frames, exc = function(*args)
+    return transport.pack_frames(frames), exc
+
+
+def _decode_fit_file_job(
+        path, data, offset, size, chunk_index, reader_kwargs):
+    if data is None:
+        data = _read_source(path, offset, size)
+    return _decode_fit_file(data, offset, chunk_index, reader_kwargs)
+
+
+def _decode_segment_job(
+        path, index, checkpoint, from_header, end_offset, reader_kwargs):
+    frames = []
+
+    try:
+        with _SegmentReader(path, **reader_kwargs) as reader:
+            for frame in reader._read_segment(
+                    index, checkpoint, from_header, end_offset):
+                frames.append(frame)
+    except FitError as exc:
+        return frames, exc
+
+    return frames, None
+
+
+def _decode_fit_file(data, offset, chunk_index, reader_kwargs):
+    # Decode the FIT file held by *data*, located at *offset* in the source.
+    # Return the list of its frames, and the FitError that stopped decoding,
+    # if any.
+    frames = []
+
+    try:
+        with FitReader(_SliceIO(data, offset), **reader_kwargs) as reader:
+            for frame in reader:
+                if frame.chunk is not None:
+                    # chunk index is relative to the whole source
+                    frame.chunk.index += chunk_index
+                frames.append(frame)
+    except FitError as exc:
+        return frames, exc
+
+    return frames, None
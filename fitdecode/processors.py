@@ -59,6 +59,10 @@ class DataProcessorBase:
     the content of the passed *field_data* (:class:`fitdecode.FieldData`) and
     *data_message* (:class:`fitdecode.FitDataMessage`) arguments if needed.
 
+    :class:`fitdecode.FitReader` does not call the first three methods directly
+    but the callable returned by `get_field_processor`, which is compiled once
+    per profile field of each definition message.
+
     .. seealso:: `DefaultDataProcessor`, `StandardUnitsDataProcessor`
     """
 
@@ -93,6 +97,146 @@ class DataProcessorBase:
             f'process_message_{data_message.def_mesg.name}',
             reader, data_message)
 
+    def on_process_batch(self, reader, def_mesg, data_messages):
+        """
+        Process *data_messages*, a run of consecutive `fitdecode.FitDataMessage`
+        objects that share the same *def_mesg*
+        (`fitdecode.FitDefinitionMessage`).
+
+        Called by :class:`fitdecode.FitReader` instead of the other
+        ``on_process_*`` methods when its *batch_size* argument is set.
+
+        By default, fields are processed column by column, that is, all the
+        fields of *data_messages* that have the same profile field at once,
+        using the callable returned by `get_column_processor`. Then
+        `on_process_message` is called for each message.
+        """
+        columns = {}
+        for data_message in data_messages:
+            for field_data in data_message.fields:
+                key = field_data.field or field_data.field_def
+                column = columns.get(key)
+                if column is None:
+                    columns[key] = column = []
+                column.append(field_data)
+
+        for column in columns.values():
+            process = self.get_column_processor(column[0])
+            if process is not None:
+                process(reader, column)
+
+        for data_message in data_messages:
+            self.on_process_message(reader, data_message)
+
+    def get_field_processor(self, field_data):
+        """
+        Get a callable ``(reader, field_data)`` that does the same than calling
+        `on_process_type`, `on_process_field` and `on_process_unit` in that
+        order, for the fields of the same profile field than *field_data*. Or
+        `None` if there is nothing to do with them.
+
+        The ``process_*`` methods to be called are resolved once and for all by
+        this method, so that fields without any processing cost nothing. The
+        ``on_process_*`` methods overridden by a derived class are called as
+        is.
+        """
+        return self._compile_processor(field_data, column=False)
+
+    def get_column_processor(self, field_data):
+        """
+        Same as `get_field_processor` except that the returned callable is
+        ``(reader, column)``, where *column* is a `list` of the fields of the
+        same profile field than *field_data*.
+
+        For each ``process_*`` method, a ``process_column_*`` variant is looked
+        for first (e.g. ``process_column_units_semicircles(reader, column)``),
+        so that a derived class can process a whole column at once.
+        """
+        return self._compile_processor(field_data, column=True)
+
+    def _compile_processor(self, field_data, *, column):
+        # The implementation of get_field_processor() and
+        # get_column_processor()
+        cls = type(self)
+        steps = []
+
+        if cls.on_process_type is not DataProcessorBase.on_process_type:
+            steps.append(self._adapt_method(self.on_process_type, column))
+        else:
+            method = self._resolve_step('type', field_data.type.name, column)
+            if method is not None:
+                steps.append(method)
+
+        if cls.on_process_field is not DataProcessorBase.on_process_field:
+            steps.append(self._adapt_method(self.on_process_field, column))
+        elif field_data.name:
+            method = self._resolve_step('field', field_data.name, column)
+            if method is not None:
+                steps.append(method)
+
+        if cls.on_process_unit is not DataProcessorBase.on_process_unit:
+            steps.append(self._adapt_method(self.on_process_unit, column))
+        elif steps:
+            # units may be altered by the methods above
+            steps.append(self._make_units_step(field_data.units, column))
+        elif field_data.units:
+            method = self._resolve_step('units', field_data.units, column)
+            if method is not None:
+                steps.append(method)
+
+        if not steps:
+            return None
+        if len(steps) == 1:
+            return steps[0]
+
+        steps = tuple(steps)
+
+        def process(reader, data):
+            for step in steps:
+                step(reader, data)
+
+        return process
+
+    def _adapt_method(self, method, column):
+        # adapt a per-field method to the kind of processor to compile
+        return _column_wise(method) if column else method
+
+    def _resolve_step(self, kind, suffix, column):
+        # resolve the method of a step of a processor, or None
+        method = self._resolve_method(f'process_{kind}_{suffix}')
+        if column:
+            column_method = self._resolve_method(
+                f'process_column_{kind}_{suffix}')
+            if column_method is not None and (
+                    method is None or
+                    not _overrides(type(self), method, column_method)):
+                return column_method
+        return None if method is None else self._adapt_method(method, column)
+
+    def _make_units_step(self, units, column):
+        # the step that processes units once the previous steps of a processor
+        # have been run, in case they altered the *units* of the field
+        method = self._resolve_step('units', units, column) if units else None
+
+        if column:
+            def process_units(reader, column):
+                same_units = []
+                for field_data in column:
+                    if field_data.units == units:
+                        same_units.append(field_data)
+                    else:
+                        self.on_process_unit(reader, field_data)
+                if method is not None and same_units:
+                    method(reader, same_units)
+        else:
+            def process_units(reader, field_data):
+                if field_data.units != units:
+                    self.on_process_unit(reader, field_data)
+                elif method is not None:
+                    method(reader, field_data)
+
+        return process_units
+
     def _run_processor(self, method_name, reader, data):
         method = self._resolve_method(method_name)
         if method is not None:
@@ -119,11 +263,18 @@ class DefaultDataProcessor(DataProcessorBase):
 
     This data processor converts some raw values to more comfortable ones.
 
+    If *epoch_timestamps* is true, ``date_time`` and ``local_date_time`` typed
+    values are converted to POSIX timestamps (seconds since the Unix epoch)
+    instead of `datetime.datetime` objects, which is cheaper when values are to
+    be converted back to numbers anyway. Their units are left untouched (i.e.
+    ``s``).
+
     .. seealso:: `StandardUnitsDataProcessor`, `DataProcessorBase`
     """
 
-    def __init__(self):
+    def __init__(self, *, epoch_timestamps=False):
         super().__init__()
+        self.epoch_timestamps = epoch_timestamps
 
     def process_type_bool(self, reader, field_data):
         """Just `bool` any ``bool`` typed FIT field unless value is `None`"""
@@ -138,14 +289,12 @@ class DefaultDataProcessor(DataProcessorBase):
         That is, if value is not `None` and greater or equal than
         `FIT_DATETIME_MIN`.
 
-        The resulting `datetime.datetime` object is timezone-aware (UTC).
+        The resulting `datetime.datetime` object is timezone-aware (UTC). Or
+        the value is a POSIX timestamp if `epoch_timestamps` is true.
         """
         if (field_data.value is not None and
                 field_data.value >= FIT_DATETIME_MIN):
-            field_data.value = datetime.datetime.fromtimestamp(
-                FIT_UTC_REFERENCE + field_data.value,
-                datetime.timezone.utc)
-            field_data.units = None  # units were 's', set to None
+            self._convert_timestamp(field_data)
 
     def process_type_local_date_time(self, reader, field_data):
         """
@@ -154,15 +303,13 @@ class DefaultDataProcessor(DataProcessorBase):
 
         The resulting `datetime.datetime` object **IS NOT** timezone-aware, but
         this method assumes UTC at object construction to ensure consistency.
+        Likewise for the POSIX timestamp if `epoch_timestamps` is true.
         """
         if field_data.value is not None:
             # This value was created on the device using its local timezone.
             # Unless we know that timezone, this value won't be correct.
             # However, if we assume UTC, at least it'll be consistent.
-            field_data.value = datetime.datetime.fromtimestamp(
-                FIT_UTC_REFERENCE + field_data.value,
-                datetime.timezone.utc)
-            field_data.units = None
+            self._convert_timestamp(field_data)
 
     def process_type_localtime_into_day(self, reader, field_data):
         """
@@ -195,10 +342,18 @@ class DefaultDataProcessor(DataProcessorBase):
             for field_data in data_message.get_fields(
                     profile.FIELD_NUM_HR_EVENT_TIMESTAMP):
                 if field_data is not None:
-                    field_data.value = datetime.datetime.fromtimestamp(
-                        FIT_UTC_REFERENCE + field_data.value,
-                        datetime.timezone.utc)
-                    field_data.units = None  # units were 's', set to None
+                    self._convert_timestamp(field_data)
+
+    def _convert_timestamp(self, field_data):
+        # Convert the value of *field_data*, a number of seconds since
+        # FIT_UTC_REFERENCE, to either a POSIX timestamp or a datetime object
+        if self.epoch_timestamps:
+            field_data.value += FIT_UTC_REFERENCE
+        else:
+            field_data.value = datetime.datetime.fromtimestamp(
+                FIT_UTC_REFERENCE + field_data.value,
+                datetime.timezone.utc)
+            field_data.units = None  # units were 's', set to None
 
 
 class StandardUnitsDataProcessor(DefaultDataProcessor):
@@ -211,22 +366,23 @@ class StandardUnitsDataProcessor(DefaultDataProcessor):
       (standard's default is ``m/s``)
     * Converts GPS coordinates (i.e. FIT's semicircles type) to ``deg``
 
+    *epoch_timestamps* has the same meaning than for `DefaultDataProcessor`.
+
     .. seealso:: `DefaultDataProcessor`, `DataProcessorBase`
     """
 
-    def __init__(self):
-        super().__init__()
+    def __init__(self, *, epoch_timestamps=False):
+        super().__init__(epoch_timestamps=epoch_timestamps)
 
-    def on_process_field(self, reader, field_data):
-        """
-        Convert all ``*_speed`` fields using `process_field_speed`.
+    def _resolve_method(self, method_name):
+        # all the *_speed fields are converted by process_field_speed
+        if method_name.endswith('_speed'):
+            if method_name.startswith('process_field_'):
+                return self.process_field_speed
+            if method_name.startswith('process_column_field_'):
+                return self.process_column_field_speed
 
-        All other units will use the default method.
-        """
-        if field_data.name and field_data.name.endswith('_speed'):
-            self.process_field_speed(reader, field_data)
-        else:
-            super().on_process_field(reader, field_data)
+        return super()._resolve_method(method_name)
 
     def process_field_distance(self, reader, field_data):
         if field_data.value is not None:
@@ -253,3 +409,56 @@ class StandardUnitsDataProcessor(DefaultDataProcessor):
         if field_data.value is not None:
             field_data.value *= 180.0 / (2 ** 31)
         field_data.units = 'deg'
+
+    # column variants of the above, used by on_process_batch()
+
+    def process_column_field_distance(self, reader, column):
+        for field_data in column:
+            if field_data.value is not None:
+                field_data.value /= 1000.0
+            field_data.units = 'km'
+
+    def process_column_field_speed(self, reader, column):
+        factor = 60.0 * 60.0 / 1000.0
+        for field_data in column:
+            value = field_data.value
+            if value is not None:
+                if isinstance(value, (tuple, list)):
+                    field_data.value = tuple(x * factor for x in value)
+                else:
+                    field_data.value = value * factor
+            field_data.units = 'km/h'
+
+    def process_column_units_semicircles(self, reader, column):
+        factor = 180.0 / (2 ** 31)
+        for field_data in column:
+            if field_data.value is not None:
+                field_data.value *= factor
+            field_data.units = 'deg'
+
+
+def _overrides(cls, method, column_method):
+    # Is the field processor *method* more specialized than its column variant
+    # *column_method*, that is, defined by a derived class?
+    def get_class(method):
+        func = getattr(method, '__func__', None)
+        for klass in cls.__mro__:
+            if func is not None and vars(klass).get(func.__name__) is func:
+                return klass
+        return None
+
+    method_class = get_class(method)
+    column_class = get_class(column_method)
+    if method_class is None or column_class is None:
+        return True
+    return method_class is not column_class and issubclass(
+        method_class, column_class)
+
+
+def _column_wise(method):
+    # Make a column processor out of a field processor
+    def process_column(reader, column):
+        for field_data in column:
+            method(reader, field_data)
+
+    return process_column
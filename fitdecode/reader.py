@@ -1,9 +1,15 @@
 # Copyright (c) Jean-Charles Lefebvre
 # SPDX-License-Identifier: MIT
 
+import datetime
 import enum
 import io
+import mmap
+import os
+import queue
+import selectors
 import struct
+import threading
 import warnings
 
 from . import processors
@@ -13,10 +19,14 @@ from . import types
 from . import utils
 from .exceptions import FitCRCError, FitEOFError, FitHeaderError, FitParseError
 
-__all__ = ['CrcCheck', 'ErrorHandling', 'FitReader']
+__all__ = [
+    'CrcCheck', 'ErrorHandling', 'SkipStrategy', 'WaitStrategy', 'FitReader']
 
 _UNSET = object()
 
+#: Default size of the blocks read from the source stream by `FitReader`
+DEFAULT_BLOCK_SIZE = 64 * 1024
+
 
 class CrcCheck(enum.Enum):
     """
@@ -47,6 +57,33 @@ class CrcCheck(enum.Enum):
     #: Alias of `RAISE` for backward compatibility.
     ENABLED = RAISE
 
+    #: Same as `WARN` except that the CRC of the body of a FIT file is computed
+    #: by a worker thread while `FitReader` keeps decoding. The warning is
+    #: emitted upon reaching the :class:`fitdecode.FitCRC` frame.
+    DEFERRED_WARN = 4
+
+    #: Same as `RAISE` except that the CRC of the body of a FIT file is computed
+    #: by a worker thread while `FitReader` keeps decoding.
+    #: :class:`fitdecode.FitCRCError` is raised upon reaching the
+    #: :class:`fitdecode.FitCRC` frame.
+    DEFERRED_RAISE = 5
+
+
+_CRC_CHECK_WARN = (CrcCheck.WARN, CrcCheck.DEFERRED_WARN)
+_CRC_CHECK_RAISE = (CrcCheck.RAISE, CrcCheck.DEFERRED_RAISE)
+_CRC_CHECK_DEFERRED = (CrcCheck.DEFERRED_WARN, CrcCheck.DEFERRED_RAISE)
+
+# in deferred CRC mode, the amount of consumed bytes from which they are handed
+# to the worker thread without waiting for the next buffer refill
+_DEFERRED_CRC_FEED_SIZE = 8 * 1024
+
+# data messages always decoded by FitReader regardless of *include_mesgs* and
+# *exclude_mesgs* because they alter its internal state
+_ALWAYS_DECODED_MESGS = frozenset((
+    profile.MESG_NUM_FILE_ID,
+    profile.MESG_NUM_DEVELOPER_DATA_ID,
+    profile.MESG_NUM_FIELD_DESCRIPTION))
+
 
 class ErrorHandling(enum.Enum):
     """
@@ -72,6 +109,52 @@ class ErrorHandling(enum.Enum):
     RAISE = 2
 
 
+class SkipStrategy(enum.Enum):
+    """
+    Defines the values expected by the ``skip_strategy`` parameter of
+    `FitReader`'s constructor, that is, how the payload of the data messages
+    filtered-out with *include_mesgs* and *exclude_mesgs* is skipped.
+    """
+
+    #: Default behavior. Payload is read and discarded. CRC is computed and the
+    #: ``timestamp`` field is extracted from the payload.
+    READ = 0
+
+    #: Payload is seeked over with ``seek()`` instead of being read, if it is
+    #: not entirely in the read-ahead buffer already. A payload that is
+    #: buffered already is handled as with `READ` since it costs no I/O. Hence
+    #: the benefit is greater with large messages, or a smaller *block_size*.
+    #:
+    #: This strategy is honored only if *check_crc* is
+    #: `CrcCheck.DISABLED` and if the source stream is seekable. `FitReader`
+    #: falls back to `READ` otherwise (e.g. pipe, socket, stdin).
+    #:
+    #: CAUTION: the ``timestamp`` field of a seeked-over message is not
+    #: extracted (its *compressed timestamp header* is still applied). As a
+    #: result, `FitReader.last_timestamp` is not updated by such messages and
+    #: the time of the subsequent data messages with a *compressed timestamp
+    #: header* may be off. This strategy is meant for messages that hold their
+    #: own ``timestamp`` field (``session``, ``lap``, ``device_info``, ...).
+    SEEK = 1
+
+
+class WaitStrategy(enum.Enum):
+    """
+    Defines the values expected by the ``wait_strategy`` parameter of
+    `FitReader`'s constructor, that is, how to wait for a non-blocking source
+    stream (e.g. pipe, socket) to have data available.
+    """
+
+    #: Default behavior. Wait for the file descriptor of the stream to be
+    #: readable using the `selectors` module, so that reading resumes as soon
+    #: as data is available. Falls back to `SLEEP` if the stream cannot be
+    #: selected (e.g. no ``fileno()`` method, pipe on Windows).
+    SELECT = 0
+
+    #: Sleep for a short while (60 ms) and try to read again.
+    SLEEP = 1
+
+
 class RecordHeader:
     __slots__ = (
         'is_definition', 'is_developer_data', 'local_mesg_num', 'time_offset')
@@ -84,6 +167,200 @@ class RecordHeader:
         self.time_offset = time_offset
 
 
+class _CrcWorker:
+    """
+    Compute a CRC in a separate thread, out of the blocks of data it is fed
+    with, in order.
+    """
+
+    _RESET = object()
+    _RESULT = object()
+    _STOP = object()
+
+    def __init__(self, crc=utils.CRC_START):
+        self._requests = queue.SimpleQueue()
+        self._results = queue.SimpleQueue()
+        self._thread = threading.Thread(
+            target=self._run, args=(crc, ), name='fitdecode-crc', daemon=True)
+        self._thread.start()
+
+    def feed(self, byteslike, start, end):
+        # *byteslike* must not be altered until result() is called
+        self._requests.put((byteslike, start, end))
+
+    def reset(self, crc=utils.CRC_START):
+        self._requests.put((self._RESET, crc))
+
+    def result(self):
+        """Wait for all the blocks fed so far to be processed, return CRC"""
+        self._requests.put(self._RESULT)
+        result = self._results.get()
+        if isinstance(result, BaseException):
+            raise result
+        return result
+
+    def stop(self):
+        self._requests.put(self._STOP)
+        self._thread.join()
+
+    def _run(self, crc):
+        error = None
+
+        while True:
+            request = self._requests.get()
+
+            if request is self._STOP:
+                break
+            elif request is self._RESULT:
+                self._results.put(crc if error is None else error)
+            elif request[0] is self._RESET:
+                crc = request[1]
+                error = None
+            elif error is None:
+                try:
+                    byteslike, start, end = request
+                    crc = utils.compute_crc(
+                        byteslike, crc=crc, start=start, end=end)
+                except Exception as exc:
+                    error = exc
+
+
+class _LazyLayout:
+    """
+    How the fields of the data messages of a `FitDefinitionMessage` are
+    decoded by `_LazyFields`.
+    """
+
+    __slots__ = ('field_defs', 'usages', 'slots', 'eager_slots', 'candidates')
+
+    def __init__(self, def_mesg):
+        #: the field definitions, by slot index
+        self.field_defs = tuple(def_mesg.all_field_defs)
+
+        #: the usage of each slot, by slot index
+        self.usages = def_mesg.decode_plan.usages
+
+        #: the indexes of the slots to decode, plus the one of the compressed
+        #: timestamp (i.e. ``len(field_defs)``)
+        self.slots = []
+
+        #: the indexes of the slots to decode upfront
+        self.eager_slots = []
+
+        #: the indexes of the slots that may hold a field, by field name and
+        #: definition number
+        self.candidates = {}
+
+        fields = def_mesg.mesg_type.fields if def_mesg.mesg_type else {}
+
+        for index, (field_def, usage) in enumerate(
+                zip(self.field_defs, self.usages)):
+            if usage == types.SLOT_SKIPPED:
+                continue
+
+            self.slots.append(index)
+
+            names = {field_def.def_num}
+            accumulated = False
+            main_field = field_def.field
+            if main_field:
+                for field in (main_field, *(main_field.subfields or ())):
+                    names.update((field.def_num, field.name))
+
+                    for component in field.components or ():
+                        accumulated = accumulated or component.accumulate
+                        cmp_field = fields.get(component.def_num)
+                        if cmp_field is None:
+                            continue
+                        for cmp_subfield in (
+                                cmp_field, *(cmp_field.subfields or ())):
+                            names.update(
+                                (cmp_subfield.def_num, cmp_subfield.name))
+
+            # the timestamp field and accumulated components update the state
+            # of the reader
+            if accumulated or field_def.def_num == profile.FIELD_NUM_TIMESTAMP:
+                self.eager_slots.append(index)
+
+            for name in names:
+                self.candidates.setdefault(name, []).append(index)
+
+        # the compressed timestamp, if any
+        index = len(self.field_defs)
+        self.slots.append(index)
+        timestamp_field = profile.FIELD_TYPE_TIMESTAMP
+        for name in (timestamp_field.def_num, timestamp_field.name):
+            self.candidates.setdefault(name, []).append(index)
+
+    def get_slot(self, index, raw_values):
+        """
+        Get the ``(field_def, raw_value, usage)`` slot of index *index*, as
+        expected by ``FitReader._decode_slots()``
+        """
+        return self.field_defs[index], raw_values[index], self.usages[index]
+
+
+class _LazyFields:
+    """
+    Decode the fields of a `FitDataMessage` upon access, slot by slot. See the
+    *lazy_fields* argument of `FitReader`.
+    """
+
+    __slots__ = (
+        '_reader', '_def_mesg', '_layout', '_raw_values', '_slot_fields',
+        '_process', '_field_processors')
+
+    def __init__(self, reader, def_mesg, layout, raw_values, slot_fields,
+                 process, field_processors):
+        self._reader = reader
+        self._def_mesg = def_mesg
+        self._layout = layout
+        self._raw_values = raw_values
+        self._slot_fields = slot_fields  # the decoded fields, by slot index
+        self._process = process
+        self._field_processors = field_processors
+
+    def get_all(self):
+        """Get the `list` of all the fields of the message"""
+        message_fields = []
+        for index in self._layout.slots:
+            message_fields.extend(self._get_slot(index))
+        return message_fields
+
+    def get_named(self, field_name_or_num):
+        """
+        Get the `list` of the fields of the message that may be named
+        *field_name_or_num*, in order, without decoding the other ones
+        """
+        try:
+            indexes = self._layout.candidates[field_name_or_num]
+        except (KeyError, TypeError):
+            return []
+
+        message_fields = []
+        for index in indexes:
+            message_fields.extend(self._get_slot(index))
+        return message_fields
+
+    def _get_slot(self, index):
+        fields = self._slot_fields[index]
+        if fields is None:
+            reader = self._reader
+            layout = self._layout
+
+            fields = []
+            reader._decode_slots(
+                self._def_mesg, (layout.get_slot(index, self._raw_values), ),
+                self._raw_values, fields)
+
+            if self._process:
+                reader._process_fields(self._field_processors, fields)
+
+            self._slot_fields[index] = fields
+
+        return fields
+
+
 class FitReader:
     """
     Parse the content of a FIT stream or storage.
@@ -124,6 +401,15 @@ class FitReader:
       processing entirely. This can speed up things a bit if your intent is only
       to manipulate the file at binary level (i.e. chunks), in which case
       *keep_raw_chunks* must be set to true.
+    * If *batch_size* is set, data messages are processed by runs of at most
+      *batch_size* consecutive data messages that share the same
+      `FitDefinitionMessage`, using the
+      `fitdecode.DataProcessorBase.on_process_batch` method of the data
+      processor, so that it can process fields column by column. A run is
+      processed and yielded once its last data message is decoded. That is,
+      when the next frame has been decoded as well, so the properties of the
+      reader are those of the next frame. Runs are made only while iterating
+      the reader (or feeding a `FitDecoder`), not by `iter_range`.
 
     Raw chunks:
 
@@ -147,12 +433,102 @@ class FitReader:
       context-sensitive data due to its instance being shared with other readers
       and/or by multiple threads (typically `DefaultDataProcessor`).
 
+    Read-ahead:
+
+    * `FitReader` reads the source stream by blocks of *block_size* bytes
+      (`DEFAULT_BLOCK_SIZE` by default) and decodes from its internal buffer.
+    * As a result, a file-like object passed to `FitReader` may have been read
+      further than the last yielded frame. Set *block_size* to ``0`` to disable
+      read-ahead in case the stream must not be consumed past the end of the
+      FIT data (this is slower).
+    * If the source stream is non-blocking (e.g. pipe, socket), *wait_strategy*
+      tells how to wait for data to be available. See `WaitStrategy`.
+
+    Memory mapping:
+
+    * If *use_mmap* is true and the source is either a path or a file-like
+      object that has a ``fileno()`` method, the source file is memory-mapped
+      and decoded in-place instead of being read into an intermediate buffer.
+    * In which case, with *keep_raw_chunks*, the ``bytes`` attribute of
+      `FitChunk` objects is a read-only `memoryview` slice of the mapping
+      instead of a copy of the frame. The mapping stays alive (and the source
+      file mapped) as long as any of those objects is referenced, even once
+      the reader is closed. Use ``bytes(chunk.bytes)`` to get a copy that does
+      not hold the mapping.
+    * `FitReader` silently falls back to regular reads if the source cannot be
+      mapped (e.g. pipe, socket, empty file).
+
+    Messages filtering:
+
+    * *include_mesgs* and *exclude_mesgs* can be iterables of message names
+      (`str`) and/or global message numbers (`int`), as defined in
+      ``profile.MESSAGE_TYPES``.
+    * If *include_mesgs* is specified, only the data messages of the listed
+      types are decoded and yielded. Data messages of the types listed in
+      *exclude_mesgs* are never decoded nor yielded.
+    * The payload of a filtered-out data message is just read past (CRC is
+      still computed), so that its fields are not decoded and data processor is
+      not called. The ``timestamp`` field is still extracted if any, so that
+      the so-called *compressed timestamp headers* of the subsequent messages
+      are decoded properly.
+    * `FitDefinitionMessage` frames are yielded regardless of the filters.
+    * The ``file_id``, ``developer_data_id`` and ``field_description`` data
+      messages are always decoded since `FitReader` depends on them, but they
+      are not yielded if filtered-out.
+
+    Fields projection:
+
+    * *fields* can be a `dict` that maps message names (or global numbers) to
+      an iterable of the field names (or definition numbers) to decode. E.g.
+      ``{'record': ['timestamp', 'heart_rate']}``.
+    * `FitDataMessage` objects of the specified message types only get the
+      requested fields. The other fields are skipped: no `FieldData` object is
+      created, no value is rendered, and data processor is not called for them.
+    * Dependencies are honored. That is, the fields that are required to
+      decode the requested ones are decoded too, but not yielded: the source
+      field of a requested component field, and the reference fields of a
+      requested field that has subfields. A subfield name can be requested, in
+      which case its main field is decoded, but only yielded when it resolves
+      to a requested subfield. Whereas a field requested by its own name is
+      yielded whatever subfield it resolves to.
+    * The ``file_id``, ``developer_data_id`` and ``field_description`` data
+      messages are always decoded in full since `FitReader` depends on them
+      (data processor included), and their unrequested fields are dropped
+      afterwards.
+    * The field names that are not defined in the profile are considered to
+      be the names of developer fields. Developer fields are skipped unless
+      requested.
+
+    Lazy fields:
+
+    * If *lazy_fields* is true, the fields of a `FitDataMessage` are decoded
+      upon access instead: the message keeps the raw values of its fields, and
+      `FieldData` objects are created, their values rendered and the data
+      processor called for them only once they are looked up by name or
+      number (e.g. `FitDataMessage.get_value`), or once the whole
+      `FitDataMessage.fields` list is accessed (e.g. by iterating the message).
+    * This saves time and memory when only a few fields of each message are
+      read.
+    * The ``timestamp`` field and the fields that carry state from a message
+      to another (accumulated components, ``hr`` messages) are always decoded
+      upfront, in order.
+    * As a result, the data processor may be called for the other fields once
+      the reader has moved on, so it should not depend on the state of the
+      reader. `fitdecode.DataProcessorBase.on_process_message` is still called
+      upon decoding.
+    * A `FitDataMessage` that has not been decoded entirely keeps a reference
+      to its `FitReader`.
+
     """
 
     def __init__(
             self, fileish, *, processor=_UNSET, check_crc=CrcCheck.WARN,
             error_handling=ErrorHandling.WARN, keep_raw_chunks=False,
-            data_bag=_UNSET):
+            data_bag=_UNSET, block_size=DEFAULT_BLOCK_SIZE, use_mmap=False,
+            include_mesgs=None, exclude_mesgs=None,
+            skip_strategy=SkipStrategy.READ, fields=None,
+            wait_strategy=WaitStrategy.SELECT, batch_size=None,
+            lazy_fields=False):
         # backward compatibility
         if check_crc is True:
             check_crc = CrcCheck.RAISE
@@ -161,6 +537,11 @@ class FitReader:
 
         assert isinstance(check_crc, CrcCheck)
         assert isinstance(error_handling, ErrorHandling)
+        assert isinstance(block_size, int) and block_size >= 0
+        assert isinstance(skip_strategy, SkipStrategy)
+        assert isinstance(wait_strategy, WaitStrategy)
+        assert batch_size is None or (
+            isinstance(batch_size, int) and batch_size > 0)
 
         # modifiable options (public)
         self.check_crc = check_crc
@@ -177,13 +558,45 @@ class FitReader:
         else:
             self._processor = processor
         self._keep_raw = keep_raw_chunks
+        self._block_size = block_size
+        self._include_mesgs = self._resolve_mesg_nums(include_mesgs)
+        self._exclude_mesgs = \
+            self._resolve_mesg_nums(exclude_mesgs) or frozenset()
+        self._filter_mesgs = (
+            self._include_mesgs is not None or bool(self._exclude_mesgs))
+        self._skip_strategy = skip_strategy
+        self._wait_strategy = wait_strategy
+        self._projections = self._resolve_fields(fields)
+        self._batch_size = batch_size
+        if (not self._processor or
+                not hasattr(self._processor, 'on_process_batch')):
+            self._batch_size = None
+        self._batching = False  # are data messages processed by runs?
+        self._lazy_fields = lazy_fields
+
+        # the _LazyLayout of the data messages of the current definition of
+        # each local message: {local_mesg_num: (def_mesg, _LazyLayout)}
+        self._lazy_layouts = {}
+
+        # the field processors of the data messages of the current definition
+        # of each local message: {local_mesg_num: (def_mesg, {field: callable})}
+        self._field_processors = {}
 
         # per-stream state (private)
         self._fd = None  # the file object to read from
         self._fd_owned = None  # do we own self._fd?
+        self._buffer = b''  # read-ahead buffer
+        self._buffer_pos = 0  # read cursor position in the read-ahead buffer
+        self._mmap = None  # `mmap.mmap` of the source file, if *use_mmap*
+        self._seekable = False  # can SkipStrategy.SEEK be applied to self._fd?
+        self._source_size = None  # the size of self._fd if self._seekable
+        self._selector = None  # `selectors.BaseSelector` of self._fd if non-blocking, reused by every wait  # noqa: E501
         self._read_offset = 0  # read cursor position in the file
         self._read_size = 0  # count bytes read from this file so far in total
         self._fit_file_index = -1  # the index of the current FIT file in this data stream  # noqa: E501
+        self._data_mesg_count = 0  # count data messages read from this data stream so far  # noqa: E501
+        self._seek_target = None  # the (kind, value) target of jump_to(), until it is reached  # noqa: E501
+        self._read_limit = None  # the (end_mesg_index, end_time, end_offset) end of the segment being read, if any  # noqa: E501
 
         # per-chunk state (private)
         self._chunk_index = 0   # the index number of the current chunk that is currently being read  # noqa: E501
@@ -191,7 +604,9 @@ class FitReader:
         self._chunk_size = 0    # the size of the current chunk
 
         # per-FIT-file state (private)
-        self._crc = utils.CRC_START  # current CRC value, updated upon every read, reset on each new "FIT file"  # noqa: E501
+        self._crc = utils.CRC_START  # current CRC value, updated upon every buffer refill and before reading the CRC footer, reset on each new "FIT file"  # noqa: E501
+        self._crc_pos = 0  # position in the read-ahead buffer up to which self._crc has been computed  # noqa: E501
+        self._crc_worker = None  # `_CrcWorker` in case of deferred CRC check
         self._header = None  # `FitHeader` of the **current** "FIT file"
         self._current_file_id = None  # current file_id `FitDataMessage` object
         self._body_bytes_left = 0  # the number of bytes that are still to read before reaching the CRC footer of the current "FIT file"  # noqa: E501
@@ -218,8 +633,25 @@ class FitReader:
         except (AttributeError, OSError):
             pass
 
+        if use_mmap:
+            self._map_source()
+
+        if skip_strategy is SkipStrategy.SEEK and self._mmap is None:
+            try:
+                if self._fd.seekable():
+                    self._source_size = self._fd.seek(0, io.SEEK_END)
+                    self._fd.seek(self._read_offset, io.SEEK_SET)
+                    self._seekable = True
+            except (AttributeError, OSError, ValueError):
+                pass
+
+        if wait_strategy is WaitStrategy.SELECT and self._mmap is None:
+            self._selector = self._make_selector()
+
     def __del__(self):
-        self.close()
+        # __init__ may have raised before the state was initialized
+        if hasattr(self, '_fd'):
+            self.close()
 
     def __enter__(self):
         return self
@@ -228,7 +660,10 @@ class FitReader:
         return self.close()
 
     def __iter__(self):
-        yield from self._read_next()
+        if self._batch_size is None:
+            yield from self._read_next()
+        else:
+            yield from self._process_batches(self._read_next())
 
     @property
     def processor(self):
@@ -308,18 +743,46 @@ class FitReader:
         Close the internal file handle if it is owned by this object, and clear
         the internal state.
         """
+        if self._crc_worker is not None:
+            # must be stopped before the buffer it may be reading gets released
+            self._crc_worker.stop()
+            self._crc_worker = None
+
+        if self._mmap is not None:
+            if isinstance(self._buffer, memoryview):
+                self._buffer.release()
+            try:
+                self._mmap.close()
+            except BufferError:
+                # some kept chunks still refer to the mapping, which will be
+                # closed once they all get garbage collected
+                pass
+            self._mmap = None
+
+        if self._selector is not None:
+            self._selector.close()
+            self._selector = None
+
         if self._fd is not None and self._fd_owned and hasattr(self._fd, 'close'):
             self._fd.close()
 
         self._fd = None
         self._fd_owned = None
+        self._buffer = b''
+        self._buffer_pos = 0
+        self._seekable = False
+        self._source_size = None
         self._read_offset = 0
         self._read_size = 0
         self._fit_file_index = -1
+        self._data_mesg_count = 0
+        self._seek_target = None
+        self._read_limit = None
         self._chunk_index = 0
         self._chunk_offset = 0
         self._chunk_size = 0
         self._crc = utils.CRC_START
+        self._crc_pos = 0
         self._header = None
         self._current_file_id = None
         self._body_bytes_left = 0
@@ -330,19 +793,133 @@ class FitReader:
         self._last_timestamp = 0
         self._hr_start_timestamp = 0
 
-    # ONLY PRIVATE METHODS BELOW ***********************************************
+    def jump_to(self, index, *, mesg_index=None, timestamp=None):
+        """
+        Move the reader to a particular data message, using *index*, a
+        `fitdecode.FitIndex` object built from the same source.
 
-    def _read_next(self):
+        Either *mesg_index* or *timestamp* must be specified:
+
+        * *mesg_index* is the zero-based index of the data message in the whole
+          data stream (i.e. chained FIT files included)
+        * *timestamp* is either a timezone-aware `datetime.datetime` object, or
+          a raw FIT ``date_time`` value (`int`). In which case the target is
+          the first data message which time is equal to or greater than
+          *timestamp*.
+
+        The state of the reader (definition messages, developer types,
+        accumulators and time) is restored from the closest checkpoint of
+        *index* that precedes the target. The frames that sit between this
+        checkpoint and the target are decoded but not yielded, so that the next
+        iteration of the reader starts with the target data message.
+
+        The source must be seekable. Note that `file_id` is `None` after a
+        jump, and that ``on_header`` is not called on the data processor.
+
+        Usage::
+
+            index = fitdecode.FitIndex.load_or_build('file.fit')
+
+            with fitdecode.FitReader('file.fit') as fit:
+                fit.jump_to(index, mesg_index=100_000)
+                for frame in fit:
+                    ...
+        """
+        if (mesg_index is None) == (timestamp is None):
+            raise ValueError('either mesg_index or timestamp must be specified')
+
+        if self._fd is None:
+            raise ValueError('reader is closed')
+
+        if mesg_index is not None:
+            checkpoint = index.find_mesg_index(mesg_index)
+            seek_target = ('mesg_index', mesg_index)
+        else:
+            timestamp = self._to_fit_time(timestamp)
+            checkpoint = index.find_timestamp(timestamp)
+            seek_target = ('timestamp', timestamp)
+
+        if checkpoint is None:
+            raise ValueError('index is empty')
+
+        self._restore_checkpoint(index, checkpoint)
+        self._seek_target = seek_target
+
+    def iter_range(self, index, start, end=None):
+        """
+        Yield the `FitDataMessage` frames which time is within the range
+        [*start*, *end*), using *index*, a `fitdecode.FitIndex` object built
+        from the same source.
+
+        *start* and *end* are either timezone-aware `datetime.datetime`
+        objects, or raw FIT ``date_time`` values (`int`). *end* can be `None`
+        to read until the end of the data stream.
+
+        The time of a data message is the value of its ``timestamp`` field, or
+        the one given by its *compressed timestamp header*, or the time of the
+        previous data message if it has neither.
+
+        Only the parts of the data stream that *index* tells to contain data
+        messages of the range are decoded, from the checkpoints returned by
+        `fitdecode.FitIndex.find_time_range`. So the data messages are not
+        required to be sorted by time (e.g. summary messages written first),
+        although sorted ones are sliced faster.
 
-        def _update_state():
-            if self._fd is not None:
-                self._chunk_index += 1
-                self._chunk_offset += self._chunk_size
-                self._chunk_size = 0
+        `iter_range` can be called any number of times on the same reader,
+        which must not be iterated otherwise in the meantime.
 
+        Usage::
+
+            index = fitdecode.FitIndex.load_or_build('file.fit')
+
+            with fitdecode.FitReader('file.fit') as fit:
+                for data_message in fit.iter_range(index, start, end):
+                    ...
+        """
+        if self._fd is None:
+            raise ValueError('reader is closed')
+
+        start = self._to_fit_time(start)
+        if end is not None:
+            end = self._to_fit_time(end)
+
+        checkpoints = index.checkpoints
+        for pos in index.find_time_range(start, end):
+            checkpoint = checkpoints[pos]
+            if pos + 1 < len(checkpoints):
+                end_mesg_index = checkpoints[pos + 1].mesg_index
+            else:
+                end_mesg_index = None
+
+            self._restore_checkpoint(index, checkpoint)
+            self._seek_target = None
+
+            # the limit is checked by _read_next() before every frame, so
+            # that filtered-out data messages do not make the reader go past
+            # the segment
+            self._read_limit = (
+                end_mesg_index, end if checkpoint.time_ordered else None, None)
+            try:
+                for frame in self._read_next():
+                    if frame.frame_type != records.FIT_FRAME_DATA:
+                        continue
+
+                    timestamp = self._compressed_ts_accumulator
+                    if timestamp >= start and (end is None or timestamp < end):
+                        yield frame
+            finally:
+                self._read_limit = None
+
+    # ONLY PRIVATE METHODS BELOW ***********************************************
+
+    def _read_next(self):
         while self._fd is not None:
             assert self._chunk_size == 0
 
+            if (self._read_limit is not None and
+                    self._is_read_limit_reached()):
+                break
+
             if self._header is None:
                 assert self._body_bytes_left == 0
 
@@ -353,23 +930,41 @@ class FitReader:
 
                 self._fit_file_index += 1
 
-                yield self._header
-                _update_state()
+                if self._seek_target is None:
+                    yield self._header
+                self._next_chunk()
 
             elif self._body_bytes_left > 0:
                 assert self._header is not None
 
+                data_mesg_count = self._data_mesg_count
                 record = self._read_record()
 
-                assert isinstance(record, (
+                assert record is None or isinstance(record, (
                     records.FitDefinitionMessage,
                     records.FitDataMessage))
 
                 assert self._chunk_size <= self._body_bytes_left
                 self._body_bytes_left -= self._chunk_size
 
-                yield record
-                _update_state()
+                if (self.check_crc in _CRC_CHECK_DEFERRED and
+                        self._buffer_pos - self._crc_pos >=
+                        _DEFERRED_CRC_FEED_SIZE):
+                    self._update_crc()
+
+                # frames are not yielded until the target of jump_to() is
+                # reached
+                if self._seek_target is not None:
+                    if (self._data_mesg_count == data_mesg_count or
+                            not self._is_seek_target_reached()):
+                        record = None
+                    else:
+                        self._seek_target = None
+
+                # record is None if it has been filtered-out
+                if record is not None:
+                    yield record
+                self._next_chunk()
 
             else:
                 assert self._header is not None
@@ -385,8 +980,9 @@ class FitReader:
                     #     break
                     raise
 
-                yield crc_obj
-                _update_state()
+                if self._seek_target is None:
+                    yield crc_obj
+                self._next_chunk()
 
                 # We've reached the end of this FIT file... To avoid incorrect
                 # behavior due to malformed FIT stream (i.e. next FIT header
@@ -394,9 +990,19 @@ class FitReader:
                 # resetting it only when a FIT header is read.
                 self._reset_per_fit_state()
 
+    def _next_chunk(self):
+        # update per-chunk state once a chunk has been read entirely
+        if self._fd is not None:
+            self._chunk_index += 1
+            self._chunk_offset += self._chunk_size
+            self._chunk_size = 0
+
     def _reset_per_fit_state(self):
         # reset per-FIT-file state
         self._crc = utils.CRC_START
+        self._crc_pos = self._buffer_pos
+        if self._crc_worker is not None:
+            self._crc_worker.reset()
         self._header = None
         self._current_file_id = None
         self._body_bytes_left = 0
@@ -407,6 +1013,84 @@ class FitReader:
         self._last_timestamp = 0
         self._hr_start_timestamp = 0
 
+    @staticmethod
+    def _to_fit_time(value):
+        # convert a datetime object to a raw FIT date_time value
+        if isinstance(value, datetime.datetime):
+            return value.timestamp() - processors.FIT_UTC_REFERENCE
+        return value
+
+    def _is_seek_target_reached(self):
+        kind, value = self._seek_target
+        if kind == 'mesg_index':
+            return self._data_mesg_count > value
+        return self._compressed_ts_accumulator >= value
+
+    def _is_read_limit_reached(self):
+        # has the end of the segment being read been reached? Checked before
+        # every frame, so that filtered-out data messages count as well
+        end_mesg_index, end_time, end_offset = self._read_limit
+        if (end_mesg_index is not None and
+                self._data_mesg_count >= end_mesg_index):
+            return True
+        if end_offset is not None and self._chunk_offset >= end_offset:
+            return True
+        return (
+            end_time is not None and
+            self._compressed_ts_accumulator >= end_time)
+
+    def _restore_checkpoint(self, index, checkpoint):
+        fit_file = index.files[checkpoint.file_index]
+
+        self._reset_per_fit_state()
+        self._fit_file_index = checkpoint.file_index
+        self._data_mesg_count = checkpoint.mesg_index
+        self._header = records.FitHeader(
+            header_size=fit_file.header_size,
+            proto_ver=fit_file.proto_ver,
+            profile_ver=fit_file.profile_ver,
+            body_size=fit_file.body_size,
+            crc=fit_file.crc,
+            crc_matched=fit_file.crc_matched,
+            chunk=None)
+
+        # developer types must be known before definition messages are read
+        for dev_data_index, application_id, dev_fields in checkpoint.dev_types:
+            self._add_dev_data_id_impl(dev_data_index, application_id)
+            for field_def_num, base_type_num, name, units, native_field_num \
+                    in dev_fields:
+                self._add_dev_field_description_impl(
+                    dev_data_index, field_def_num,
+                    types.BASE_TYPES.get(base_type_num, types.BASE_TYPE_BYTE),
+                    name, units, native_field_num)
+
+        # the active definition messages are read again from the source, in
+        # the order of the source so that they are mostly read from the
+        # read-ahead buffer (there is one per local message number, so order
+        # does not matter otherwise)
+        for offset in sorted(checkpoint.definitions):
+            self._seek_source(offset)
+            if not isinstance(
+                    self._read_record(), records.FitDefinitionMessage):
+                raise FitParseError(
+                    offset, 'definition message expected (wrong index?)')
+
+        # accumulators are restored last since reading a definition message
+        # resets them
+        self._accumulators = {
+            global_mesg_num: dict(values)
+            for global_mesg_num, values in checkpoint.accumulators}
+        self._compressed_ts_accumulator = checkpoint.compressed_ts_accumulator
+        self._last_timestamp = checkpoint.last_timestamp
+        self._hr_start_timestamp = checkpoint.hr_start_timestamp
+
+        self._seek_source(checkpoint.offset)
+        self._chunk_index = checkpoint.chunk_index
+        self._body_bytes_left = checkpoint.body_bytes_left
+        self._crc = checkpoint.crc
+        if self._crc_worker is not None:
+            self._crc_worker.reset(checkpoint.crc)
+
     def _read_header(self):
         try:
             chunk, header_size, proto_ver, profile_ver, body_size, \
@@ -448,18 +1132,18 @@ class FitReader:
                 crc_matched = computed_crc == read_crc
 
                 if not crc_matched and (
-                        self.check_crc is CrcCheck.WARN or
-                        self.check_crc is CrcCheck.RAISE):
+                        self.check_crc in _CRC_CHECK_WARN or
+                        self.check_crc in _CRC_CHECK_RAISE):
                     msg = (
                         f'mismatching CRC in FIT header '
                         f'(header offset: {self._chunk_offset})')
 
-                    if self.check_crc is CrcCheck.RAISE:
+                    if self.check_crc in _CRC_CHECK_RAISE:
                         raise FitCRCError(msg)
-                    elif self.check_crc is CrcCheck.WARN:
+                    elif self.check_crc in _CRC_CHECK_WARN:
                         warnings.warn(msg)
 
-            chunk += extra_chunk
+            chunk = (chunk, extra_chunk)
 
         proto_ver = (proto_ver >> 4, proto_ver & ((1 << 4) - 1))
         profile_ver = (int(profile_ver / 100), int(profile_ver % 100))
@@ -479,21 +1163,24 @@ class FitReader:
             self._processor.on_header(self, self._header)
 
     def _read_crc(self):
+        self._update_crc()
+        if self._crc_worker is not None:
+            self._crc = self._crc_worker.result()
         computed_crc = self._crc
         chunk, read_crc = self._read_struct('<H')
 
         if computed_crc != read_crc and (
-                self.check_crc is CrcCheck.WARN or
-                self.check_crc is CrcCheck.RAISE):
+                self.check_crc in _CRC_CHECK_WARN or
+                self.check_crc in _CRC_CHECK_RAISE):
             msg = (
                 f'mismatching CRC in FIT footer '
                 f'(footer offset: {self._chunk_offset}; '
                 f'read crc: {read_crc}; '
                 f'expected crc: {computed_crc})')
 
-            if self.check_crc is CrcCheck.RAISE:
+            if self.check_crc in _CRC_CHECK_RAISE:
                 raise FitCRCError(msg)
-            elif self.check_crc is CrcCheck.WARN:
+            elif self.check_crc in _CRC_CHECK_WARN:
                 warnings.warn(msg)
 
         crc_obj = records.FitCRC(
@@ -501,7 +1188,9 @@ class FitReader:
             computed_crc == read_crc,
             self._keep_chunk(chunk))
 
-        if self._processor:
+        # in batch mode, on_crc is called once the last run of data messages
+        # has been processed
+        if self._processor and not self._batching:
             self._processor.on_crc(self, crc_obj)
 
         return crc_obj
@@ -526,16 +1215,53 @@ class FitReader:
         if record_header.is_definition:
             message = self._read_definition_message(chunk, record_header)
         else:
+            self._data_mesg_count += 1
             message = self._read_data_message(chunk, record_header)
 
-            if message.mesg_type is not None:
+            if message is not None and message.mesg_type is not None:
                 if message.mesg_type.mesg_num == profile.MESG_NUM_DEVELOPER_DATA_ID:
                     self._add_dev_data_id(message)
                 elif message.mesg_type.mesg_num == profile.MESG_NUM_FIELD_DESCRIPTION:
                     self._add_dev_field_description(message)
 
+            if (self._filter_mesgs and message is not None and
+                    self._is_mesg_filtered_out(message.global_mesg_num)):
+                message = None
+
+            if (self._projections and message is not None and
+                    message.global_mesg_num in _ALWAYS_DECODED_MESGS and
+                    message.global_mesg_num in self._projections):
+                self._project_fields(message)
+
         return message
 
+    def _project_fields(self, message):
+        # Drop the fields that are not requested from a data message that has
+        # been decoded in full, like the projected decode plans would have
+        field_nums, dev_field_names, subfield_names = \
+            self._projections[message.global_mesg_num]
+
+        fields = []
+        for field_data in message.fields:
+            if field_data.field_def is not None and field_data.field_def.is_dev:
+                if field_data.name in dev_field_names:
+                    fields.append(field_data)
+                continue
+
+            field = field_data.field
+            if field is None:
+                field_num = field_data.field_def.def_num
+            else:
+                field_num = field.def_num
+
+            if field_num in field_nums and (
+                    field_num not in subfield_names or
+                    (field is not None and
+                     field.name in subfield_names[field_num])):
+                fields.append(field_data)
+
+        message.fields = fields
+
     def _read_definition_message(self, header_chunk, record_header):
         record_chunks = [header_chunk]
 
@@ -553,13 +1279,15 @@ class FitReader:
         field_defs = []
         dev_field_defs = []
 
-        # read field definitions
-        for _ in range(num_fields):
-            extra_chunk = self._read_bytes(field_unpacker.size)
+        # read field definitions all at once
+        if num_fields:
+            extra_chunk = self._read_bytes(num_fields * field_unpacker.size)
             record_chunks.append(extra_chunk)
+            unpacked_field_defs = field_unpacker.iter_unpack(extra_chunk)
+        else:
+            unpacked_field_defs = ()
 
-            field_def_num, field_size, base_type_num = \
-                field_unpacker.unpack(extra_chunk)
+        for field_def_num, field_size, base_type_num in unpacked_field_defs:
 
             field = mesg_type.fields.get(field_def_num) if mesg_type else None
             base_type = types.BASE_TYPES.get(
@@ -605,13 +1333,17 @@ class FitReader:
             record_chunks.append(extra_chunk)
             num_dev_fields = extra_chunk[0]
 
-            # read field definitions
-            for _ in range(num_dev_fields):
-                extra_chunk = self._read_bytes(field_unpacker.size)
+            # read field definitions all at once
+            if num_dev_fields:
+                extra_chunk = self._read_bytes(
+                    num_dev_fields * field_unpacker.size)
                 record_chunks.append(extra_chunk)
+                unpacked_field_defs = field_unpacker.iter_unpack(extra_chunk)
+            else:
+                unpacked_field_defs = ()
 
-                field_def_num, field_size, dev_data_index = \
-                    field_unpacker.unpack(extra_chunk)
+            for field_def_num, field_size, dev_data_index in \
+                    unpacked_field_defs:
 
                 field = self._get_dev_type(
                     record_header.local_mesg_num, global_mesg_num,
@@ -620,6 +1352,9 @@ class FitReader:
                 dev_field_defs.append(types.DevFieldDefinition(
                     field, dev_data_index, field_def_num, field_size))
 
+        decode_plan = self._make_decode_plan(
+            mesg_type, global_mesg_num, endian, field_defs + dev_field_defs)
+
         def_mesg = records.FitDefinitionMessage(
             record_header.is_developer_data,
             record_header.local_mesg_num,
@@ -629,7 +1364,8 @@ class FitReader:
             endian,
             field_defs,
             dev_field_defs,
-            self._keep_chunk(record_chunks))
+            self._keep_chunk(record_chunks),
+            decode_plan=decode_plan)
 
         # According to FIT protocol's specification (section 4.8.3), it is ok to
         # redefine message types
@@ -647,11 +1383,228 @@ class FitReader:
                 self._chunk_offset,
                 f'local message {record_header.local_mesg_num} not defined')
 
+        if (self._filter_mesgs and
+                def_mesg.global_mesg_num not in _ALWAYS_DECODED_MESGS and
+                self._is_mesg_filtered_out(def_mesg.global_mesg_num)):
+            # the payload is seeked over only if it is not entirely buffered,
+            # otherwise reading it costs nothing and its timestamp is extracted
+            if (self._skip_strategy is SkipStrategy.SEEK and
+                    self.check_crc is CrcCheck.DISABLED and
+                    self._seekable and
+                    def_mesg.decode_plan.size >
+                    len(self._buffer) - self._buffer_pos):
+                self._skip_bytes(def_mesg.decode_plan.size)
+                if record_header.time_offset is not None:
+                    self._compressed_ts_accumulator = \
+                        self._apply_compressed_accumulation(
+                            record_header.time_offset,
+                            self._compressed_ts_accumulator, 5)
+            else:
+                self._skip_data_message(def_mesg, record_header)
+            return None
+
         extra_chunks, raw_values = self._read_data_message_raw_values(def_mesg)
         record_chunks.extend(extra_chunks)
         message_fields = []
 
-        for field_def, raw_value in zip(def_mesg.all_field_defs, raw_values):
+        # not None in case fields are projected
+        field_nums = def_mesg.decode_plan.field_nums
+
+        if self._lazy_fields:
+            layout = self._get_lazy_layout(def_mesg)
+        else:
+            layout = None
+
+        if layout is None:
+            message_fields = []
+            self._decode_slots(
+                def_mesg,
+                zip(def_mesg.all_field_defs, raw_values,
+                    def_mesg.decode_plan.usages),
+                raw_values, message_fields)
+        else:
+            # only the slots that alter the state of the reader are decoded
+            # now. The last item of slot_fields gets the compressed timestamp
+            # field, if any.
+            slot_fields = [None] * (len(layout.field_defs) + 1)
+            message_fields = slot_fields[-1] = []
+            for index in layout.eager_slots:
+                slot_fields[index] = fields = []
+                self._decode_slots(
+                    def_mesg, (layout.get_slot(index, raw_values), ),
+                    raw_values, fields)
+
+        # apply timestamp field if we got a header
+        if record_header.time_offset is not None:
+            ts_value = self._apply_compressed_accumulation(
+                record_header.time_offset, self._compressed_ts_accumulator, 5)
+
+            self._compressed_ts_accumulator = ts_value
+
+        if record_header.time_offset is not None and (
+                field_nums is None or
+                profile.FIELD_NUM_TIMESTAMP in field_nums):
+            message_fields.append(types.FieldData(
+                None,                                           # field_def
+                profile.FIELD_TYPE_TIMESTAMP,                   # field
+                None,                                           # parent_field
+                profile.FIELD_TYPE_TIMESTAMP.render(ts_value),  # value
+                ts_value))                                      # raw_value
+
+        # apply data processors
+        process = bool(self._processor) and not self._batching
+        if process:
+            field_processors = self._get_field_processors(def_mesg)
+        else:
+            field_processors = None
+
+        if layout is None:
+            if process:
+                self._process_fields(field_processors, message_fields)
+            lazy_fields = None
+        else:
+            if process:
+                for fields in slot_fields:
+                    if fields:
+                        self._process_fields(field_processors, fields)
+            message_fields = None
+            lazy_fields = _LazyFields(
+                self, def_mesg, layout, raw_values, slot_fields, process,
+                field_processors)
+
+        data_message = records.FitDataMessage(
+            record_header.is_developer_data,
+            record_header.local_mesg_num,
+            record_header.time_offset,
+            def_mesg,
+            message_fields,
+            self._keep_chunk(record_chunks),
+            lazy_fields=lazy_fields)
+
+        if self._processor and not self._batching:
+            self._processor.on_process_message(self, data_message)
+
+        # keep track of the last file_id message
+        if def_mesg.global_mesg_num == profile.MESG_NUM_FILE_ID:
+            self._current_file_id = data_message
+
+        return data_message
+
+    def _process_batches(self, frames):
+        # Yield *frames* once the data messages among them have been processed
+        # by runs of consecutive data messages that share their definition
+        processor = self._processor
+        batch_size = self._batch_size
+        run = []
+        error = None
+
+        self._batching = True
+        try:
+            frames = iter(frames)
+            while True:
+                try:
+                    frame = next(frames)
+                except StopIteration:
+                    frame = None
+                except Exception as exc:
+                    # the frames decoded before the error come first
+                    frame = None
+                    error = exc
+
+                if (frame is not None and
+                        frame.frame_type == records.FIT_FRAME_DATA and
+                        (not run or (
+                            frame.def_mesg is run[0].def_mesg and
+                            len(run) < batch_size))):
+                    run.append(frame)
+                    continue
+
+                if run:
+                    processor.on_process_batch(self, run[0].def_mesg, run)
+                    yield from run
+                    run = []
+
+                if error is not None:
+                    raise error
+
+                if frame is None:
+                    break
+
+                if frame.frame_type == records.FIT_FRAME_DATA:
+                    run.append(frame)
+                    continue
+
+                if frame.frame_type == records.FIT_FRAME_CRC:
+                    processor.on_crc(self, frame)
+
+                yield frame
+        finally:
+            self._batching = False
+
+    def _get_field_processors(self, def_mesg):
+        # Get the {field: callable} dict of the field processors of the data
+        # messages of *def_mesg*, or None if the processor cannot compile them.
+        # Field processors are compiled once per definition message, and per
+        # profile field since the fields of a slot may vary (subfields).
+        if getattr(self._processor, 'get_field_processor', None) is None:
+            return None
+
+        entry = self._field_processors.get(def_mesg.local_mesg_num)
+        if entry is None or entry[0] is not def_mesg:
+            entry = (def_mesg, {})
+            self._field_processors[def_mesg.local_mesg_num] = entry
+
+        return entry[1]
+
+    def _process_fields(self, field_processors, message_fields):
+        # *field_processors* is the value returned by _get_field_processors()
+        processor = self._processor
+
+        if field_processors is None:
+            for field_data in message_fields:
+                processor.on_process_type(self, field_data)
+                processor.on_process_field(self, field_data)
+                processor.on_process_unit(self, field_data)
+            return
+
+        for field_data in message_fields:
+            key = field_data.field or field_data.field_def
+            try:
+                process = field_processors[key]
+            except KeyError:
+                process = processor.get_field_processor(field_data)
+                field_processors[key] = process
+
+            if process is not None:
+                process(self, field_data)
+
+    def _get_lazy_layout(self, def_mesg):
+        # Get the _LazyLayout of the data messages of *def_mesg*, or None if
+        # their fields cannot be decoded lazily
+        entry = self._lazy_layouts.get(def_mesg.local_mesg_num)
+        if entry is None or entry[0] is not def_mesg:
+            layout = None
+            # the fields of hr messages depend on each other's decoding
+            if def_mesg.global_mesg_num != profile.MESG_NUM_HR:
+                layout = _LazyLayout(def_mesg)
+            entry = (def_mesg, layout)
+            self._lazy_layouts[def_mesg.local_mesg_num] = entry
+
+        return entry[1]
+
+    def _decode_slots(self, def_mesg, slots, raw_values, message_fields):
+        # Append to *message_fields* the FieldData objects of *slots*, an
+        # iterable of the (field_def, raw_value, usage) slots of the decode
+        # plan: their component fields if any, then their own field unless it
+        # is only decoded
+
+        # not None in case fields are projected
+        field_nums = def_mesg.decode_plan.field_nums
+        subfield_names = def_mesg.decode_plan.subfield_names
+
+        for field_def, raw_value, usage in slots:
+            if usage == types.SLOT_SKIPPED:
+                continue
 
             field, parent_field = field_def.field, None
             if field:
@@ -685,6 +1638,10 @@ class FitReader:
 
                             accumulator[component.def_num] = cmp_raw_value
 
+                        if (field_nums is not None and
+                                component.def_num not in field_nums):
+                            continue
+
                         # apply scale and offset from component, not from the
                         # dynamic field as they may differ
                         cmp_raw_value = self._apply_scale_offset(
@@ -696,6 +1653,11 @@ class FitReader:
                         # resolve a possible subfield
                         cmp_field, cmp_parent_field = self._resolve_subfield(
                             cmp_field, def_mesg, raw_values)
+                        if (subfield_names and
+                                component.def_num in subfield_names and
+                                cmp_field.name not in
+                                subfield_names[component.def_num]):
+                            continue
                         cmp_value = cmp_field.render(cmp_raw_value)
 
                         # special case: hr.event_timestamp_12
@@ -729,6 +1691,17 @@ class FitReader:
                 # assert self._last_timestamp > 0
                 self._hr_start_timestamp = self._last_timestamp
 
+            if usage != types.SLOT_EMITTED:
+                continue
+
+            # a field requested by the names of its subfields only
+            if (subfield_names and
+                    not field_def.is_dev and
+                    field_def.def_num in subfield_names and
+                    (not field or
+                     field.name not in subfield_names[field_def.def_num])):
+                continue
+
             message_fields.append(types.FieldData(
                 field_def,      # field_def
                 field,          # field
@@ -736,78 +1709,205 @@ class FitReader:
                 decoded_value,  # value
                 raw_value))     # raw_value
 
-        # apply timestamp field if we got a header
+    def _skip_data_message(self, def_mesg, record_header):
+        # Read past the payload of a filtered-out data message. Its decode plan
+        # only extracts its timestamp field(s) so to keep track of time.
+        _, raw_values = self._read_data_message_raw_values(def_mesg)
+
+        for slot in def_mesg.decode_plan.slots:
+            raw_value = raw_values[slot[0]]
+            if raw_value is None:
+                continue
+
+            if slot[0] < len(def_mesg.field_defs):
+                field = def_mesg.field_defs[slot[0]].field
+            else:
+                field = def_mesg.dev_field_defs[
+                    slot[0] - len(def_mesg.field_defs)].field
+
+            if field:
+                self._last_timestamp = self._apply_scale_offset(
+                    field, field.render(raw_value))
+            else:
+                self._last_timestamp = raw_value
+            self._compressed_ts_accumulator = raw_value
+
         if record_header.time_offset is not None:
-            ts_value = self._apply_compressed_accumulation(
-                record_header.time_offset, self._compressed_ts_accumulator, 5)
+            self._compressed_ts_accumulator = \
+                self._apply_compressed_accumulation(
+                    record_header.time_offset,
+                    self._compressed_ts_accumulator, 5)
+
+    def _is_mesg_filtered_out(self, global_mesg_num):
+        if (self._include_mesgs is not None and
+                global_mesg_num not in self._include_mesgs):
+            return True
+        return global_mesg_num in self._exclude_mesgs
+
+    def _make_decode_plan(
+            self, mesg_type, global_mesg_num, endian, all_field_defs):
+        # Return the `types.DecodePlan` of a definition message, or None to
+        # let `records.FitDefinitionMessage` build the default one, that
+        # decodes and emits every field
+        if (self._filter_mesgs and
+                global_mesg_num not in _ALWAYS_DECODED_MESGS and
+                self._is_mesg_filtered_out(global_mesg_num)):
+            # only the timestamp field is needed from this kind of message
+            return types.DecodePlan(
+                endian, all_field_defs,
+                only=(
+                    idx for idx, field_def in enumerate(all_field_defs)
+                    if field_def.def_num == profile.FIELD_NUM_TIMESTAMP))
+
+        # the messages the reader depends on are decoded in full, their fields
+        # are projected once the message is read (see _read_record())
+        if (self._projections and
+                global_mesg_num in self._projections and
+                global_mesg_num not in _ALWAYS_DECODED_MESGS):
+            return self._make_projected_decode_plan(
+                mesg_type, global_mesg_num, endian, all_field_defs)
+
+        return None
+
+    def _make_projected_decode_plan(
+            self, mesg_type, global_mesg_num, endian, all_field_defs):
+        field_nums, dev_field_names, subfield_names = \
+            self._projections[global_mesg_num]
+
+        # the definition numbers of the fields to decode: the requested ones,
+        # plus the ones needed to keep track of time, plus dependencies
+        needed_nums = set(field_nums)
+        needed_nums.add(profile.FIELD_NUM_TIMESTAMP)
+        if global_mesg_num == profile.MESG_NUM_HR:
+            needed_nums.add(profile.FIELD_NUM_HR_EVENT_TIMESTAMP)
+
+        if mesg_type is not None:
+            # source fields of the requested component fields
+            for field in mesg_type.fields.values():
+                components = list(field.components or ())
+                for sub_field in field.subfields or ():
+                    components.extend(sub_field.components or ())
+
+                for component in components:
+                    if component.def_num in field_nums:
+                        needed_nums.add(field.def_num)
+                        break
+
+            # reference fields of the subfields of the fields to decode
+            for field_num in tuple(needed_nums):
+                field = mesg_type.fields.get(field_num)
+                if field is not None and field.subfields:
+                    for sub_field in field.subfields:
+                        for ref_field in sub_field.ref_fields:
+                            needed_nums.add(ref_field.def_num)
+
+        only = []
+        emit = []
+        for idx, field_def in enumerate(all_field_defs):
+            if field_def.is_dev:
+                if field_def.name in dev_field_names:
+                    only.append(idx)
+                    emit.append(idx)
+            elif field_def.def_num in needed_nums:
+                only.append(idx)
+                if field_def.def_num in field_nums:
+                    emit.append(idx)
+
+        return types.DecodePlan(
+            endian, all_field_defs, only=only, emit=emit,
+            field_nums=field_nums, subfield_names=subfield_names)
 
-            self._compressed_ts_accumulator = ts_value
+    @staticmethod
+    def _resolve_fields(fields):
+        # convert the *fields* argument to a {global_mesg_num: (field_nums,
+        # dev_field_names, subfield_names)} dict, where *subfield_names* maps
+        # the numbers of the fields only requested by the names of some of
+        # their subfields, to these names
+        if not fields:
+            return None
 
-            message_fields.append(types.FieldData(
-                None,                                           # field_def
-                profile.FIELD_TYPE_TIMESTAMP,                   # field
-                None,                                           # parent_field
-                profile.FIELD_TYPE_TIMESTAMP.render(ts_value),  # value
-                ts_value))                                      # raw_value
+        projections = {}
+        for mesg, field_names in fields.items():
+            try:
+                mesg_type = utils.get_mesg_type(mesg)
+                global_mesg_num = mesg_type.mesg_num
+            except ValueError:
+                if not isinstance(mesg, int) or isinstance(mesg, bool):
+                    raise
+                mesg_type = None
+                global_mesg_num = mesg
+
+            if isinstance(field_names, (str, int)):
+                field_names = (field_names, )
+
+            field_nums = set()
+            dev_field_names = set()
+            subfield_names = {}
+            for field_name in field_names:
+                if isinstance(field_name, int) and not isinstance(field_name, bool):
+                    field_nums.add(field_name)
+                    continue
+
+                field = None
+                if mesg_type is not None:
+                    try:
+                        field = utils.get_mesg_field(
+                            mesg_type.mesg_num, field_name, subfields=True)
+                    except ValueError:
+                        pass
+
+                if field is None:
+                    dev_field_names.add(field_name)
+                elif field.name != field_name:
+                    # the name of a subfield
+                    subfield_names.setdefault(field.def_num, set()).add(
+                        field_name)
+                else:
+                    field_nums.add(field.def_num)
 
-        # apply data processors
-        if self._processor:
-            for field_data in message_fields:
-                self._processor.on_process_type(self, field_data)
-                self._processor.on_process_field(self, field_data)
-                self._processor.on_process_unit(self, field_data)
+            # a field requested by its own name is emitted whatever it resolves
+            # to
+            subfield_names = {
+                field_num: frozenset(names)
+                for field_num, names in subfield_names.items()
+                if field_num not in field_nums}
+            field_nums.update(subfield_names)
 
-        data_message = records.FitDataMessage(
-            record_header.is_developer_data,
-            record_header.local_mesg_num,
-            record_header.time_offset,
-            def_mesg,
-            message_fields,
-            self._keep_chunk(record_chunks))
+            projections[global_mesg_num] = (
+                frozenset(field_nums), frozenset(dev_field_names),
+                subfield_names)
 
-        if self._processor:
-            self._processor.on_process_message(self, data_message)
+        return projections
 
-        # keep track of the last file_id message
-        if def_mesg.global_mesg_num == profile.MESG_NUM_FILE_ID:
-            self._current_file_id = data_message
+    @staticmethod
+    def _resolve_mesg_nums(mesgs):
+        # convert an iterable of message names and/or numbers to a frozenset of
+        # global message numbers
+        if mesgs is None:
+            return None
 
-        return data_message
+        if isinstance(mesgs, (str, int)):
+            mesgs = (mesgs, )
 
-    def _read_data_message_raw_values(self, def_mesg):
-        raw_values = []
-        record_chunks = []
-
-        for field_def in def_mesg.all_field_defs:
-            base_type = field_def.base_type
-
-            # struct format to read "[N]" base types
-            unpacker = struct.Struct(
-                f'{def_mesg.endian}'
-                f'{int(field_def.size / base_type.size)}'
-                f'{base_type.fmt}')
-
-            # read the chunk
-            chunk = self._read_bytes(unpacker.size)
-            record_chunks.append(chunk)
-
-            # extract the raw value
-            raw_value = unpacker.unpack(chunk)
-
-            if base_type.identifier == types.BASE_TYPE_BYTE.identifier:
-                raw_value = base_type.parse(raw_value)
-            elif len(raw_value) > 1:
-                # If the field returns with a tuple of values it's definitely an
-                # oddball, but we'll parse it on a per-value basis. If it's a
-                # byte type, treat the tuple as a single value
-                raw_value = tuple(base_type.parse(v) for v in raw_value)
+        mesg_nums = set()
+        for mesg in mesgs:
+            if isinstance(mesg, int) and not isinstance(mesg, bool):
+                mesg_nums.add(mesg)
             else:
-                # Otherwise, just scrub the singular value
-                raw_value = base_type.parse(raw_value[0])
+                mesg_nums.add(utils.get_mesg_num(mesg))
 
-            raw_values.append(raw_value)
+        return frozenset(mesg_nums)
 
-        return record_chunks, raw_values
+    def _read_data_message_raw_values(self, def_mesg):
+        # the decode plan has been compiled along with the definition message so
+        # that the whole payload can be read and unpacked at once
+        decode_plan = def_mesg.decode_plan
+        if not decode_plan.size:
+            return [], decode_plan.decode(b'')
+
+        chunk = self._read_bytes(decode_plan.size)
+
+        return [chunk], decode_plan.decode(chunk)
 
     def _read_struct(self, fmt, *, endian=None):
         assert fmt
@@ -826,27 +1926,162 @@ class FitReader:
         if size <= 0:
             raise ValueError('size')
 
-        chunk = utils.blocking_read(self._fd, size)
-        chunk_size = 0 if not chunk else len(chunk)
-        if chunk_size != size:
-            raise FitEOFError(size, chunk_size, self._read_offset)
+        start = self._buffer_pos
+        end = start + size
+        if end > len(self._buffer):
+            self._fill_buffer(size)
+            start = 0
+            end = size
+
+        chunk = self._buffer[start:end]
+        self._buffer_pos = end
 
-        if chunk:
-            if self.check_crc is not CrcCheck.DISABLED:
-                self._crc = utils.compute_crc(chunk, crc=self._crc)
-            self._chunk_size += chunk_size
-            self._read_offset += chunk_size
-            self._read_size += chunk_size
+        self._chunk_size += size
+        self._read_offset += size
+        self._read_size += size
 
         return chunk
 
+    def _skip_bytes(self, size):
+        # Same as _read_bytes, except that bytes are not returned, and the part
+        # that is not buffered yet is seeked over instead of being read if CRC
+        # is disabled and the source stream is seekable
+        if not size:
+            return
+
+        available = len(self._buffer) - self._buffer_pos
+        if size > available:
+            if not self._seekable or self.check_crc is not CrcCheck.DISABLED:
+                self._read_bytes(size)
+                return
+
+            # discard the buffer and seek over the missing bytes
+            target = self._read_offset + size
+            if target > self._source_size:
+                raise FitEOFError(
+                    size, self._source_size - self._read_offset,
+                    self._read_offset)
+            self._fd.seek(target, io.SEEK_SET)
+
+            self._buffer = b''
+            self._buffer_pos = 0
+            self._crc_pos = 0
+        else:
+            self._buffer_pos += size
+
+        self._chunk_size += size
+        self._read_offset += size
+        self._read_size += size
+
+    def _seek_source(self, offset):
+        # move the read cursor to *offset* in the source, which is expected to
+        # be a record boundary. The read-ahead buffer is kept if *offset* is
+        # loaded already.
+        buffer_offset = self._read_offset - self._buffer_pos
+        if self._mmap is not None:
+            self._buffer_pos = offset
+        elif buffer_offset <= offset <= buffer_offset + len(self._buffer):
+            self._buffer_pos = offset - buffer_offset
+        else:
+            self._fd.seek(offset, io.SEEK_SET)
+            self._buffer = b''
+            self._buffer_pos = 0
+
+        self._crc_pos = self._buffer_pos
+        self._read_offset = offset
+        self._chunk_offset = offset
+        self._chunk_size = 0
+
+    def _fill_buffer(self, size):
+        # Move the unread part of the buffer to its beginning and read from the
+        # source stream until at least *size* bytes are available. FitEOFError
+        # is raised otherwise, in which case the read bytes are kept in the
+        # buffer but not consumed.
+        if self._fd is None:
+            raise FitEOFError(size, 0, self._read_offset)
+
+        if self._mmap is not None:
+            # the whole source file is mapped already
+            raise FitEOFError(
+                size, len(self._buffer) - self._buffer_pos, self._read_offset)
+
+        # the consumed part of the buffer is about to be discarded
+        self._update_crc()
+
+        buffered = self._buffer[self._buffer_pos:]
+        missing = size - len(buffered)
+        assert missing > 0
+
+        data = utils.read_ahead(
+            self._fd, missing, max(missing, self._block_size),
+            use_selector=self._wait_strategy is WaitStrategy.SELECT,
+            selector=self._selector)
+
+        self._buffer = buffered + data if buffered else data
+        self._buffer_pos = 0
+        self._crc_pos = 0
+
+        if len(self._buffer) < size:
+            raise FitEOFError(size, len(self._buffer), self._read_offset)
+
+    def _update_crc(self):
+        # Update the CRC with the consumed part of the read-ahead buffer that
+        # has not been accounted yet. That is, CRC is computed by blocks rather
+        # than upon every read.
+        if self._crc_pos < self._buffer_pos:
+            if self.check_crc in _CRC_CHECK_DEFERRED:
+                if self._crc_worker is None:
+                    self._crc_worker = _CrcWorker(self._crc)
+                self._crc_worker.feed(
+                    self._buffer, self._crc_pos, self._buffer_pos)
+            elif self.check_crc is not CrcCheck.DISABLED:
+                self._crc = utils.compute_crc(
+                    self._buffer, crc=self._crc,
+                    start=self._crc_pos, end=self._buffer_pos)
+            self._crc_pos = self._buffer_pos
+
+    def _map_source(self):
+        try:
+            mapping = mmap.mmap(self._fd.fileno(), 0, access=mmap.ACCESS_READ)
+        except (AttributeError, OSError, ValueError):
+            # not a regular file, or an empty one
+            return
+
+        self._mmap = mapping
+        self._buffer = memoryview(mapping)
+        self._buffer_pos = self._read_offset
+
+    def _make_selector(self):
+        # A selector to which the source stream is registered, to be reused by
+        # every wait, if the source stream is non-blocking. None otherwise, in
+        # which case utils.wait_readable() creates one per wait if ever needed.
+        try:
+            fileno = self._fd.fileno()
+            if os.get_blocking(fileno):
+                return None
+        except (AttributeError, OSError, ValueError):
+            return None
+
+        selector = selectors.DefaultSelector()
+        try:
+            selector.register(fileno, selectors.EVENT_READ)
+        except (OSError, ValueError):
+            selector.close()
+            return None
+
+        return selector
+
     def _keep_chunk(self, chunk):
         if not self._keep_raw:
             return None
 
         assert chunk
 
-        if isinstance(chunk, (list, tuple)):
+        if self._mmap is not None:
+            # the whole chunk is contiguous in the mapping, no need to copy it
+            end = self._buffer_pos
+            chunk = self._buffer[end - self._chunk_size:end]
+        elif isinstance(chunk, (list, tuple)):
             # *chunk* is a iterable of chunks
             chunk = b''.join(chunk)
         else:
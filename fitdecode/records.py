@@ -3,6 +3,8 @@
 
 import itertools
 
+from . import types
+
 __all__ = [
     'FitChunk', 'FitHeader', 'FitCRC', 'FitDefinitionMessage', 'FitDataMessage',
     'FIT_FRAME_HEADER', 'FIT_FRAME_CRC',
@@ -28,7 +30,14 @@ class FitChunk:
     def __init__(self, index, offset, bytes):
         self.index = index    #: zero-based index of this frame in the file
         self.offset = offset  #: the offset at which this frame starts in the file
-        self.bytes = bytes    #: the frame itself as a `bytes` object
+        #: the frame itself as a `bytes` object, or as a read-only
+        #: `memoryview` slice of the source file if it is memory-mapped (see
+        #: the *use_mmap* argument of `FitReader`)
+        self.bytes = bytes
+
+    def __reduce__(self):
+        # *bytes* may be a `memoryview` (i.e. *use_mmap*)
+        return (FitChunk, (self.index, self.offset, bytes(self.bytes)))
 
 
 class FitHeader:
@@ -79,12 +88,14 @@ class FitDefinitionMessage:
         'endian',
         'field_defs',
         'dev_field_defs',
+        'decode_plan',
 
         'chunk')
 
     def __init__(
             self, is_developer_data, local_mesg_num, time_offset, mesg_type,
-            global_mesg_num, endian, field_defs, dev_field_defs, chunk):
+            global_mesg_num, endian, field_defs, dev_field_defs, chunk,
+            decode_plan=None):
         self.is_developer_data = is_developer_data
         self.local_mesg_num = local_mesg_num
         self.time_offset = time_offset
@@ -93,9 +104,19 @@ class FitDefinitionMessage:
         self.endian = endian
         self.field_defs = field_defs  #: list of `FieldDefinition`
         self.dev_field_defs = dev_field_defs  #: list of `DevFieldDefinition`
+        #: `types.DecodePlan` of the data messages relying on this definition
+        self.decode_plan = decode_plan
+        if decode_plan is None:
+            self.decode_plan = types.DecodePlan(endian, self.all_field_defs)
         #: `FitChunk` or `None` (depends on ``keep_raw_chunks`` option)
         self.chunk = chunk
 
+    def __reduce__(self):
+        return (FitDefinitionMessage, (
+            self.is_developer_data, self.local_mesg_num, self.time_offset,
+            self.mesg_type, self.global_mesg_num, self.endian, self.field_defs,
+            self.dev_field_defs, self.chunk, self.decode_plan))
+
     @property
     def name(self):
         if self.mesg_type is not None:
@@ -120,12 +141,13 @@ class FitDataMessage:
         'time_offset',
 
         'def_mesg',
-        'fields',
+        '_fields',
+        '_lazy_fields',
         'chunk')
 
     def __init__(
             self, is_developer_data, local_mesg_num, time_offset, def_mesg,
-            fields, chunk):
+            fields, chunk, *, lazy_fields=None):
         #: Is this a "developer" message?
         self.is_developer_data = is_developer_data
 
@@ -138,16 +160,42 @@ class FitDataMessage:
         #: `FitDefinitionMessage`
         self.def_mesg = def_mesg
 
-        #: list of `FieldData`
-        self.fields = fields
+        self._fields = fields
+
+        # if *fields* is None, the object that decodes them upon access (see
+        # the *lazy_fields* argument of `FitReader`)
+        self._lazy_fields = lazy_fields
 
         #: `FitChunk` or `None` (depends on ``keep_raw_chunks`` option)
         self.chunk = chunk
 
+    def __reduce__(self):
+        return (FitDataMessage, (
+            self.is_developer_data, self.local_mesg_num, self.time_offset,
+            self.def_mesg, self.fields, self.chunk))
+
     def __iter__(self):
         """Iterate over the `FieldData` object in this mesage"""
         return iter(self.fields)
 
+    @property
+    def fields(self):
+        """
+        list of `FieldData`
+
+        Decoded upon first access in case the message has been read with the
+        *lazy_fields* option of `FitReader`.
+        """
+        if self._fields is None:
+            self._fields = self._lazy_fields.get_all()
+            self._lazy_fields = None
+        return self._fields
+
+    @fields.setter
+    def fields(self, fields):
+        self._fields = fields
+        self._lazy_fields = None
+
     @property
     def name(self):
         """Message name"""
@@ -172,7 +220,7 @@ class FitDataMessage:
 
         .. seealso:: `get_field`, `get_fields`, `get_value`, `get_values`
         """
-        for field in self.fields:
+        for field in self._get_named_fields(field_name_or_num):
             if field.is_named(field_name_or_num):
                 return True
 
@@ -196,7 +244,7 @@ class FitDataMessage:
         .. seealso:: `get_fields`, `get_value`, `get_values`, `has_field`
         """
         current_idx = -1
-        for field in self.fields:
+        for field in self._get_named_fields(field_name_or_num):
             if field.is_named(field_name_or_num):
                 current_idx += 1
                 if current_idx == idx:
@@ -213,7 +261,7 @@ class FitDataMessage:
 
         .. seealso:: `get_field`, `get_value`, `get_values`, `has_field`
         """
-        for field in self.fields:
+        for field in self._get_named_fields(field_name_or_num):
             if field.is_named(field_name_or_num):
                 yield field
 
@@ -276,7 +324,7 @@ class FitDataMessage:
                 pass
         else:
             current_idx = -1
-            for field in self.fields:
+            for field in self._get_named_fields(field_name_or_num):
                 if field.is_named(field_name_or_num):
                     current_idx += 1
                     if current_idx == idx:
@@ -334,3 +382,10 @@ class FitDataMessage:
                     None, idx=idx, raw_value=raw_value,
                     fit_type=fit_type, py_type=py_type)
                 yield value
+
+    def _get_named_fields(self, field_name_or_num):
+        # Get the fields that may be named *field_name_or_num*, in order, so
+        # that the other ones do not have to be decoded if the message is lazy
+        if self._fields is None:
+            return self._lazy_fields.get_named(field_name_or_num)
+        return self._fields
@@ -0,0 +1,177 @@
+# Copyright (c) Jean-Charles Lefebvre
+# SPDX-License-Identifier: MIT
+
+import collections
+import struct
+
+from . import records
+from .exceptions import FitParseError
+from .reader import (
+    CrcCheck, DEFAULT_BLOCK_SIZE, ErrorHandling, FitReader, SkipStrategy,
+    WaitStrategy)
+
+__all__ = ['ScannedFrame', 'FitScanner']
+
+
+#: The lightweight description of a frame yielded by `FitScanner`.
+#:
+#: * ``frame_type``: one of the ``FIT_FRAME_*`` constants
+#: * ``offset``: the offset at which the frame starts in the source stream
+#: * ``size``: the size of the frame in bytes
+#: * ``local_mesg_num``: the **local** message number of a definition or a data
+#:   message. `None` otherwise.
+#: * ``global_mesg_num``: the **global** message number of a definition or a
+#:   data message. `None` otherwise.
+ScannedFrame = collections.namedtuple(
+    'ScannedFrame',
+    ('frame_type', 'offset', 'size', 'local_mesg_num', 'global_mesg_num'))
+
+
+class FitScanner(FitReader):
+    """
+    Walk the structure of a FIT stream or storage, without decoding it.
+
+    Every frame is yielded as a `ScannedFrame` tuple. Definition messages are
+    only read as much as needed to know the size of the data messages that
+    rely on them, and the payload of data messages is skipped: field values are
+    never decoded, components are not expanded and there is no data processor
+    involved.
+
+    Like `FitReader`, chained FIT files are supported transparently.
+
+    By default, CRC is not computed and the payload of data messages is seeked
+    over if the source is seekable, so that scanning costs little more than
+    I/O. *check_crc* can be specified to check CRC nonetheless, in which case
+    every byte is read.
+
+    Usage::
+
+        import fitdecode
+
+        with fitdecode.FitScanner('file.fit') as scanner:
+            for frame in scanner:
+                if frame.frame_type == fitdecode.FIT_FRAME_DATA:
+                    print(frame.offset, frame.size, frame.global_mesg_num)
+
+    The other arguments have the same meaning than for `FitReader`.
+    """
+
+    def __init__(
+            self, fileish, *, check_crc=CrcCheck.DISABLED,
+            block_size=DEFAULT_BLOCK_SIZE, use_mmap=False,
+            wait_strategy=WaitStrategy.SELECT):
+        super().__init__(
+            fileish, processor=None, check_crc=check_crc,
+            error_handling=ErrorHandling.RAISE, keep_raw_chunks=False,
+            block_size=block_size, use_mmap=use_mmap,
+            skip_strategy=SkipStrategy.SEEK, wait_strategy=wait_strategy)
+
+        # registry of (global_mesg_num, payload_size) per local message number
+        self._local_payload_sizes = {}
+
+    def __iter__(self):
+        yield from self._scan_next()
+
+    def close(self):
+        super().close()
+        self._local_payload_sizes = {}
+
+    # ONLY PRIVATE METHODS BELOW ***********************************************
+
+    def _scan_next(self):
+        while self._fd is not None:
+            assert self._chunk_size == 0
+
+            if self._header is None:
+                self._reset_per_fit_state()
+                self._read_header()
+                if self._header is None:
+                    break
+
+                self._fit_file_index += 1
+
+                yield ScannedFrame(
+                    records.FIT_FRAME_HEADER, self._chunk_offset,
+                    self._chunk_size, None, None)
+                self._next_chunk()
+
+            elif self._body_bytes_left > 0:
+                frame_type, local_mesg_num, global_mesg_num = \
+                    self._scan_record()
+
+                if self._chunk_size > self._body_bytes_left:
+                    raise FitParseError(
+                        self._chunk_offset,
+                        'record overlaps the end of the FIT file body')
+                self._body_bytes_left -= self._chunk_size
+
+                yield ScannedFrame(
+                    frame_type, self._chunk_offset, self._chunk_size,
+                    local_mesg_num, global_mesg_num)
+                self._next_chunk()
+
+            else:
+                self._read_crc()
+
+                yield ScannedFrame(
+                    records.FIT_FRAME_CRC, self._chunk_offset,
+                    self._chunk_size, None, None)
+                self._next_chunk()
+
+                self._reset_per_fit_state()
+
+    def _reset_per_fit_state(self):
+        super()._reset_per_fit_state()
+        self._local_payload_sizes = {}
+
+    def _scan_record(self):
+        # read record header
+        header_byte = self._read_bytes(1)[0]
+        if header_byte & 0x80:  # compressed timestamp
+            is_definition = False
+            local_mesg_num = (header_byte >> 5) & 0x3
+        else:
+            is_definition = bool(header_byte & 0x40)
+            local_mesg_num = header_byte & 0xf
+
+        if not is_definition:
+            try:
+                global_mesg_num, payload_size = \
+                    self._local_payload_sizes[local_mesg_num]
+            except KeyError:
+                raise FitParseError(
+                    self._chunk_offset,
+                    f'local message {local_mesg_num} not defined')
+
+            self._skip_bytes(payload_size)
+
+            return records.FIT_FRAME_DATA, local_mesg_num, global_mesg_num
+
+        global_mesg_num, payload_size = self._scan_definition_message(
+            is_developer_data=bool(header_byte & 0x20))
+
+        self._local_payload_sizes[local_mesg_num] = (
+            global_mesg_num, payload_size)
+
+        return records.FIT_FRAME_DEFINITION, local_mesg_num, global_mesg_num
+
+    def _scan_definition_message(self, is_developer_data):
+        # Read a definition message like FitReader._read_definition_message
+        # does, but only to get the size of the payload of the data messages
+        # that rely on it. That is, the sum of the sizes of its fields.
+        extra_chunk = self._read_bytes(5)
+        endian = '<' if not extra_chunk[1] else '>'
+        global_mesg_num, num_fields = struct.unpack(
+            f'{endian}2xHB', extra_chunk)
+
+        # field definitions are (def_num, size, base_type) byte triplets
+        payload_size = 0
+        if num_fields:
+            payload_size += sum(self._read_bytes(num_fields * 3)[1::3])
+
+        if is_developer_data:
+            num_dev_fields = self._read_bytes(1)[0]
+            if num_dev_fields:
+                payload_size += sum(self._read_bytes(num_dev_fields * 3)[1::3])
+
+        return global_mesg_num, payload_size
@@ -0,0 +1,271 @@
+# Copyright (c) Jean-Charles Lefebvre
+# SPDX-License-Identifier: MIT
+
+import collections
+import os
+
+from . import records
+from .types import _make_field_data
+
+__all__ = ['pack_frames', 'unpack_frames', 'share_columns', 'SharedColumns']
+
+# The shared memory blocks created by this process, in case they are released
+# along with their last handle (Windows), oldest first. See share_columns().
+_owned_blocks = collections.deque()
+
+
+def pack_frames(frames):
+    """
+    Pack a sequence of frames into a compact form that is much faster to
+    pickle than the frames themselves, typically to send them to another
+    process. `unpack_frames` restores the frames.
+
+    The structure of each data message (its definition message, and the
+    `FieldDefinition`, profile objects and units of its fields) is stored once
+    in a table of *layouts*, and a data message only by the index of its
+    layout and a tuple of its values. Profile objects are pickled as references
+    to the profile (e.g. ``(mesg_num, def_num)`` for a field), so they are not
+    duplicated by unpickling either.
+
+    Frames other than data messages are packed as is since they are rare.
+
+    The packed form is made of tuples, lists and frames only. It is not meant
+    to be stored since it is tied to the profile of this version of
+    ``fitdecode``.
+    """
+    layouts = []
+    layout_ids = {}
+    packed = []
+
+    for frame in frames:
+        if frame.frame_type != records.FIT_FRAME_DATA:
+            packed.append(frame)
+            continue
+
+        fields = frame.fields
+        key = (
+            id(frame.def_mesg), frame.is_developer_data,
+            frame.local_mesg_num,
+            tuple(
+                (id(field_data.field_def), id(field_data.field),
+                 id(field_data.parent_field), field_data.units)
+                for field_data in fields))
+
+        layout_id = layout_ids.get(key)
+        if layout_id is None:
+            layout_id = len(layouts)
+            layout_ids[key] = layout_id
+            layouts.append((
+                frame.def_mesg, frame.is_developer_data, frame.local_mesg_num,
+                tuple(
+                    (field_data.field_def, field_data.field,
+                     field_data.parent_field, field_data.units)
+                    for field_data in fields)))
+
+        values = []
+        for field_data in fields:
+            values.append(field_data.value)
+            values.append(field_data.raw_value)
+
+        chunk = frame.chunk
+        if chunk is not None:
+            chunk = (chunk.index, chunk.offset, bytes(chunk.bytes))
+
+        packed.append((layout_id, frame.time_offset, chunk, tuple(values)))
+
+    return (layouts, packed)
+
+
+def unpack_frames(packed_frames):
+    """
+    Restore the list of frames packed by `pack_frames`.
+
+    Data messages that share a layout share their definition message, like
+    the frames yielded by `FitReader` do.
+    """
+    layouts, packed = packed_frames
+    frames = []
+
+    for item in packed:
+        if type(item) is not tuple:
+            frames.append(item)
+            continue
+
+        layout_id, time_offset, chunk, values = item
+        def_mesg, is_developer_data, local_mesg_num, field_layouts = \
+            layouts[layout_id]
+
+        fields = []
+        idx = 0
+        for field_def, field, parent_field, units in field_layouts:
+            fields.append(_make_field_data(
+                field_def, field, parent_field, values[idx], values[idx + 1],
+                units))
+            idx += 2
+
+        if chunk is not None:
+            chunk = records.FitChunk(*chunk)
+
+        frames.append(records.FitDataMessage(
+            is_developer_data, local_mesg_num, time_offset, def_mesg, fields,
+            chunk))
+
+    return frames
+
+
+def share_columns(columns, *, keep_blocks=None):
+    """
+    Copy numeric columns to a new `multiprocessing.shared_memory.SharedMemory`
+    block, typically from a worker process, and return the *descriptor* of the
+    block: a small picklable object to be passed to `SharedColumns` in order to
+    access the columns from another process without copying them.
+
+    *columns* is a ``{key: {name: column}}`` `dict` where *column* is an
+    `array.array` of ``'d'`` type code. *key* and *name* must be picklable.
+
+    The block is not released by this function: the `SharedColumns` object
+    must be closed for that.
+
+    On Windows, a block is released along with its last handle, so this
+    process keeps the block open until the process exits, or until the block
+    is one of the oldest of the blocks it created so far: only the
+    *keep_blocks* most recent blocks are kept open, if *keep_blocks* is not
+    `None`. *keep_blocks* must then be at least the number of descriptors that
+    may not have been passed to `SharedColumns` yet, typically the number of
+    pending jobs of a pool of worker processes.
+
+    Before Python 3.13, the block is removed from the tracking of
+    `multiprocessing` with the undocumented
+    ``multiprocessing.resource_tracker.unregister()`` (other than on
+    Windows). Should it fail, the block is unlinked when this process exits
+    (possibly before it gets attached), and a warning about a leaked shared
+    memory object may be emitted.
+
+    Requires Python 3.8+.
+    """
+    assert keep_blocks is None or keep_blocks > 0
+
+    from multiprocessing import shared_memory
+
+    layout = []
+    size = 0
+    for key, named_columns in columns.items():
+        column_layouts = []
+        for name, column in named_columns.items():
+            if column.typecode != 'd':
+                raise ValueError(f'unsupported type code for column {name}')
+            column_layouts.append((name, size, len(column)))
+            size += len(column) * column.itemsize
+        layout.append((key, tuple(column_layouts)))
+
+    if not size:
+        return (None, tuple(layout))
+
+    # the block is owned by the process that attaches it with SharedColumns,
+    # so it must not be tracked (i.e. unlinked at exit) by this one
+    try:
+        block = shared_memory.SharedMemory(
+            create=True, size=size, track=False)
+    except TypeError:  # python < 3.13
+        block = shared_memory.SharedMemory(create=True, size=size)
+        if os.name != 'nt':
+            _untrack_block(block)
+
+    try:
+        offset = 0
+        for named_columns in columns.values():
+            for column in named_columns.values():
+                end = offset + len(column) * column.itemsize
+                block.buf[offset:end] = memoryview(column).cast('B')
+                offset = end
+    except BaseException:
+        block.close()
+        block.unlink()
+        raise
+
+    if os.name == 'nt':
+        # the block would be released along with its last handle, that is
+        # before it can be attached by another process
+        _owned_blocks.append(block)
+        if keep_blocks is not None:
+            while len(_owned_blocks) > keep_blocks:
+                _owned_blocks.popleft().close()
+    else:
+        block.close()
+
+    return (block.name, tuple(layout))
+
+
+def _untrack_block(block):
+    # The private API of multiprocessing may change from a version of python to
+    # another, in which case the block stays tracked, see share_columns()
+    try:
+        from multiprocessing import resource_tracker
+        resource_tracker.unregister(block._name, 'shared_memory')
+    except Exception:
+        pass
+
+
+class SharedColumns:
+    """
+    The numeric columns shared by `share_columns`, attached from their
+    *descriptor*.
+
+    `columns` is a ``{key: {name: column}}`` `dict`, where *column* is a
+    `memoryview` of ``'d'`` format over the shared memory block. That is,
+    columns are not copied.
+
+    The shared memory block is released by `close`, which must be called once
+    the columns are not needed anymore. `memoryview` objects of `columns` are
+    released as well, and any other view of the block (e.g. a slice of a
+    column) must be released beforehand. `SharedColumns` can be used as a
+    context manager.
+
+    Requires Python 3.8+.
+    """
+
+    def __init__(self, descriptor):
+        #: ``{key: {name: column}}`` `dict`
+        self.columns = {}
+
+        self._block = None
+        self._views = []
+
+        name, layout = descriptor
+        if name is not None:
+            from multiprocessing import shared_memory
+            self._block = shared_memory.SharedMemory(name=name)
+
+        for key, column_layouts in layout:
+            named_columns = {}
+            for column_name, offset, length in column_layouts:
+                if self._block is None or not length:
+                    view = memoryview(b'').cast('d')
+                else:
+                    view = self._block.buf[offset:offset + length * 8]
+                    self._views.append(view)
+                    view = view.cast('d')
+                self._views.append(view)
+                named_columns[column_name] = view
+            self.columns[key] = named_columns
+
+    def __del__(self):
+        self.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *_):
+        self.close()
+
+    def close(self):
+        """Release the columns and the shared memory block"""
+        for view in reversed(self._views):
+            view.release()
+        self._views = []
+
+        if self._block is not None:
+            block = self._block
+            self._block = None
+            block.close()
+            block.unlink()
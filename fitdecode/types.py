@@ -1,12 +1,39 @@
 # Copyright (c) Jean-Charles Lefebvre
 # SPDX-License-Identifier: MIT
 
+import collections.abc
 import math
 import struct
 
 __all__ = []
 
 
+#: `DecodePlan` slot usage: field is not decoded at all
+SLOT_SKIPPED = 0
+#: `DecodePlan` slot usage: field is decoded but no `FieldData` is created for it
+#: (e.g. it is referred to by a subfield or it is the source of components)
+SLOT_DECODED = 1
+#: `DecodePlan` slot usage: field is decoded and its `FieldData` is created
+SLOT_EMITTED = 2
+
+# DecodePlan slot modes
+_SLOT_SCALAR = 0  # one value, parsed as such
+_SLOT_ARRAY = 1   # multiple values, parsed one by one into a tuple
+_SLOT_BYTES = 2   # "byte" base type, the whole tuple is parsed at once
+
+
+class _ProfileObject:
+    # Objects of the ``profile`` module are pickled by reference so that they
+    # are not duplicated, and stay the same objects once unpickled
+    __slots__ = ()
+
+    def __reduce_ex__(self, protocol):
+        path = _get_profile_paths().get(id(self))
+        if path is not None:
+            return (_get_profile_object, path)
+        return super().__reduce_ex__(protocol)
+
+
 class BaseType:
     __slots__ = ('name', 'identifier', 'fmt', 'size', 'parse')
 
@@ -19,13 +46,17 @@ class BaseType:
         self.size = struct.calcsize(fmt)
         self.parse = parse
 
+    def __reduce__(self):
+        # base types are singletons, and *parse* may not be picklable
+        return (_get_base_type, (self.identifier, ))
+
     @property
     def type_num(self):
         """"Base Type Number" as per SDK definition"""
         return self.identifier & 0x1F
 
 
-class FieldType:
+class FieldType(_ProfileObject):
     __slots__ = ('name', 'base_type', 'enum')
 
     def __init__(self, name, base_type, enum=None):
@@ -34,7 +65,7 @@ class FieldType:
         self.enum = enum
 
 
-class _FieldAndSubFieldBase:
+class _FieldAndSubFieldBase(_ProfileObject):
     __slots__ = ()
 
     @property
@@ -176,7 +207,7 @@ class ComponentField:
         return raw_value
 
 
-class MessageType:
+class MessageType(_ProfileObject):
     __slots__ = ('name', 'mesg_num', 'fields')
 
     def __init__(self, name, mesg_num, fields):
@@ -235,6 +266,129 @@ class DevFieldDefinition:
         return self.field.type
 
 
+class DecodePlan:
+    """
+    Precompiled decoding plan of the payload of the data messages that rely on
+    a given `FitDefinitionMessage`.
+
+    The whole payload is unpacked at once using a single `struct.Struct`, then
+    each *slot* (one per field definition, in the order of
+    ``FitDefinitionMessage.all_field_defs``) picks its value(s) from the
+    unpacked tuple and applies the invalid-value check of its base type.
+
+    *only* can be an iterable of slot indexes, in which case the other slots
+    are skipped over at unpacking time and their raw value is always `None`.
+
+    *emit* can be an iterable of slot indexes, in which case only the
+    `FieldData` objects of these slots are meant to be created. The other
+    decoded slots are only used to decode the emitted ones (subfields and
+    components).
+
+    *field_nums* can be an iterable of the definition numbers of the fields to
+    emit, so that component fields can be filtered as well.
+
+    *subfield_names* can be a mapping of some of *field_nums* to the names of
+    their subfields, in which case the fields of these numbers are emitted
+    only if they resolve to one of these subfields.
+    """
+
+    __slots__ = (
+        'unpacker', 'size', 'count', 'slots', 'usages', 'field_nums',
+        'subfield_names', '_args')
+
+    def __init__(self, endian, field_defs, only=None, emit=None,
+                 field_nums=None, subfield_names=None):
+        field_defs = tuple(field_defs)
+        if only is not None:
+            only = frozenset(only)
+        if emit is not None:
+            emit = frozenset(emit)
+
+        # neither the unpacker nor the parse functions can be pickled, so the
+        # plan is compiled again once unpickled
+        self._args = (
+            endian, field_defs, only, emit, field_nums, subfield_names)
+
+        usages = []
+
+        fmt = [endian]
+        slots = []
+        start = 0
+        count = 0
+
+        for index, field_def in enumerate(field_defs):
+            base_type = field_def.base_type
+            values_count = field_def.size // base_type.size
+            count += 1
+
+            if only is not None and index not in only:
+                usages.append(SLOT_SKIPPED)
+                if values_count:
+                    fmt.append(f'{values_count * base_type.size}x')
+                continue
+
+            usages.append(
+                SLOT_EMITTED if emit is None or index in emit else SLOT_DECODED)
+
+            if not values_count:
+                # zero-sized field: raw value is always None
+                continue
+
+            if base_type.fmt == 's':
+                # a string is unpacked as a single bytes object
+                fmt.append(f'{values_count}s')
+                values_count = 1
+            else:
+                fmt.append(f'{values_count}{base_type.fmt}')
+
+            if base_type.identifier == BASE_TYPE_BYTE.identifier:
+                mode = _SLOT_BYTES
+            elif values_count > 1:
+                mode = _SLOT_ARRAY
+            else:
+                mode = _SLOT_SCALAR
+
+            slots.append((
+                index, mode, start, start + values_count, base_type.parse))
+            start += values_count
+
+        self.unpacker = struct.Struct(''.join(fmt))
+        self.size = self.unpacker.size  #: size of the payload in bytes
+        self.count = count  #: number of slots
+        #: the slots that are actually decoded
+        self.slots = tuple(slots)
+        #: the usage of every slot (`SLOT_SKIPPED`, `SLOT_DECODED` or
+        #: `SLOT_EMITTED`)
+        self.usages = tuple(usages)
+        #: `frozenset` of the definition numbers of the fields to emit,
+        #: including component fields. `None` means all of them.
+        self.field_nums = None if field_nums is None else frozenset(field_nums)
+        #: `dict` of the names of the subfields that the fields of some of
+        #: `field_nums` must resolve to in order to be emitted. `None` if there
+        #: is no such field.
+        self.subfield_names = dict(subfield_names) if subfield_names else None
+
+    def __reduce__(self):
+        return (DecodePlan, self._args)
+
+    def decode(self, payload):
+        """
+        Unpack *payload* and return the `list` of raw values, one per slot.
+        """
+        values = self.unpacker.unpack(payload)
+        raw_values = [None] * self.count
+
+        for index, mode, start, end, parse in self.slots:
+            if mode == _SLOT_SCALAR:
+                raw_values[index] = parse(values[start])
+            elif mode == _SLOT_ARRAY:
+                raw_values[index] = tuple(parse(v) for v in values[start:end])
+            else:
+                raw_values[index] = parse(values[start:end])
+
+        return raw_values
+
+
 class FieldData:
     __slots__ = (
         'field_def', 'field', 'parent_field', 'value', 'raw_value', 'units')
@@ -254,6 +408,12 @@ class FieldData:
             # processor
             self.units = self.field.units
 
+    def __reduce__(self):
+        # faster than the default, and *units* is restored as is
+        return (_make_field_data, (
+            self.field_def, self.field, self.parent_field, self.value,
+            self.raw_value, self.units))
+
     @property
     def name(self):
         """
@@ -381,3 +541,213 @@ BASE_TYPES = {
     0x8e: BaseType(name='sint64', identifier=0x8e, fmt='q', parse=lambda x: None if x == 0x7fffffffffffffff else x),  # noqa: E501
     0x8f: BaseType(name='uint64', identifier=0x8f, fmt='Q', parse=lambda x: None if x == 0xffffffffffffffff else x),  # noqa: E501
     0x90: BaseType(name='uint64z', identifier=0x90, fmt='Q', parse=lambda x: None if x == 0 else x)}  # noqa: E501
+
+
+class _LazyMapping(collections.abc.MutableMapping):
+    # A mapping of profile objects, each built upon first access from its
+    # entry in *table*, so that importing the profile does not cost the
+    # building of all of its objects.
+    # Entries are stored as the source text of a literal, parsed upon first
+    # access as well, since unmarshalling thousands of nested tuples of
+    # constants costs about as much as building the objects themselves.
+    # *build(key, entry)* returns the object of *key* from its parsed entry.
+    # Once built, an object is cached so that it stays the same object.
+    # Like the plain dict it replaces, the mapping can be written to, so that
+    # custom objects can be registered or patched at runtime; such objects go
+    # to the cache directly and their keys are remembered, see changed_keys().
+    __slots__ = ('_table', '_build', '_cache', '_changed', '_writes')
+
+    def __init__(self, table, build):
+        self._table = table
+        self._build = build
+        self._cache = {}
+        self._changed = set()
+        self._writes = 0  # number of writes, see _get_profile_paths()
+
+    def __getitem__(self, key):
+        try:
+            return self._cache[key]
+        except KeyError:
+            pass
+
+        # imported here since it is not needed until the first lookup
+        import ast
+
+        obj = self._build(key, ast.literal_eval(self._table[key]))
+
+        # in case another thread got there first
+        return self._cache.setdefault(key, obj)
+
+    def __setitem__(self, key, value):
+        self._cache[key] = value
+        self._table.setdefault(key, None)
+        self._changed.add(key)
+        self._writes += 1
+
+    def __delitem__(self, key):
+        del self._table[key]
+        self._cache.pop(key, None)
+        self._changed.discard(key)
+        self._writes += 1
+
+    def __contains__(self, key):
+        return key in self._table
+
+    def __iter__(self):
+        return iter(self._table)
+
+    def __len__(self):
+        return len(self._table)
+
+    def __repr__(self):
+        return f'<{type(self).__name__} of {len(self._table)} items>'
+
+    def changed_keys(self):
+        # The keys of the objects set at runtime, rather than built from the
+        # table they came with
+        return frozenset(self._changed)
+
+
+def _make_field_type(name, entry):
+    # Build a FieldType from its entry in the table of the profile:
+    # (base_type, ((value, value_name), ...))
+    base_type, enum = entry
+    return FieldType(
+        name=name, base_type=BASE_TYPES[base_type],
+        enum=dict(enum) if enum else None)
+
+
+def _make_message_type(mesg_num, entry, *, field_types, timestamp_field):
+    # Build a MessageType from its entry in the table of the profile:
+    # (name, (field, ...)), where a field is either None for
+    # *timestamp_field*, or:
+    # (def_num, name, type, scale, offset, units, components, subfields)
+    def get_type(type_):
+        if isinstance(type_, int):
+            return BASE_TYPES[type_]
+        return field_types[type_]
+
+    def make_components(components):
+        # components: ((name, def_num, scale, offset, units, accumulate, bits,
+        # bit_offset), ...)
+        if not components:
+            return None
+        return tuple(
+            ComponentField(
+                name=name, def_num=def_num, scale=scale, offset=offset,
+                units=units, accumulate=accumulate, bits=bits,
+                bit_offset=bit_offset)
+            for (name, def_num, scale, offset, units, accumulate, bits,
+                 bit_offset) in components)
+
+    def make_subfields(subfields):
+        # subfields: ((name, def_num, type, scale, offset, units, ref_fields,
+        # components), ...), where ref_fields: ((name, def_num, value,
+        # raw_value), ...)
+        if not subfields:
+            return None
+        return tuple(
+            SubField(
+                name=name, def_num=def_num, type=get_type(type_),
+                scale=scale, offset=offset, units=units,
+                components=make_components(components),
+                ref_fields=tuple(
+                    ReferenceField(*ref_field) for ref_field in ref_fields))
+            for (name, def_num, type_, scale, offset, units, ref_fields,
+                 components) in subfields)
+
+    mesg_name, field_entries = entry
+
+    fields = {}
+    for field_entry in field_entries:
+        if field_entry is None:
+            fields[timestamp_field.def_num] = timestamp_field
+            continue
+
+        (def_num, name, type_, scale, offset, units, components,
+         subfields) = field_entry
+
+        fields[def_num] = Field(
+            name=name, type=get_type(type_), def_num=def_num, scale=scale,
+            offset=offset, units=units,
+            components=make_components(components),
+            subfields=make_subfields(subfields))
+
+    return MessageType(name=mesg_name, mesg_num=mesg_num, fields=fields)
+
+
+_profile_paths = None  # {id(profile_object): path}, updated upon need
+_profile_paths_key = None
+
+
+def _get_profile_paths():
+    global _profile_paths, _profile_paths_key
+
+    from . import profile
+
+    # only the objects built so far can be pickled, so paths are updated as
+    # the profile gets built or written to
+    field_types = profile.FIELD_TYPES
+    mesg_types = profile.MESSAGE_TYPES
+    key = (
+        len(field_types._cache), len(mesg_types._cache),
+        field_types._writes, mesg_types._writes)
+
+    if _profile_paths_key != key:
+        # the objects set at runtime are pickled by value since they may not
+        # exist in the process they are unpickled in
+        field_types_changed = field_types._changed
+        mesg_types_changed = mesg_types._changed
+
+        paths = {}
+        for name, field_type in tuple(field_types._cache.items()):
+            if name not in field_types_changed:
+                paths[id(field_type)] = ('type', name)
+
+        for mesg_num, mesg_type in tuple(mesg_types._cache.items()):
+            if mesg_num in mesg_types_changed:
+                continue
+            paths[id(mesg_type)] = ('mesg', mesg_num)
+            for def_num, field in mesg_type.fields.items():
+                # some fields are shared by several messages
+                paths.setdefault(id(field), ('field', mesg_num, def_num))
+                for idx, sub_field in enumerate(field.subfields or ()):
+                    paths.setdefault(
+                        id(sub_field), ('subfield', mesg_num, def_num, idx))
+
+        _profile_paths = paths
+        _profile_paths_key = key
+
+    return _profile_paths
+
+
+def _get_profile_object(kind, *path):
+    from . import profile
+
+    if kind == 'type':
+        return profile.FIELD_TYPES[path[0]]
+
+    mesg_type = profile.MESSAGE_TYPES[path[0]]
+    if kind == 'mesg':
+        return mesg_type
+
+    field = mesg_type.fields[path[1]]
+    if kind == 'field':
+        return field
+
+    return field.subfields[path[2]]
+
+
+def _make_field_data(field_def, field, parent_field, value, raw_value, units):
+    field_data = FieldData.__new__(FieldData)
+    field_data.field_def = field_def
+    field_data.field = field
+    field_data.parent_field = parent_field
+    field_data.value = value
+    field_data.raw_value = raw_value
+    field_data.units = units
+    return field_data
+
+
+def _get_base_type(identifier):
+    return BASE_TYPES[identifier]
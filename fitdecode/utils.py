@@ -1,7 +1,10 @@
 # Copyright (c) Jean-Charles Lefebvre
 # SPDX-License-Identifier: MIT
 
+import array
 import re
+import selectors
+import sys
 import time
 
 from . import profile
@@ -21,6 +24,33 @@ CRC_TABLE = (
     0xa001, 0x6c00, 0x7800, 0xb401, 0x5000, 0x9c01, 0x8801, 0x4400)
 
 
+def _make_crc_byte_table():
+    # Derive the CRC of every single byte value from the nibble-based
+    # CRC_TABLE, as per FIT definition
+    table = []
+    for byte in range(256):
+        crc = CRC_START
+        for nibble in (byte & 0xf, byte >> 4):
+            tmp = CRC_TABLE[crc & 0xf]
+            crc = (crc >> 4) & 0x0fff
+            crc = crc ^ tmp ^ CRC_TABLE[nibble]
+        table.append(crc)
+    return tuple(table)
+
+
+#: 256-entry table to compute the CRC one byte at a time
+CRC_BYTE_TABLE = _make_crc_byte_table()
+
+#: inputs of at least this size are processed two bytes at a time
+CRC_WORD_THRESHOLD = 64
+
+_crc_word_table = None  # 65536-entry table, built upon first need
+
+# {mesg_num: (mesg_type, (fields_by_name, fields_by_subfield_name))}, see
+# _get_field_indexes()
+_field_indexes = {}
+
+
 def scrub_method_name(method_name, convert_units=False):
     """Create a valid Python name out of *method_name*"""
     if convert_units:
@@ -43,11 +73,11 @@ def get_mesg_type(mesg_name_or_num):
     except KeyError:
         pass
 
-    for mesg_type in profile.MESSAGE_TYPES.values():
-        if mesg_name_or_num == mesg_type.name:
-            return mesg_type
+    mesg_num = _find_mesg_num(mesg_name_or_num)
+    if mesg_num is None:
+        raise ValueError(f'message type "{mesg_name_or_num}" not found')
 
-    raise ValueError(f'message type "{mesg_name_or_num}" not found')
+    return profile.MESSAGE_TYPES[mesg_num]
 
 
 def get_mesg_num(mesg_name):
@@ -56,28 +86,39 @@ def get_mesg_num(mesg_name):
 
     Raise `ValueError` if type was not found.
     """
-    for mesg_type in profile.MESSAGE_TYPES.values():
-        if mesg_name == mesg_type.name:
-            return mesg_type.mesg_num
+    mesg_num = _find_mesg_num(mesg_name)
+    if mesg_num is None:
+        raise ValueError(f'message type "{mesg_name}" not found')
 
-    raise ValueError(f'message type "{mesg_name}" not found')
+    return mesg_num
 
 
-def get_mesg_field(mesg_name_or_num, field_name_or_num):
+def get_mesg_field(mesg_name_or_num, field_name_or_num, *, subfields=False):
     """
     Get the :class:`fitdecode.types.Field` object of a particular field from a
     particular message.
 
+    If *subfields* is true, *field_name_or_num* can also be the name of a
+    subfield, in which case the field it belongs to is returned.
+
     Raise `ValueError` if message or field was not found.
     """
     mesg_type = get_mesg_type(mesg_name_or_num)
-    for field in mesg_type.fields:
-        if field_name_or_num in (field.def_num, field.name):
-            return field
 
-    raise ValueError(
-        f'field "{field_name_or_num}" not found in '
-        f'message "{mesg_name_or_num}"')
+    field = mesg_type.fields.get(field_name_or_num)
+    if field is None:
+        fields_by_name, fields_by_subfield_name = \
+            _get_field_indexes(mesg_type)
+        field = fields_by_name.get(field_name_or_num)
+        if field is None and subfields:
+            field = fields_by_subfield_name.get(field_name_or_num)
+
+    if field is None:
+        raise ValueError(
+            f'field "{field_name_or_num}" not found in '
+            f'message "{mesg_name_or_num}"')
+
+    return field
 
 
 def get_mesg_field_num(mesg_name_or_num, field_name):
@@ -87,12 +128,13 @@ def get_mesg_field_num(mesg_name_or_num, field_name):
     Raise `ValueError` if message or field was not found.
     """
     mesg_type = get_mesg_type(mesg_name_or_num)
-    for field in mesg_type.fields:
-        if field.name == field_name:
-            return field.def_num
 
-    raise ValueError(
-        f'field "{field_name}" not found in message "{mesg_name_or_num}"')
+    field = _get_field_indexes(mesg_type)[0].get(field_name)
+    if field is None:
+        raise ValueError(
+            f'field "{field_name}" not found in message "{mesg_name_or_num}"')
+
+    return field.def_num
 
 
 def get_field_type(field_name):
@@ -102,7 +144,7 @@ def get_field_type(field_name):
     Raise `ValueError` if type was not found.
     """
     try:
-        return profile.FIELD_TYPE[field_name]
+        return profile.FIELD_TYPES[field_name]
     except KeyError:
         raise ValueError(f'field type "{field_name}" not found')
 
@@ -130,19 +172,163 @@ def compute_crc(byteslike, *, crc=CRC_START, start=0, end=None):
     #        byte = byteslike[idx]
     #        # ...
 
-    for byte in memoryview(byteslike)[start:end]:
-        tmp = CRC_TABLE[crc & 0xf]
-        crc = (crc >> 4) & 0x0fff
-        crc = crc ^ tmp ^ CRC_TABLE[byte & 0xf]
+    view = memoryview(byteslike)[start:end]
+    table = CRC_BYTE_TABLE
+
+    # "slicing-by-2": the CRC being 16-bit wide, two input bytes entirely
+    # replace it, so each step is a single lookup in a table indexed by the
+    # XOR of the CRC and the next little-endian 16-bit word
+    if len(view) >= CRC_WORD_THRESHOLD:
+        words_len = len(view) & ~1
+        words = array.array('H')
+        words.frombytes(view[:words_len])
+        if sys.byteorder != 'little':
+            words.byteswap()
+
+        word_table = _get_crc_word_table()
+        for word in words:
+            crc = word_table[crc ^ word]
+
+        view = view[words_len:]
 
-        tmp = CRC_TABLE[crc & 0xf]
-        crc = (crc >> 4) & 0x0fff
-        crc = crc ^ tmp ^ CRC_TABLE[(byte >> 4) & 0xf]
+    for byte in view:
+        crc = (crc >> 8) ^ table[(crc ^ byte) & 0xff]
 
     return crc
 
 
-def blocking_read(istream, size=-1, nonblocking_reads_delay=0.06):
+def _find_mesg_num(mesg_name):
+    # Get the global number of a profile message by its name, or None.
+    # MESSAGE_NUMS only indexes the messages the profile was generated with,
+    # so the ones registered or replaced at runtime are looked up by hand.
+    changed_nums = profile.MESSAGE_TYPES.changed_keys()
+
+    mesg_num = profile.MESSAGE_NUMS.get(mesg_name)
+    if (mesg_num is not None and
+            mesg_num not in changed_nums and
+            mesg_num in profile.MESSAGE_TYPES):
+        return mesg_num
+
+    for mesg_num in sorted(changed_nums):
+        if profile.MESSAGE_TYPES[mesg_num].name == mesg_name:
+            return mesg_num
+
+    return None
+
+
+def _get_field_indexes(mesg_type):
+    # Get the ({field_name: field}, {subfield_name: field}) indexes of the
+    # fields of a profile message, built upon first need
+    try:
+        indexed_type, indexes = _field_indexes[mesg_type.mesg_num]
+    except KeyError:
+        pass
+    else:
+        # the message type may have been replaced at runtime
+        if indexed_type is mesg_type:
+            return indexes
+
+    fields_by_name = {}
+    fields_by_subfield_name = {}
+    for field in mesg_type.fields.values():
+        fields_by_name.setdefault(field.name, field)
+        for sub_field in field.subfields or ():
+            fields_by_subfield_name.setdefault(sub_field.name, field)
+
+    indexes = (fields_by_name, fields_by_subfield_name)
+    _field_indexes[mesg_type.mesg_num] = (mesg_type, indexes)
+
+    return indexes
+
+
+def _get_crc_word_table():
+    global _crc_word_table
+
+    if _crc_word_table is None:
+        table = CRC_BYTE_TABLE
+        _crc_word_table = tuple(
+            (table[x & 0xff] >> 8) ^ table[(table[x & 0xff] ^ (x >> 8)) & 0xff]
+            for x in range(0x10000))
+
+    return _crc_word_table
+
+
+def wait_readable(istream, timeout=None, selector=None):
+    """
+    Wait for the non-blocking *istream* to have data to be read (or to reach
+    EOF), by selecting its file descriptor (``fileno()`` method) with the
+    `selectors` module. *timeout* is in seconds, `None` to wait indefinitely.
+
+    *selector* can be a `selectors.BaseSelector` object to which *istream* is
+    registered already for `selectors.EVENT_READ`, so that it is reused from
+    one wait to another. Otherwise, a selector is created for this wait only.
+
+    Return `False` immediately if *istream* cannot be selected. For instance
+    if it has no file descriptor, or if it is a pipe on Windows. `True`
+    otherwise.
+    """
+    try:
+        if selector is not None:
+            selector.select(timeout)
+        else:
+            fileno = istream.fileno()
+            with selectors.DefaultSelector() as selector:
+                selector.register(fileno, selectors.EVENT_READ)
+                selector.select(timeout)
+    except (AttributeError, OSError, ValueError):
+        return False
+
+    return True
+
+
+def read_ahead(istream, min_size, max_size, nonblocking_reads_delay=0.06,
+               use_selector=True, selector=None):
+    """
+    Read from *istream* and do not return until at least *min_size* `bytes`
+    have been read unless EOF has been reached. No more than *max_size* `bytes`
+    are read.
+
+    Unlike `blocking_read`, this function prefers the ``read1()`` method of
+    *istream* if available so that it does not wait for *max_size* `bytes` to
+    be available in the case of a pipe or a socket for instance.
+
+    Return all the data read so far as a `bytes` object. The length of the
+    returned data may be less than *min_size* in case EOF has been reached.
+
+    *nonblocking_reads_delay*, *use_selector* and *selector* have the same
+    meaning than for `blocking_read`.
+    """
+    assert 0 < min_size <= max_size
+
+    read = getattr(istream, 'read1', None) or istream.read
+    output = []
+    len_read = 0
+
+    while len_read < min_size:
+        try:
+            chunk = read(max_size - len_read)
+        except BlockingIOError:
+            chunk = None
+
+        if chunk is None:
+            # non-blocking stream and no data available yet
+            if not use_selector or not wait_readable(
+                    istream, selector=selector):
+                time.sleep(nonblocking_reads_delay)
+        elif not chunk:
+            break
+        else:
+            output.append(chunk)
+            len_read += len(chunk)
+
+    if len(output) == 1:
+        return bytes(output[0])
+
+    return b''.join(output)
+
+
+def blocking_read(istream, size=-1, nonblocking_reads_delay=0.06,
+                  use_selector=True, selector=None):
     """
     Read from *istream* and do not return until *size* `bytes` have been read
     unless EOF has been reached.
@@ -150,9 +336,11 @@ def blocking_read(istream, size=-1, nonblocking_reads_delay=0.06):
     Return all the data read so far. The length of the returned data may still
     be less than *size* in case EOF has been reached.
 
-    *nonblocking_reads_delay* specifies the number of seconds (float) to wait
-    before trying to read from *istream* again in case `BlockingIOError` has
-    been raised during previous call.
+    In case *istream* is non-blocking and has no data available, this function
+    waits until it has, with `wait_readable` if *use_selector* is true. If
+    *istream* cannot be selected, or if *use_selector* is false, it sleeps for
+    *nonblocking_reads_delay* seconds (float) before trying to read again.
+    *selector* is passed to `wait_readable`.
     """
     assert size is None or (isinstance(size, int) and not isinstance(size, bool))
 
@@ -184,4 +372,6 @@ def blocking_read(istream, size=-1, nonblocking_reads_delay=0.06):
                 if len_read >= size:
                     return _join()
         except BlockingIOError:
-            time.sleep(nonblocking_reads_delay)
+            if not use_selector or not wait_readable(
+                    istream, selector=selector):
+                time.sleep(nonblocking_reads_delay)
@@ -2,13 +2,23 @@
 # Copyright (c) Jean-Charles Lefebvre
 # SPDX-License-Identifier: MIT
 
+import array
+import asyncio
 import csv
 import datetime
 import glob
 import hashlib
+import io
+import itertools
 import os.path
+import pickle
 import struct
+import tempfile
+import threading
+import time
 import unittest
+import unittest.mock
+import warnings
 
 import fitdecode
 
@@ -90,8 +100,64 @@ def _generate_fitfile(data=None, endian='<'):
         struct.pack('<H', fitdecode.utils.compute_crc(file_data))
 
 
+class _FailingDataProcessor(fitdecode.DataProcessorBase):
+    # fails upon the first data message, picklable for worker processes
+    def on_process_message(self, reader, data_message):
+        raise RuntimeError('data processor failure')
+
+
+class _UnpicklableError(Exception):
+    # cannot be unpickled since its constructor requires two arguments
+    def __init__(self, message, code):
+        super().__init__(message)
+        self.code = code
+
+
+class _UnpicklableErrorDataProcessor(fitdecode.DataProcessorBase):
+    # fails upon the first data message with an exception that does not
+    # survive its transfer from a worker process
+    def on_process_message(self, reader, data_message):
+        raise _UnpicklableError('data processor failure', 1)
+
+
+class _UnpicklableValueDataProcessor(fitdecode.DataProcessorBase):
+    # stores values that cannot be pickled by a worker process
+    def on_process_message(self, reader, data_message):
+        for field_data in data_message.fields:
+            field_data.value = lambda: None
+
+
 class FitReaderTestCase(unittest.TestCase):
 
+    def test_compute_crc(self):
+        def _nibble_crc(byteslike, crc=fitdecode.utils.CRC_START):
+            # reference implementation, as per FIT SDK
+            crc_table = fitdecode.utils.CRC_TABLE
+            for byte in byteslike:
+                tmp = crc_table[crc & 0xf]
+                crc = (crc >> 4) & 0x0fff
+                crc = crc ^ tmp ^ crc_table[byte & 0xf]
+
+                tmp = crc_table[crc & 0xf]
+                crc = (crc >> 4) & 0x0fff
+                crc = crc ^ tmp ^ crc_table[(byte >> 4) & 0xf]
+            return crc
+
+        data = bytes(range(256)) + os.urandom(1021)
+        for size in (1, 2, 3, 63, 64, 65, 256, len(data)):
+            expected = _nibble_crc(data[:size])
+            self.assertEqual(fitdecode.utils.compute_crc(data[:size]), expected)
+            self.assertEqual(
+                fitdecode.utils.compute_crc(bytearray(data[:size])), expected)
+
+        # chained computation and start/end offsets
+        crc = fitdecode.utils.compute_crc(data, end=100)
+        crc = fitdecode.utils.compute_crc(data, crc=crc, start=100, end=1001)
+        self.assertEqual(crc, _nibble_crc(data[:1001]))
+        self.assertEqual(
+            fitdecode.utils.compute_crc(data, start=7, end=777),
+            _nibble_crc(data[7:777]))
+
     def test_raw_chunk_parsing(self):
         """
         Test that FitReader parses correctly all our "valid" test files by
@@ -136,6 +202,900 @@ class FitReaderTestCase(unittest.TestCase):
             # compare checksums
             self.assertEqual(h1.digest(), h2.digest())
 
+    def test_block_size(self):
+        src_file = _test_file('activity-settings.fit')
+
+        def _read(block_size):
+            with open(src_file, mode='rb') as fin:
+                with fitdecode.FitReader(
+                        fin,
+                        check_crc=fitdecode.CrcCheck.RAISE,
+                        keep_raw_chunks=True,
+                        block_size=block_size) as fit:
+                    return [
+                        (frame.chunk.index, frame.chunk.offset,
+                         frame.chunk.bytes)
+                        for frame in fit]
+
+        expected = _read(fitdecode.reader.DEFAULT_BLOCK_SIZE)
+        with open(src_file, mode='rb') as fin:
+            self.assertEqual(b''.join(x[2] for x in expected), fin.read())
+
+        for block_size in (0, 1, 7, 512):
+            self.assertEqual(_read(block_size), expected)
+
+    def test_mmap(self):
+        for src_file in glob.iglob(os.path.join(TEST_FILES_DIR, '*.fit')):
+            frames = {}
+            for use_mmap in (False, True):
+                with fitdecode.FitReader(
+                        src_file,
+                        check_crc=fitdecode.CrcCheck.RAISE,
+                        keep_raw_chunks=True,
+                        use_mmap=use_mmap) as fit:
+                    chunks = [frame.chunk for frame in fit]
+
+                    if use_mmap:
+                        self.assertIsNotNone(fit._mmap)
+
+                # kept chunks are slices of the mapping, which they keep alive
+                # once the reader is closed
+                self.assertTrue(all(
+                    type(chunk.bytes) is (bytes, memoryview)[use_mmap]
+                    for chunk in chunks))
+                frames[use_mmap] = [
+                    (chunk.offset, bytes(chunk.bytes)) for chunk in chunks]
+
+                unpickled = pickle.loads(pickle.dumps(chunks))
+                self.assertEqual(
+                    [(chunk.offset, chunk.bytes) for chunk in unpickled],
+                    frames[use_mmap])
+
+            self.assertEqual(frames[True], frames[False])
+
+        # the source cannot be mapped: fall back to regular reads
+        fit = tuple(fitdecode.FitReader(
+            _generate_fitfile(),
+            check_crc=fitdecode.CrcCheck.RAISE,
+            use_mmap=True))
+        self.assertEqual(fit[2].name, 'file_id')
+
+    def test_mesgs_filtering(self):
+        def _data_mesgs(src_file, **kwargs):
+            with fitdecode.FitReader(
+                    _test_file(src_file),
+                    check_crc=fitdecode.CrcCheck.RAISE, **kwargs) as fit:
+                return [
+                    (frame.name,
+                     [(f.name, f.value, f.raw_value) for f in frame.fields])
+                    for frame in fit
+                    if frame.frame_type == fitdecode.FIT_FRAME_DATA]
+
+        for src_file in (
+                'activity-large-fenxi2-multisport.fit',
+                'compressed-speed-distance.fit',
+                'event_timestamp.fit'):
+            all_mesgs = _data_mesgs(src_file)
+
+            mesgs = _data_mesgs(
+                src_file, include_mesgs=('session', 'lap', 0))
+            self.assertEqual(mesgs, [
+                mesg for mesg in all_mesgs
+                if mesg[0] in ('session', 'lap', 'file_id')])
+
+            mesgs = _data_mesgs(src_file, exclude_mesgs=['record', 'event'])
+            self.assertEqual(mesgs, [
+                mesg for mesg in all_mesgs
+                if mesg[0] not in ('record', 'event')])
+
+        with self.assertRaises(ValueError):
+            fitdecode.FitReader(
+                _generate_fitfile(), include_mesgs=['not_a_message'])
+
+    def test_seek_skip_strategy(self):
+        class _Stream(io.BytesIO):
+            def __init__(self, initial_bytes, seekable):
+                super().__init__(initial_bytes)
+                self.is_seekable = seekable
+                self.seeks = 0
+                self.bytes_read = 0
+
+            def seekable(self):
+                return self.is_seekable
+
+            def seek(self, *args):
+                self.seeks += 1
+                return super().seek(*args)
+
+            def read(self, *args):
+                data = super().read(*args)
+                self.bytes_read += len(data)
+                return data
+
+            def read1(self, *args):
+                data = super().read1(*args)
+                self.bytes_read += len(data)
+                return data
+
+        def _data_mesgs(stream, include_mesgs, **kwargs):
+            with fitdecode.FitReader(
+                    stream, check_crc=fitdecode.CrcCheck.DISABLED,
+                    include_mesgs=include_mesgs, **kwargs) as fit:
+                return [
+                    (frame.name, [(f.name, f.value) for f in frame.fields])
+                    for frame in fit
+                    if frame.frame_type == fitdecode.FIT_FRAME_DATA]
+
+        def _check(content, include_mesgs, block_size, min_skipped_size):
+            expected = _data_mesgs(io.BytesIO(content), include_mesgs)
+            self.assertTrue(expected)
+
+            for seekable in (True, False):
+                stream = _Stream(content, seekable)
+                stream.seek(0)
+                stream.seeks = 0
+                self.assertEqual(
+                    _data_mesgs(
+                        stream, include_mesgs, block_size=block_size,
+                        skip_strategy=fitdecode.SkipStrategy.SEEK),
+                    expected)
+                if seekable:
+                    self.assertGreater(stream.seeks, 0)
+                    self.assertLessEqual(
+                        stream.bytes_read, len(content) - min_skipped_size)
+                else:
+                    self.assertEqual(stream.seeks, 0)
+                    self.assertEqual(stream.bytes_read, len(content))
+
+        # small messages are seeked over with a small block size only
+        with open(_test_file('activity-large-fenxi2-multisport.fit'), 'rb') as fin:
+            content = fin.read()
+        _check(
+            content, ['session', 'lap', 'device_info'], 16, len(content) // 2)
+
+        # large messages are seeked over with the default block size: 20
+        # messages of 200 fields of 255 bytes, with a compressed timestamp
+        # header, followed by an event which time depends on them
+        big_mesgs = [
+            struct.pack('<BxBHB', 0x41, 0, 0xff00, 200),
+            b''.join(
+                struct.pack('<3B', def_num, 255, 0x0d)
+                for def_num in range(200))]
+        for idx in range(20):
+            big_mesgs.append(struct.pack('<B', 0xa0 | ((idx * 7) & 0x1f)))
+            big_mesgs.append(bytes((idx, )) * 200 * 255)
+        big_mesgs.append(_generate_messages(
+            mesg_num=21, local_mesg_num=2, field_defs=[(0, 'enum')]))
+        big_mesgs.append(struct.pack('<2B', 0xc0 | 25, 0))
+        content = _generate_fitfile(b''.join(big_mesgs))
+        self.assertEqual(
+            _data_mesgs(io.BytesIO(content), ['event'])[0][1][-1],
+            ('timestamp', 153))
+        _check(
+            content, ['file_id', 'event'],
+            fitdecode.reader.DEFAULT_BLOCK_SIZE, 5 * 200 * 255)
+
+    def test_fields_projection(self):
+        def _data_mesgs(src_file, names=None, mesg='record', **kwargs):
+            with fitdecode.FitReader(
+                    src_file, check_crc=fitdecode.CrcCheck.RAISE,
+                    **kwargs) as fit:
+                return [
+                    (frame.name,
+                     [(f.name, f.value, f.raw_value) for f in frame.fields
+                      if names is None or frame.name != mesg or
+                      any(f.is_named(name) for name in names)])
+                    for frame in fit
+                    if frame.frame_type == fitdecode.FIT_FRAME_DATA]
+
+        for src_file, mesg, names in (
+                ('garmin-fenix-5-bike.fit', 'record', (
+                    'timestamp', 'heart_rate', 'position_lat',
+                    'position_long')),
+                # speed and distance are components of compressed_speed_distance
+                ('compressed-speed-distance.fit', 'record', (
+                    'timestamp', 'heart_rate', 'speed', 'distance')),
+                # enhanced_speed is a component of speed
+                ('garmin-edge-820-bike.fit', 'record', (
+                    'enhanced_speed', 'power')),
+                # timer_trigger is a subfield of data, which is not emitted
+                # when it does not resolve to timer_trigger
+                ('2015-10-13-08-43-15.fit', 'event', ('timer_trigger', )),
+                ('2015-10-13-08-43-15.fit', 'event', ('timer_trigger', 'data')),
+                # the reader depends on these messages, which are decoded in
+                # full, then projected
+                ('developer-types-sample.fit', 'field_description', (
+                    'field_name', 'units')),
+                ('developer-types-sample.fit', 'developer_data_id', (
+                    'application_id', ))):
+            src_file = _test_file(src_file)
+            with warnings.catch_warnings():
+                warnings.simplefilter('error')
+                self.assertEqual(
+                    _data_mesgs(src_file, mesg=mesg, fields={mesg: names}),
+                    _data_mesgs(src_file, names, mesg=mesg))
+
+        # subfield names and definition numbers
+        fit_data = _generate_fitfile()
+        file_id = _data_mesgs(
+            fit_data, fields={0: ['garmin_product', 1]})[0][1]
+        self.assertEqual(
+            file_id, [('manufacturer', 'garmin', 1),
+                      ('garmin_product', 'edge500', 1036)])
+
+    def test_scanner(self):
+        for src_file in glob.iglob(os.path.join(TEST_FILES_DIR, '*.fit')):
+            with fitdecode.FitReader(
+                    src_file, processor=None, keep_raw_chunks=True) as fit:
+                expected = []
+                for frame in fit:
+                    if frame.frame_type in (
+                            fitdecode.FIT_FRAME_DEFINITION,
+                            fitdecode.FIT_FRAME_DATA):
+                        mesg_nums = (frame.local_mesg_num, frame.global_mesg_num)
+                    else:
+                        mesg_nums = (None, None)
+
+                    expected.append((
+                        frame.frame_type, frame.chunk.offset,
+                        len(frame.chunk.bytes)) + mesg_nums)
+
+            for kwargs in (
+                    {},
+                    {'block_size': 0},
+                    {'use_mmap': True},
+                    {'check_crc': fitdecode.CrcCheck.RAISE}):
+                with fitdecode.FitScanner(src_file, **kwargs) as scanner:
+                    self.assertEqual(list(scanner), expected)
+
+        with self.assertRaises(fitdecode.FitEOFError):
+            tuple(fitdecode.FitScanner(
+                _invalid_test_file('activity-unexpected-eof.fit')))
+
+        with self.assertRaises(fitdecode.FitCRCError):
+            tuple(fitdecode.FitScanner(
+                _invalid_test_file('activity-filecrc.fit'),
+                check_crc=fitdecode.CrcCheck.RAISE))
+
+    def test_index(self):
+        def _read_data_messages(fileish, **kwargs):
+            data_messages = []
+            with fitdecode.FitReader(
+                    fileish, check_crc=fitdecode.CrcCheck.RAISE) as fit:
+                if kwargs:
+                    fit.jump_to(index, **kwargs)
+                for frame in fit:
+                    if frame.frame_type == fitdecode.FIT_FRAME_DATA:
+                        data_messages.append((
+                            fit._compressed_ts_accumulator, frame.name,
+                            [(field.name, field.value)
+                             for field in frame.fields]))
+            return data_messages
+
+        for name in (
+                'compressed-speed-distance.fit',
+                'developer-types-sample.fit',
+                'event_timestamp.fit'):
+            with open(_test_file(name), 'rb') as fd:
+                data = fd.read()
+
+            files_count = len(fitdecode.FitIndex.build(io.BytesIO(data)).files)
+
+            # chained FIT files
+            data += data
+
+            index = fitdecode.FitIndex.build(io.BytesIO(data), interval=50)
+            self.assertEqual(len(index.files), 2 * files_count)
+            self.assertEqual(index.files[files_count].offset, len(data) // 2)
+
+            # save/load round trip
+            sidecar = io.BytesIO()
+            index.save(sidecar)
+            sidecar.seek(0)
+            loaded_index = fitdecode.FitIndex.load(sidecar)
+            self.assertEqual(loaded_index.files, index.files)
+            self.assertEqual(loaded_index.checkpoints, index.checkpoints)
+            index = loaded_index
+
+            expected = _read_data_messages(io.BytesIO(data))
+            for mesg_index in (
+                    0, 49, 50, 51, len(expected) // 2, len(expected) - 1,
+                    len(expected)):
+                self.assertEqual(
+                    _read_data_messages(
+                        io.BytesIO(data), mesg_index=mesg_index),
+                    expected[mesg_index:])
+
+            for mesg_index in (10, 200, len(expected) // 2 + 100):
+                timestamp = expected[mesg_index][0]
+                first_index = next(
+                    idx for idx, mesg in enumerate(expected)
+                    if mesg[0] >= timestamp)
+                self.assertEqual(
+                    _read_data_messages(io.BytesIO(data), timestamp=timestamp),
+                    expected[first_index:])
+                self.assertEqual(
+                    _read_data_messages(
+                        io.BytesIO(data), timestamp=_secs_to_dt(timestamp)),
+                    expected[first_index:])
+
+        with self.assertRaises(ValueError):
+            fitdecode.FitIndex.load(io.BytesIO(b'.FIT'))
+
+        # truncated and corrupted index files
+        sidecar = io.BytesIO()
+        index.save(sidecar)
+        sidecar = sidecar.getvalue()
+        for data in (
+                sidecar[:len(sidecar) // 2],
+                sidecar[:-1],
+                sidecar[:64] + bytes(len(sidecar) - 64),
+                sidecar[:64] + b'\xff' * (len(sidecar) - 64)):
+            with self.assertRaises(ValueError):
+                fitdecode.FitIndex.load(io.BytesIO(data))
+
+        # well-formed but inconsistent index file
+        data = bytearray(fitdecode.index._INDEX_HEADER.pack(
+            fitdecode.index._INDEX_MAGIC, fitdecode.index._INDEX_VERSION))
+        fitdecode.index._pack_value(data, (50, 0, ((1, 2), ), ((3, ), )))
+        with self.assertRaises(ValueError):
+            fitdecode.FitIndex.load(io.BytesIO(data))
+
+        # sidecar file
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            sidecar_path = os.path.join(tmp_dir, 'file.fit.fitidx')
+            index = fitdecode.FitIndex.load_or_build(
+                _test_file('activity-settings.fit'), sidecar_path=sidecar_path)
+            self.assertTrue(os.path.exists(sidecar_path))
+            self.assertEqual(
+                fitdecode.FitIndex.load_or_build(
+                    _test_file('activity-settings.fit'),
+                    sidecar_path=sidecar_path).checkpoints,
+                index.checkpoints)
+
+            # sidecar file that cannot be written
+            self.assertEqual(
+                fitdecode.FitIndex.load_or_build(
+                    _test_file('activity-settings.fit'),
+                    sidecar_path=os.path.join(
+                        tmp_dir, 'missing', 'file.fit.fitidx')).checkpoints,
+                index.checkpoints)
+
+        for name in ('processor', 'include_mesgs', 'exclude_mesgs'):
+            with self.assertRaises(TypeError):
+                fitdecode.FitIndex.build(
+                    _test_file('activity-settings.fit'), **{name: None})
+
+        # a corrupted sidecar file is rebuilt
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            sidecar_path = os.path.join(tmp_dir, 'file.fit.fitidx')
+            index = fitdecode.FitIndex.load_or_build(
+                _test_file('activity-settings.fit'), sidecar_path=sidecar_path)
+            with open(sidecar_path, mode='r+b') as fd:
+                fd.seek(64)
+                fd.write(b'\xff' * 64)
+            self.assertEqual(
+                fitdecode.FitIndex.load_or_build(
+                    _test_file('activity-settings.fit'),
+                    sidecar_path=sidecar_path).checkpoints,
+                index.checkpoints)
+
+    def test_iter_range(self):
+        for name in ('compressed-speed-distance.fit', 'event_timestamp.fit'):
+            src_file = _test_file(name)
+
+            expected = []
+            with fitdecode.FitReader(src_file) as fit:
+                for frame in fit:
+                    if frame.frame_type == fitdecode.FIT_FRAME_DATA:
+                        expected.append((
+                            fit._compressed_ts_accumulator, frame.name,
+                            [(field.name, field.value)
+                             for field in frame.fields]))
+
+            index = fitdecode.FitIndex.build(src_file, interval=20)
+
+            timestamps = sorted(set(mesg[0] for mesg in expected))
+            with fitdecode.FitReader(src_file) as fit:
+                for start, end in (
+                        (0, timestamps[30]),
+                        (timestamps[100], timestamps[130]),
+                        (timestamps[-50] + 1, timestamps[-20]),
+                        (timestamps[len(timestamps) // 2], None)):
+                    data_messages = [
+                        (fit._compressed_ts_accumulator, frame.name,
+                         [(field.name, field.value) for field in frame.fields])
+                        for frame in fit.iter_range(
+                            index, _secs_to_dt(start),
+                            None if end is None else _secs_to_dt(end))]
+
+                    self.assertTrue(data_messages)
+                    self.assertEqual(data_messages, [
+                        mesg for mesg in expected
+                        if mesg[0] >= start and (end is None or mesg[0] < end)])
+
+    def test_iter_range_filtered(self):
+        for name in (
+                'activity-large-fenxi2-multisport.fit', 'event_timestamp.fit',
+                'garmin-fenix-5-bike.fit'):
+            src_file = _test_file(name)
+            index = fitdecode.FitIndex.build(src_file, interval=7)
+
+            for include_mesgs in (['event'], ['lap'], ['hr'], ['record']):
+                expected = []
+                with fitdecode.FitReader(
+                        src_file, include_mesgs=include_mesgs) as fit:
+                    for frame in fit:
+                        if frame.frame_type == fitdecode.FIT_FRAME_DATA:
+                            expected.append((
+                                fit._compressed_ts_accumulator, frame.name,
+                                [(field.name, field.value)
+                                 for field in frame.fields]))
+
+                if not expected:
+                    continue
+
+                timestamps = sorted(set(mesg[0] for mesg in expected))
+                start = timestamps[0]
+                end = timestamps[-1]
+                if len(timestamps) > 2:
+                    start = timestamps[len(timestamps) // 3]
+
+                with fitdecode.FitReader(
+                        src_file, include_mesgs=include_mesgs) as fit:
+                    for start_, end_ in ((0, None), (start, end)):
+                        data_messages = [
+                            (fit._compressed_ts_accumulator, frame.name,
+                             [(field.name, field.value)
+                              for field in frame.fields])
+                            for frame in fit.iter_range(index, start_, end_)]
+
+                        self.assertEqual(data_messages, [
+                            mesg for mesg in expected
+                            if mesg[0] >= start_ and
+                            (end_ is None or mesg[0] < end_)])
+
+    def test_parallel(self):
+        def _frames_repr(frames):
+            return [
+                (type(frame).__name__, frame.chunk.index, frame.chunk.offset,
+                 bytes(frame.chunk.bytes),
+                 [(field.name, field.value, field.units)
+                  for field in frame.fields]
+                 if frame.frame_type == fitdecode.FIT_FRAME_DATA else None)
+                for frame in frames]
+
+        with open(_test_file('activity-settings.fit'), 'rb') as fd:
+            data = fd.read()
+        data = b'\x00' * 7 + data * 3
+
+        for fileish in (
+                _test_file('antfs-dump.63.fit'),
+                data[7:]):
+            with fitdecode.FitReader(fileish, keep_raw_chunks=True) as fit:
+                expected = _frames_repr(fit)
+
+            self.assertEqual(
+                _frames_repr(fitdecode.ParallelFitReader(
+                    fileish, workers=2, keep_raw_chunks=True)),
+                expected)
+
+        # file-like object not at the start of the stream
+        stream = io.BytesIO(data)
+        stream.seek(7)
+        with fitdecode.FitReader(stream, keep_raw_chunks=True) as fit:
+            expected = _frames_repr(fit)
+        stream.seek(7)
+        self.assertEqual(
+            _frames_repr(fitdecode.ParallelFitReader(
+                stream, workers=2, keep_raw_chunks=True)),
+            expected)
+
+        # FIT files split at the checkpoints of an index
+        for name in ('compressed-speed-distance.fit', 'event_timestamp.fit'):
+            src_file = _test_file(name)
+            with fitdecode.FitReader(
+                    src_file, keep_raw_chunks=True,
+                    check_crc=fitdecode.CrcCheck.RAISE) as fit:
+                expected = _frames_repr(fit)
+
+            index = fitdecode.FitIndex.build(src_file, interval=50)
+            for kwargs in ({}, {'use_mmap': True}):
+                self.assertEqual(
+                    _frames_repr(fitdecode.ParallelFitReader(
+                        src_file, workers=2, index=index,
+                        keep_raw_chunks=True,
+                        check_crc=fitdecode.CrcCheck.RAISE, **kwargs)),
+                    expected)
+
+        # filtered-out data messages do not make workers read past their
+        # segment
+        src_file = _test_file('event_timestamp.fit')
+        with fitdecode.FitReader(
+                src_file, keep_raw_chunks=True, include_mesgs=['event']) as fit:
+            expected = _frames_repr(fit)
+
+        index = fitdecode.FitIndex.build(src_file, interval=7)
+        self.assertEqual(
+            _frames_repr(fitdecode.ParallelFitReader(
+                src_file, workers=2, index=index, keep_raw_chunks=True,
+                include_mesgs=['event'])),
+            expected)
+
+        checkpoints = index.checkpoints
+        for checkpoint, next_checkpoint in zip(checkpoints, checkpoints[1:]):
+            with fitdecode.parallel._SegmentReader(
+                    src_file, include_mesgs=['event']) as reader:
+                for _ in reader._read_segment(
+                        index, checkpoint, False, next_checkpoint.offset):
+                    pass
+                self.assertEqual(reader._chunk_offset, next_checkpoint.offset)
+
+        with self.assertRaises(ValueError):
+            fitdecode.ParallelFitReader(data, index=index)
+
+        # frames and exceptions survive the trip between processes
+        self.assertEqual(
+            _frames_repr(pickle.loads(pickle.dumps(
+                list(fitdecode.FitReader(data[7:], keep_raw_chunks=True))))),
+            _frames_repr(fitdecode.FitReader(data[7:], keep_raw_chunks=True)))
+
+        frames = list(fitdecode.FitReader(
+            _test_file('developer-types-sample.fit'), keep_raw_chunks=True))
+        unpacked_frames = fitdecode.unpack_frames(pickle.loads(pickle.dumps(
+            fitdecode.pack_frames(frames))))
+        self.assertEqual(_frames_repr(unpacked_frames), _frames_repr(frames))
+        self.assertEqual(
+            [frame.def_mesg.global_mesg_num for frame in unpacked_frames
+             if frame.frame_type == fitdecode.FIT_FRAME_DATA],
+            [frame.def_mesg.global_mesg_num for frame in frames
+             if frame.frame_type == fitdecode.FIT_FRAME_DATA])
+
+        # frames are yielded up to the error
+        with open(_invalid_test_file('activity-unexpected-eof.fit'), 'rb') \
+                as fd:
+            data = data[7:] + fd.read()
+
+        frames_count = 0
+        with self.assertRaises(fitdecode.FitEOFError):
+            for _ in fitdecode.FitReader(data):
+                frames_count += 1
+
+        frames = []
+        with self.assertRaises(fitdecode.FitEOFError):
+            for frame in fitdecode.ParallelFitReader(data, workers=2):
+                frames.append(frame)
+        self.assertEqual(len(frames), frames_count)
+
+    def test_batch(self):
+        paths = [
+            _test_file('activity-settings.fit'),
+            _invalid_test_file('activity-unexpected-eof.fit'),
+            os.path.join(TEST_FILES_DIR, 'does-not-exist.fit'),
+            _test_file('event_timestamp.fit')]
+
+        for workers in (1, 2):
+            results = sorted(
+                fitdecode.batch.decode_files(
+                    paths, workers=workers,
+                    processor_factory=fitdecode.StandardUnitsDataProcessor,
+                    reader_kwargs={'check_crc': fitdecode.CrcCheck.RAISE}),
+                key=lambda result: result.index)
+
+            self.assertEqual(
+                [result.path for result in results], paths)
+            self.assertIsNone(results[0].error)
+            self.assertIsInstance(results[1].error, fitdecode.FitEOFError)
+            self.assertIsInstance(results[2].error, FileNotFoundError)
+            self.assertFalse(results[2].frames)
+            self.assertIsNone(results[3].error)
+
+            # any exception is reported by the result of its file
+            failed_results = list(fitdecode.batch.decode_files(
+                paths[:1] + paths[3:], workers=workers,
+                processor_factory=_FailingDataProcessor))
+            self.assertEqual(len(failed_results), 2)
+            for result in failed_results:
+                self.assertIsInstance(result.error, RuntimeError)
+
+            # an exception that cannot be transferred from a worker process is
+            # reported by its result as well
+            for processor_factory, error_type, frames_lost in (
+                    (_UnpicklableErrorDataProcessor,
+                     (_UnpicklableError, RuntimeError)[workers > 1], False),
+                    (_UnpicklableValueDataProcessor,
+                     (type(None), Exception)[workers > 1], workers > 1)):
+                failed_results = sorted(
+                    fitdecode.batch.decode_files(
+                        paths[:1] + paths[3:], workers=workers,
+                        processor_factory=processor_factory),
+                    key=lambda result: result.index)
+                self.assertEqual(
+                    [result.path for result in failed_results],
+                    paths[:1] + paths[3:])
+                for result in failed_results:
+                    self.assertIsInstance(result.error, error_type)
+                    self.assertEqual(not result.frames, frames_lost)
+
+            for result in (results[0], results[3]):
+                with fitdecode.FitReader(
+                        result.path,
+                        processor=fitdecode.StandardUnitsDataProcessor()) \
+                        as fit:
+                    expected = [
+                        [(field.name, field.value, field.units)
+                         for field in frame.fields]
+                        for frame in fit
+                        if frame.frame_type == fitdecode.FIT_FRAME_DATA]
+
+                self.assertEqual(
+                    [[(field.name, field.value, field.units)
+                      for field in frame.fields]
+                     for frame in result.frames
+                     if frame.frame_type == fitdecode.FIT_FRAME_DATA],
+                    expected)
+
+    def test_batch_columns(self):
+        paths = [
+            _test_file('activity-settings.fit'),
+            _invalid_test_file('activity-unexpected-eof.fit'),
+            _test_file('event_timestamp.fit')]
+        columns = {
+            'record': ('timestamp', 'heart_rate', 'position_lat'),
+            'event': ('event', 'timer_trigger')}
+
+        expected = []
+        for path in paths:
+            mesg_columns = {
+                key: {name: [] for name in names}
+                for key, names in columns.items()}
+            try:
+                for frame in fitdecode.FitReader(path):
+                    if (frame.frame_type == fitdecode.FIT_FRAME_DATA and
+                            frame.name in columns):
+                        for name, column in mesg_columns[frame.name].items():
+                            value = frame.get_value(name, fallback=None)
+                            if isinstance(value, datetime.datetime):
+                                value = value.timestamp()
+                            elif not isinstance(value, (int, float)):
+                                value = None
+                            column.append(value)
+            except fitdecode.FitError:
+                pass
+            expected.append(mesg_columns)
+
+        for workers in (1, 2):
+            results = {}
+            for result in fitdecode.batch.decode_columns(
+                    paths, columns, workers=workers):
+                with result:
+                    results[result.index] = (
+                        result.error,
+                        {key: {
+                            name: [
+                                None if value != value else value
+                                for value in column]
+                            for name, column in mesg_columns.items()}
+                         for key, mesg_columns in result.columns.items()})
+                self.assertEqual(result.columns, {})
+
+            self.assertIsNone(results[0][0])
+            self.assertIsInstance(results[1][0], fitdecode.FitEOFError)
+            self.assertIsNone(results[2][0])
+            self.assertEqual(
+                [results[idx][1] for idx in range(len(paths))], expected)
+
+            # any exception is reported by the result of its file
+            errors = []
+            for result in fitdecode.batch.decode_columns(
+                    paths, columns, workers=workers,
+                    processor_factory=_FailingDataProcessor):
+                with result:
+                    errors.append(result.error)
+            self.assertEqual(len(errors), len(paths))
+            for error in errors:
+                self.assertIsInstance(error, RuntimeError)
+
+            errors = []
+            for result in fitdecode.batch.decode_columns(
+                    paths, columns, workers=workers,
+                    processor_factory=_UnpicklableErrorDataProcessor):
+                with result:
+                    errors.append(result.error)
+                    self.assertEqual(
+                        {key: list(mesg_columns)
+                         for key, mesg_columns in result.columns.items()},
+                        {key: list(names) for key, names in columns.items()})
+            self.assertEqual(len(errors), len(paths))
+            for error in errors:
+                self.assertIsInstance(
+                    error, (_UnpicklableError, RuntimeError)[workers > 1])
+
+        # blocks kept open by their creator (Windows) are capped
+        transport = fitdecode.transport
+        descriptors = []
+        with unittest.mock.patch.object(transport.os, 'name', 'nt'):
+            try:
+                for value in range(5):
+                    descriptors.append(transport.share_columns(
+                        {'mesg': {'field': array.array('d', [value])}},
+                        keep_blocks=2))
+                    self.assertEqual(
+                        len(transport._owned_blocks), min(value + 1, 2))
+                self.assertEqual(
+                    [block.name for block in transport._owned_blocks],
+                    [descriptor[0] for descriptor in descriptors[-2:]])
+            finally:
+                while transport._owned_blocks:
+                    transport._owned_blocks.popleft().close()
+                for value, descriptor in enumerate(descriptors):
+                    with transport.SharedColumns(descriptor) as shared:
+                        self.assertEqual(
+                            shared.columns['mesg']['field'].tolist(), [value])
+
+    def test_decoder(self):
+        def _frames_repr(frames):
+            return [
+                (type(frame).__name__, frame.chunk.index, frame.chunk.offset,
+                 bytes(frame.chunk.bytes),
+                 [(field.name, field.value) for field in frame.fields]
+                 if frame.frame_type == fitdecode.FIT_FRAME_DATA else None)
+                for frame in frames]
+
+        def _decode(data, feed_size, **kwargs):
+            frames = []
+            decoder = fitdecode.FitDecoder(keep_raw_chunks=True, **kwargs)
+            for offset in range(0, len(data), feed_size):
+                frames.extend(decoder.feed(data[offset:offset + feed_size]))
+            decoder.end_of_stream()
+            return frames
+
+        with open(_test_file('activity-settings.fit'), 'rb') as fd:
+            data = fd.read()
+        with open(_test_file('developer-types-sample.fit'), 'rb') as fd:
+            data += fd.read()
+
+        for kwargs in ({}, {'include_mesgs': 'record'}):
+            with fitdecode.FitReader(
+                    data, keep_raw_chunks=True, **kwargs) as fit:
+                expected = _frames_repr(fit)
+
+            for feed_size in (1, 7, len(data)):
+                self.assertEqual(
+                    _frames_repr(_decode(data, feed_size, **kwargs)),
+                    expected)
+
+        # frames that precede an error are returned first
+        with open(_invalid_test_file('activity-filecrc.fit'), 'rb') as fd:
+            data = fd.read()
+
+        frames_count = 0
+        with self.assertRaises(fitdecode.FitCRCError):
+            for _ in fitdecode.FitReader(
+                    data, check_crc=fitdecode.CrcCheck.RAISE):
+                frames_count += 1
+
+        decoder = fitdecode.FitDecoder(check_crc=fitdecode.CrcCheck.RAISE)
+        self.assertEqual(len(decoder.feed(data)), frames_count)
+        with self.assertRaises(fitdecode.FitCRCError):
+            decoder.end_of_stream()
+
+        # truncated stream
+        with open(_invalid_test_file('activity-unexpected-eof.fit'), 'rb') \
+                as fd:
+            data = fd.read()
+        with self.assertRaises(fitdecode.FitEOFError):
+            _decode(data, 100)
+
+    def test_async_reader(self):
+        async def _read_frames(stream, **kwargs):
+            frames = []
+            async with fitdecode.AsyncFitReader(
+                    stream, keep_raw_chunks=True, **kwargs) as fit:
+                async for frame in fit:
+                    frames.append(frame)
+            return frames
+
+        async def _read_frames_from_socket(data, **kwargs):
+            async def _serve(reader, writer):
+                for offset in range(0, len(data), 100):
+                    writer.write(data[offset:offset + 100])
+                    await writer.drain()
+                writer.close()
+
+            server = await asyncio.start_server(_serve, '127.0.0.1', 0)
+            try:
+                port = server.sockets[0].getsockname()[1]
+                reader, writer = await asyncio.open_connection(
+                    '127.0.0.1', port)
+                try:
+                    return await _read_frames(reader, **kwargs)
+                finally:
+                    writer.close()
+            finally:
+                server.close()
+                await server.wait_closed()
+
+        class _AsyncBytesIO:
+            def __init__(self, data):
+                self._stream = io.BytesIO(data)
+
+            async def read(self, size):
+                return self._stream.read(min(size, 3))
+
+        with open(_test_file('activity-settings.fit'), 'rb') as fd:
+            data = fd.read()
+        with open(_test_file('developer-types-sample.fit'), 'rb') as fd:
+            data += fd.read()
+
+        expected = [
+            (frame.frame_type, frame.chunk.offset, bytes(frame.chunk.bytes))
+            for frame in fitdecode.FitReader(data, keep_raw_chunks=True)]
+
+        for frames in (
+                asyncio.run(_read_frames_from_socket(data)),
+                asyncio.run(_read_frames_from_socket(data, block_size=5)),
+                asyncio.run(_read_frames(_AsyncBytesIO(data)))):
+            self.assertEqual(
+                [(frame.frame_type, frame.chunk.offset,
+                  bytes(frame.chunk.bytes)) for frame in frames],
+                expected)
+
+        with open(_invalid_test_file('activity-unexpected-eof.fit'), 'rb') \
+                as fd:
+            data = fd.read()
+        with self.assertRaises(fitdecode.FitEOFError):
+            asyncio.run(_read_frames_from_socket(data))
+
+    @unittest.skipIf(os.name == 'nt', 'non-blocking pipes')
+    def test_nonblocking_stream(self):
+        with open(_test_file('activity-settings.fit'), 'rb') as fd:
+            data = fd.read()
+
+        expected = [
+            (frame.frame_type, bytes(frame.chunk.bytes))
+            for frame in fitdecode.FitReader(data, keep_raw_chunks=True)]
+
+        def _write(fileno):
+            with open(fileno, mode='wb', buffering=0) as fd:
+                for offset in range(0, len(data), 200):
+                    time.sleep(0.005)
+                    fd.write(data[offset:offset + 200])
+
+        expected_scan = list(fitdecode.FitScanner(data))
+
+        for wait_strategy, scan in itertools.product(
+                fitdecode.WaitStrategy, (False, True)):
+            read_fileno, write_fileno = os.pipe()
+            os.set_blocking(read_fileno, False)
+            writer = threading.Thread(target=_write, args=(write_fileno, ))
+            writer.start()
+            try:
+                with open(read_fileno, mode='rb', buffering=0) as fd:
+                    self.assertTrue(fitdecode.utils.wait_readable(fd))
+                    if scan:
+                        with fitdecode.FitScanner(
+                                fd, wait_strategy=wait_strategy) as scanner:
+                            self.assertEqual(list(scanner), expected_scan)
+                        continue
+
+                    with fitdecode.FitReader(
+                            fd, keep_raw_chunks=True,
+                            wait_strategy=wait_strategy) as fit:
+                        # a single selector is used by every wait
+                        self.assertEqual(
+                            fit._selector is not None,
+                            wait_strategy is fitdecode.WaitStrategy.SELECT)
+                        self.assertEqual(
+                            [(frame.frame_type, bytes(frame.chunk.bytes))
+                             for frame in fit],
+                            expected)
+                    self.assertIsNone(fit._selector)
+            finally:
+                writer.join()
+
+        self.assertFalse(fitdecode.utils.wait_readable(io.BytesIO(data)))
+
     def test_fitparse_invalid_crc(self):
         try:
             tuple(fitdecode.FitReader(
@@ -146,6 +1106,32 @@ class FitReaderTestCase(unittest.TestCase):
         except fitdecode.FitCRCError:
             pass
 
+    def test_deferred_crc(self):
+        for src_file in ('activity-settings.fit', 'antfs-dump.63.fit'):
+            with fitdecode.FitReader(
+                    _test_file(src_file),
+                    check_crc=fitdecode.CrcCheck.DEFERRED_RAISE,
+                    block_size=512) as fit:
+                crc_frames = [
+                    frame for frame in fit
+                    if frame.frame_type == fitdecode.FIT_FRAME_CRC]
+                worker = fit._crc_worker
+
+            self.assertTrue(crc_frames)
+            self.assertTrue(all(frame.matched for frame in crc_frames))
+            self.assertIsNotNone(worker)
+            self.assertFalse(worker._thread.is_alive())
+
+        with self.assertRaises(fitdecode.FitCRCError):
+            tuple(fitdecode.FitReader(
+                _invalid_test_file('activity-filecrc.fit'),
+                check_crc=fitdecode.CrcCheck.DEFERRED_RAISE))
+
+        with self.assertWarns(UserWarning):
+            tuple(fitdecode.FitReader(
+                _invalid_test_file('activity-filecrc.fit'),
+                check_crc=fitdecode.CrcCheck.DEFERRED_WARN))
+
     def test_fitparse_unexpected_eof(self):
         try:
             tuple(fitdecode.FitReader(
@@ -230,6 +1216,365 @@ class FitReaderTestCase(unittest.TestCase):
     def test_fitparse_basic_file_big_endian(self):
         self.test_fitparse_basic_file_with_one_record('>')
 
+    def test_decode_plan(self):
+        fit = tuple(fitdecode.FitReader(
+            _generate_fitfile(endian='>'),
+            check_crc=fitdecode.CrcCheck.RAISE))
+
+        def_mesg = fit[1]
+        decode_plan = def_mesg.decode_plan
+        self.assertEqual(
+            decode_plan.size, sum(fd.size for fd in def_mesg.field_defs))
+        self.assertEqual(decode_plan.count, len(def_mesg.field_defs))
+        self.assertEqual(decode_plan.unpacker.format, '>1I1I1H1H1H1B')
+
+        file_id = fit[2]
+        self.assertEqual(
+            [field.raw_value for field in file_id.fields],
+            [558069241, 723842606, 1, 1036, None, 4])
+
+    def test_profile(self):
+        profile = fitdecode.profile
+
+        self.assertEqual(len(profile.MESSAGE_TYPES), 120)
+        self.assertEqual(len(profile.FIELD_TYPES), 198)
+        self.assertIn(20, profile.MESSAGE_TYPES)
+        self.assertNotIn(-1, profile.MESSAGE_TYPES)
+        self.assertIsNone(profile.MESSAGE_TYPES.get(-1))
+
+        # profile objects are built once
+        record = profile.MESSAGE_TYPES[20]
+        self.assertIs(profile.MESSAGE_TYPES[20], record)
+        self.assertEqual(record.name, 'record')
+        self.assertIs(record.fields[253], profile.FIELD_TYPE_TIMESTAMP)
+        self.assertIs(
+            profile.MESSAGE_TYPES[0].fields[0].type,
+            profile.FIELD_TYPES['file'])
+        self.assertEqual(profile.FIELD_TYPES['file'].enum[4], 'activity')
+
+        compressed = record.fields[8]
+        self.assertEqual(
+            [(c.name, c.def_num, c.scale, c.units, c.accumulate, c.bits,
+              c.bit_offset)
+             for c in compressed.components],
+            [('speed', 6, 100, 'm/s', False, 12, 0),
+             ('distance', 5, 16, 'm', True, 12, 12)])
+
+        for mesg_type in profile.MESSAGE_TYPES.values():
+            for field in mesg_type.fields.values():
+                for obj in (field, *(field.subfields or ())):
+                    self.assertIs(pickle.loads(pickle.dumps(obj)), obj)
+
+    def test_profile_lookup(self):
+        profile = fitdecode.profile
+        utils = fitdecode.utils
+
+        record = profile.MESSAGE_TYPES[20]
+        self.assertIs(utils.get_mesg_type('record'), record)
+        self.assertIs(utils.get_mesg_type(20), record)
+        self.assertEqual(utils.get_mesg_num('record'), 20)
+        self.assertEqual(utils.get_mesg_num('hr'), profile.MESG_NUM_HR)
+        for mesg_type in profile.MESSAGE_TYPES.values():
+            self.assertEqual(
+                utils.get_mesg_num(mesg_type.name), mesg_type.mesg_num)
+
+        self.assertIs(utils.get_mesg_field('record', 'speed'), record.fields[6])
+        self.assertIs(utils.get_mesg_field(20, 6), record.fields[6])
+        self.assertEqual(utils.get_mesg_field_num('record', 'timestamp'), 253)
+        self.assertIs(
+            utils.get_mesg_field(
+                'file_id', 'garmin_product', subfields=True),
+            profile.MESSAGE_TYPES[0].fields[2])
+        self.assertIs(
+            utils.get_field_type('date_time'), profile.FIELD_TYPES['date_time'])
+
+        for func, args in (
+                (utils.get_mesg_type, ('nope', )),
+                (utils.get_mesg_num, ('nope', )),
+                (utils.get_mesg_num, (20, )),
+                (utils.get_mesg_field, ('record', 'nope')),
+                (utils.get_mesg_field, ('file_id', 'garmin_product')),
+                (utils.get_mesg_field_num, ('record', 'nope')),
+                (utils.get_field_type, ('nope', ))):
+            with self.assertRaises(ValueError):
+                func(*args)
+
+    def test_profile_registration(self):
+        profile = fitdecode.profile
+        types = fitdecode.types
+        utils = fitdecode.utils
+
+        record = profile.MESSAGE_TYPES[20]
+        mesg_count = len(profile.MESSAGE_TYPES)
+
+        # register a custom message and a custom type
+        custom_type = types.FieldType(
+            'custom_type', types.BASE_TYPES[0x00], {0: 'off', 1: 'on'})
+        profile.FIELD_TYPES.update(custom_type=custom_type)
+        custom = types.MessageType('custom', 0xff00, {
+            0: types.Field('state', custom_type, 0)})
+        profile.MESSAGE_TYPES[0xff00] = custom
+        try:
+            self.assertEqual(len(profile.MESSAGE_TYPES), mesg_count + 1)
+            self.assertIn(0xff00, profile.MESSAGE_TYPES)
+            self.assertIs(profile.MESSAGE_TYPES[0xff00], custom)
+            self.assertIs(utils.get_mesg_type('custom'), custom)
+            self.assertEqual(utils.get_mesg_num('custom'), 0xff00)
+            self.assertIs(
+                utils.get_mesg_field('custom', 'state'), custom.fields[0])
+            self.assertIs(utils.get_field_type('custom_type'), custom_type)
+
+            # objects set at runtime are pickled by value
+            self.assertEqual(
+                pickle.loads(pickle.dumps(custom)).fields[0].type.enum,
+                {0: 'off', 1: 'on'})
+            self.assertIs(pickle.loads(pickle.dumps(record)), record)
+        finally:
+            del profile.MESSAGE_TYPES[0xff00]
+            del profile.FIELD_TYPES['custom_type']
+
+        self.assertEqual(len(profile.MESSAGE_TYPES), mesg_count)
+        self.assertNotIn(0xff00, profile.MESSAGE_TYPES)
+        self.assertNotIn('custom_type', profile.FIELD_TYPES)
+        with self.assertRaises(ValueError):
+            utils.get_mesg_type('custom')
+        with self.assertRaises(KeyError):
+            del profile.MESSAGE_TYPES[0xff00]
+
+        # patch a message of the profile
+        patched = types.MessageType('record', 20, {
+            **record.fields,
+            250: types.Field('custom_value', custom_type, 250)})
+        profile.MESSAGE_TYPES[20] = patched
+        try:
+            self.assertIs(utils.get_mesg_type('record'), patched)
+            self.assertIs(utils.get_mesg_type(20), patched)
+            self.assertEqual(utils.get_mesg_num('record'), 20)
+            self.assertEqual(
+                utils.get_mesg_field_num('record', 'custom_value'), 250)
+
+            with fitdecode.FitReader(
+                    _test_file('2019-02-17-062644-ELEMNT-297E-195-0.fit'),
+                    keep_raw_chunks=False) as fit:
+                mesg_types = {
+                    frame.mesg_type for frame in fit
+                    if frame.frame_type == fitdecode.FIT_FRAME_DATA and
+                    frame.global_mesg_num == 20}
+            self.assertEqual(mesg_types, {patched})
+        finally:
+            # restore the profile as it was built
+            profile.MESSAGE_TYPES._cache[20] = record
+            profile.MESSAGE_TYPES._changed.discard(20)
+            profile.MESSAGE_TYPES._writes += 1
+
+        self.assertIs(utils.get_mesg_type('record'), record)
+        with self.assertRaises(ValueError):
+            utils.get_mesg_field_num('record', 'custom_value')
+
+    def test_processor_dispatch(self):
+        class Processor(fitdecode.DefaultDataProcessor):
+            def process_field_heart_rate(self, reader, field_data):
+                field_data.units = 'beats'
+
+            def process_units_beats(self, reader, field_data):
+                field_data.value = ('beats', field_data.value)
+
+            def process_units_m(self, reader, field_data):
+                field_data.units = 'meters'
+
+        class OverridingProcessor(Processor):
+            def __init__(self):
+                super().__init__()
+                self.type_names = set()
+
+            def on_process_type(self, reader, field_data):
+                self.type_names.add(field_data.type.name)
+                super().on_process_type(reader, field_data)
+
+        class UncompiledProcessor(Processor):
+            # FitReader calls on_process_* methods instead
+            get_field_processor = None
+
+        def _fields_repr(processor):
+            with fitdecode.FitReader(
+                    _test_file('activity-small-fenix2-run.fit'),
+                    processor=processor) as fit:
+                return [
+                    [(field.name, field.value, field.units)
+                     for field in frame.fields]
+                    for frame in fit
+                    if frame.frame_type == fitdecode.FIT_FRAME_DATA]
+
+        expected = _fields_repr(UncompiledProcessor())
+        fields = dict(itertools.chain.from_iterable(
+            ((name, (value, units)) for name, value, units in mesg)
+            for mesg in expected))
+        self.assertEqual(fields['heart_rate'][1], 'beats')
+        self.assertEqual(fields['heart_rate'][0][0], 'beats')
+        self.assertEqual(fields['distance'][1], 'meters')
+        self.assertIsInstance(fields['timestamp'][0], datetime.datetime)
+
+        self.assertEqual(_fields_repr(Processor()), expected)
+
+        processor = OverridingProcessor()
+        self.assertEqual(_fields_repr(processor), expected)
+        self.assertIn('date_time', processor.type_names)
+
+    def test_processor_batch(self):
+        class Processor(fitdecode.StandardUnitsDataProcessor):
+            def __init__(self):
+                super().__init__()
+                self.batches = []
+                self.events = []
+
+            def on_process_batch(self, reader, def_mesg, data_messages):
+                self.batches.append((def_mesg, data_messages))
+                self.events.append('batch')
+                super().on_process_batch(reader, def_mesg, data_messages)
+
+            def on_crc(self, reader, crc):
+                self.events.append('crc')
+
+            def process_column_field_heart_rate(self, reader, column):
+                for field_data in column:
+                    field_data.units = 'beats'
+
+        def _fields_repr(processor, **kwargs):
+            with fitdecode.FitReader(
+                    _test_file('activity-small-fenix2-run.fit'),
+                    processor=processor, **kwargs) as fit:
+                return [
+                    [(field.name, field.value, field.units)
+                     for field in frame.fields]
+                    for frame in fit
+                    if frame.frame_type == fitdecode.FIT_FRAME_DATA]
+
+        expected = _fields_repr(fitdecode.StandardUnitsDataProcessor())
+        expected = [
+            [(name, value, 'beats' if name == 'heart_rate' else units)
+             for name, value, units in mesg]
+            for mesg in expected]
+
+        processor = Processor()
+        self.assertEqual(_fields_repr(processor, batch_size=8), expected)
+
+        self.assertGreater(len(processor.batches), 1)
+        for def_mesg, data_messages in processor.batches:
+            self.assertTrue(1 <= len(data_messages) <= 8)
+            for data_message in data_messages:
+                self.assertIs(data_message.def_mesg, def_mesg)
+        self.assertEqual(
+            sum(len(data_messages) for _, data_messages in processor.batches),
+            len(expected))
+        self.assertEqual(processor.events[-1], 'crc')
+        self.assertEqual(processor.events[-2], 'batch')
+
+        # on_process_batch is not called by default
+        processor = Processor()
+        self.assertNotEqual(_fields_repr(processor), expected)
+        self.assertEqual(processor.batches, [])
+
+    def test_processor_epoch_timestamps(self):
+        def _values(processor):
+            with fitdecode.FitReader(
+                    _test_file('event_timestamp.fit'),
+                    processor=processor) as fit:
+                return [
+                    (field.name, field.value, field.units)
+                    for frame in fit
+                    if frame.frame_type == fitdecode.FIT_FRAME_DATA
+                    for field in frame.fields]
+
+        expected = _values(fitdecode.DefaultDataProcessor())
+        raw_values = _values(None)
+        values = _values(
+            fitdecode.DefaultDataProcessor(epoch_timestamps=True))
+        self.assertEqual(len(values), len(expected))
+
+        count = 0
+        for (name, value, units), expected_value, raw_value in zip(
+                values, expected, raw_values):
+            if isinstance(expected_value[1], datetime.datetime):
+                count += 1
+                self.assertIsInstance(value, (int, float))
+                self.assertAlmostEqual(
+                    value, expected_value[1].timestamp(), places=5)
+                self.assertEqual(units, raw_value[2])
+            else:
+                self.assertEqual((name, value, units), expected_value)
+        self.assertGreater(count, 0)
+
+    def test_lazy_fields(self):
+        class Processor(fitdecode.DefaultDataProcessor):
+            def __init__(self):
+                super().__init__()
+                self.count = 0
+
+            def on_process_field(self, reader, field_data):
+                self.count += 1
+                super().on_process_field(reader, field_data)
+
+        def _fields_repr(fields):
+            return [
+                (field.name, field.def_num, field.value, field.raw_value,
+                 field.units)
+                for field in fields]
+
+        for name in (
+                'activity-small-fenix2-run.fit', 'compressed-speed-distance.fit',
+                'event_timestamp.fit', 'DeveloperData.fit'):
+            with fitdecode.FitReader(_test_file(name)) as fit:
+                expected = [
+                    frame for frame in fit
+                    if frame.frame_type == fitdecode.FIT_FRAME_DATA]
+
+            processor = Processor()
+            with fitdecode.FitReader(
+                    _test_file(name), processor=processor,
+                    lazy_fields=True) as fit:
+                frames = [
+                    frame for frame in fit
+                    if frame.frame_type == fitdecode.FIT_FRAME_DATA]
+            self.assertEqual(len(frames), len(expected))
+            eager_count = processor.count
+
+            for frame, expected_frame in zip(frames, expected):
+                for field in expected_frame.fields:
+                    for key in (field.name, field.def_num):
+                        self.assertEqual(
+                            _fields_repr(frame.get_fields(key)),
+                            _fields_repr(expected_frame.get_fields(key)))
+                self.assertFalse(frame.has_field('unknown_field'))
+                self.assertEqual(
+                    _fields_repr(frame.fields),
+                    _fields_repr(expected_frame.fields))
+
+            self.assertGreater(processor.count, eager_count)
+
+        # only the looked up fields (and the timestamp) are decoded
+        processor = Processor()
+        with fitdecode.FitReader(
+                _test_file('activity-small-fenix2-run.fit'),
+                processor=processor, lazy_fields=True,
+                include_mesgs=['record']) as fit:
+            records = [
+                frame for frame in fit
+                if frame.frame_type == fitdecode.FIT_FRAME_DATA]
+        self.assertEqual(processor.count, len(records))
+        self.assertIsInstance(
+            records[0].get_value('timestamp'), datetime.datetime)
+
+        records[0].get_value('heart_rate')
+        self.assertEqual(processor.count, len(records) + 1)
+        self.assertGreater(len(records[0].fields), 2)
+        self.assertEqual(
+            processor.count, len(records) - 1 + len(records[0].fields))
+
+        # frames are decoded entirely once pickled
+        self.assertEqual(
+            _fields_repr(pickle.loads(pickle.dumps(records[1])).fields),
+            _fields_repr(records[1].fields))
+
     def test_fitparse_component_field_accumulaters(self):
         csv_fp = open(
             _test_file('compressed-speed-distance-records.csv'),
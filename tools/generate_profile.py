@@ -41,14 +41,19 @@ PROFILE_HEADER_FIRST_PART = "%s\n%s" % (
     header('DO NOT EDIT THIS FILE'),
 )
 
-IMPORT_HEADER = '''from .types import (
+IMPORT_HEADER = '''import functools
+
+from .types import (
     ComponentField,
     Field,
     FieldType,
     MessageType,
     ReferenceField,
     SubField,
-    BASE_TYPES)'''
+    BASE_TYPES,
+    _LazyMapping,
+    _make_field_type,
+    _make_message_type)'''
 
 # This allows to prepend the declaration of some message numbers to the
 # generated file.
@@ -66,7 +71,22 @@ FIELD_NUM_DECLARATIONS = (
     'hr.event_timestamp',
     'hr.event_timestamp_12')
 
-SPECIAL_FIELD_DECLARATIONS = "FIELD_TYPE_TIMESTAMP = Field(name='timestamp', type=FIELD_TYPES['date_time'], def_num=" + str(FIELD_NUM_TIMESTAMP) + ", units='s')"
+# Profile objects are built upon first access, from the tables rendered above
+# these declarations, so that importing the profile is fast. The entries of the
+# tables are rendered as the source text of their literal, which is parsed upon
+# first access as well.
+PROFILE_DECLARATIONS = """\
+FIELD_TYPES = _LazyMapping(_FIELD_TYPES_TABLE, _make_field_type)
+
+FIELD_TYPE_TIMESTAMP = Field(name='timestamp', type=FIELD_TYPES['date_time'], def_num=%d, units='s')
+
+MESSAGE_TYPES = _LazyMapping(
+    _MESSAGE_TYPES_TABLE,
+    functools.partial(
+        _make_message_type,
+        field_types=FIELD_TYPES,
+        timestamp_field=FIELD_TYPE_TIMESTAMP))""" % FIELD_NUM_TIMESTAMP
+
 
 IGNORE_TYPE_VALUES = (
     # of the form 'type_name:value_name'
@@ -96,9 +116,35 @@ BASE_TYPES = {
 
 def render_type(name):
     if name in BASE_TYPES:
-        return "BASE_TYPES[%s],  # %s" % (BASE_TYPES[name], name)
+        return BASE_TYPES[name]
     else:
-        return "FIELD_TYPES['%s']," % name
+        return "'%s'" % name
+
+
+def type_comment(name, comment):
+    # the name of a base type goes to the comment since base types are
+    # rendered by identifier
+    return '; '.join(filter(None, (
+        name if name in BASE_TYPES else None, comment)))
+
+
+def render_value(value):
+    # falsy values are the defaults of the profile objects
+    return str(value) if value else 'None'
+
+
+def render_sequence(s, items, comment, sort_key=None):
+    # Append a sequence of *items* to the rendered tuple *s*, or None if there
+    # is no item. *comment* is rendered if not rendered yet, i.e. if it is not
+    # None.
+    if not items:
+        return s + ', None', comment
+
+    s += ', (%s\n' % render_comment(comment)
+    for item in (sorted(items, key=sort_key) if sort_key else items):
+        s += "    %s,\n" % indent(item)
+    s += ')'
+    return s, None
 
 
 def indent(s, amount=1):
@@ -123,9 +169,9 @@ class TypeList(namedtuple('TypeList', ('types'))):
         raise AssertionError("Couldn't find message by name: %s" % name)
 
     def __str__(self):
-        s = 'FIELD_TYPES = {\n'
+        s = '_FIELD_TYPES_TABLE = {\n'
         for type in sorted(self.types, key=lambda x: x.name):
-            s += "    '%s': %s,\n" % (type.name, indent(type))
+            s += "    '%s': r\"\"\"%s\"\"\",\n" % (type.name, indent(type))
         s += '}'
         return s
 
@@ -138,28 +184,25 @@ class TypeInfo(namedtuple('TypeInfo', ('name', 'base_type', 'enum', 'comment')))
         raise AssertionError("Invalid value name %s in type %s" % (value_name, self.name))
 
     def __str__(self):
-        s = 'FieldType(%s\n' % render_comment(self.comment)
-        s += "    name='%s',\n" % (self.name)
-        s += "    base_type=BASE_TYPES[%s],  # %s\n" % (
-            BASE_TYPES[self.base_type], self.base_type,
-        )
-        if self.enum:
-            s += "    enum={\n"
-            for value in sorted(self.enum, key=lambda x: x.value if isinstance(x.value, int) else int(x.value, 16)):
-                s += "        %s\n" % (value,)
-            s += "    },\n"
-        s += ")"
+        # (base_type, ((value, value_name), ...))
+        comment = render_comment(type_comment(self.base_type, self.comment))
+        if not self.enum:
+            return "(%s, ())%s" % (BASE_TYPES[self.base_type], comment)
+        s = "(%s, (%s\n" % (BASE_TYPES[self.base_type], comment)
+        for value in sorted(self.enum, key=lambda x: x.value if isinstance(x.value, int) else int(x.value, 16)):
+            s += "    %s\n" % (value,)
+        s += "))"
         return s
 
 
 class TypeValueInfo(namedtuple('TypeValueInfo', ('name', 'value', 'comment'))):
     def __str__(self):
-        return "%s: '%s',%s" % (self.value, self.name, render_comment(self.comment))
+        return "(%s, '%s'),%s" % (self.value, self.name, render_comment(self.comment))
 
 
 class MessageList(namedtuple('MessageList', ('messages'))):
     def __str__(self):
-        s = 'MESSAGE_TYPES = {\n'
+        s = '_MESSAGE_TYPES_TABLE = {\n'
         last_group_name = None
         for message in sorted(
             self.messages,
@@ -174,7 +217,16 @@ class MessageList(namedtuple('MessageList', ('messages'))):
                     s += '\n\n'
                 s += "%s\n" % header(message.group_name, 4)
                 last_group_name = message.group_name
-            s += "    %s: %s,\n" % (message.num, indent(message))
+            s += "    %s: r\"\"\"%s\"\"\",\n" % (message.num, indent(message))
+        s += '}'
+        return s
+
+    def render_nums(self):
+        # message names to global message numbers, to look up messages by name
+        # without building them
+        s = 'MESSAGE_NUMS = {\n'
+        for message in sorted(self.messages, key=lambda mi: mi.num):
+            s += "    '%s': %s,\n" % (message.name, message.num)
         s += '}'
         return s
 
@@ -203,102 +255,68 @@ class MessageInfo(namedtuple('MessageInfo', ('name', 'num', 'group_name', 'field
         raise AssertionError("Invalid field name %s in message %s" % (field_name, self.name))
 
     def __str__(self):
-        s = "MessageType(%s\n" % render_comment(self.comment)
-        s += "    name='%s',\n" % self.name
-        s += "    mesg_num=%d,\n" % self.num
-        s += "    fields={\n"
+        # (name, (field, ...))
+        s = "('%s', (%s\n" % (self.name, render_comment(self.comment))
         for field in sorted(self.fields, key=lambda fi: fi.num):
             # Don't include trailing comma for fields
-            s += "        %d: %s\n" % (field.num, indent(field, 2))
-        s += "    },\n"
-        s += ")"
+            s += "    %s\n" % indent(field)
+        s += "))"
         return s
 
 
 class FieldInfo(namedtuple('FieldInfo', ('name', 'type', 'num', 'scale', 'offset', 'units', 'components', 'subfields', 'comment'))):
     def __str__(self):
+        # (def_num, name, type, scale, offset, units, components, subfields)
         if self.num == FIELD_NUM_TIMESTAMP:
             # Add trailing comma here because of comment
             assert not self.components and not self.subfields
-            return 'FIELD_TYPE_TIMESTAMP,%s' % render_comment(self.comment)
-        s = "Field(%s\n" % render_comment(self.comment)
-        s += "    name='%s',\n" % self.name
-        s += "    type=%s\n" % render_type(self.type)
-        s += "    def_num=%d,\n" % self.num
-        if self.scale:
-            s += "    scale=%s,\n" % self.scale
-        if self.offset:
-            s += "    offset=%s,\n" % self.offset
-        if self.units:
-            s += "    units=%s,\n" % repr(self.units)
-        if self.components:
-            s += '    components=(\n'
-            # Leave components sorted as is (order matters because of bit layout)
-            for component in self.components:
-                s += "        %s,\n" % indent(component, 2)
-            s += "    ),\n"
-        if self.subfields:
-            s += "    subfields=(\n"
-            for subfield in sorted(self.subfields, key=lambda si: si.name):
-                s += "        %s,\n" % indent(subfield, 2)
-            s += "    ),\n"
-        s += "),"
+            return 'None,%s' % render_comment('; '.join(filter(None, (
+                'FIELD_TYPE_TIMESTAMP', self.comment))))
+        comment = type_comment(self.type, self.comment)
+        s = "(%d, '%s', %s, %s, %s, %s" % (
+            self.num, self.name, render_type(self.type),
+            render_value(self.scale), render_value(self.offset),
+            repr(self.units) if self.units else 'None')
+        # Leave components sorted as is (order matters because of bit layout)
+        s, comment = render_sequence(s, self.components, comment)
+        s, comment = render_sequence(
+            s, self.subfields, comment, sort_key=lambda si: si.name)
+        s += "),%s" % render_comment(comment)
         return s
 
 
 class ComponentFieldInfo(namedtuple('ComponentFieldInfo', ('name', 'num', 'scale', 'offset', 'units', 'bits', 'bit_offset', 'accumulate'))):
     def __str__(self):
-        s = "ComponentField(\n"
-        s += "    name='%s',\n" % self.name
-        s += "    def_num=%d,\n" % (self.num if self.num is not None else 0)
-        if self.scale:
-            s += "    scale=%s,\n" % self.scale
-        if self.offset:
-            s += "    offset=%s,\n" % self.offset
-        if self.units:
-            s += "    units=%s,\n" % repr(self.units)
-        s += "    accumulate=%s,\n" % self.accumulate
-        s += "    bits=%s,\n" % self.bits
-        s += "    bit_offset=%s,\n" % self.bit_offset
-        s += ")"
-        return s
+        # (name, def_num, scale, offset, units, accumulate, bits, bit_offset)
+        return "('%s', %d, %s, %s, %s, %s, %s, %s)" % (
+            self.name, self.num if self.num is not None else 0,
+            render_value(self.scale), render_value(self.offset),
+            repr(self.units) if self.units else 'None',
+            self.accumulate, self.bits, self.bit_offset)
 
 
 class SubFieldInfo(namedtuple('SubFieldInfo', ('name', 'num', 'type', 'scale', 'offset', 'units', 'ref_fields', 'components', 'comment'))):
     def __str__(self):
-        s = "SubField(%s\n" % render_comment(self.comment)
-        s += "    name='%s',\n" % self.name
-        s += "    def_num=%s,\n" % self.num
-        s += "    type=%s\n" % render_type(self.type)
-        if self.scale:
-            s += "    scale=%s,\n" % self.scale
-        if self.offset:
-            s += "    offset=%s,\n" % self.offset
-        if self.units:
-            s += "    units=%s,\n" % repr(self.units)
-        s += "    ref_fields=(\n"
-        for ref_field in self.ref_fields:  # sorted(self.ref_fields, key=lambda rf: (rf.name, rf.value)):
-            s += "        %s,\n" % indent(ref_field, 2)
-        s += "    ),\n"
-        if self.components:
-            s += '    components=(\n'
-            # Leave components sorted as is (order matters because of bit layout)
-            for component in self.components:
-                s += "        %s,\n" % indent(component, 2)
-            s += "    ),\n"
+        # (name, def_num, type, scale, offset, units, ref_fields, components)
+        comment = type_comment(self.type, self.comment)
+        s = "('%s', %s, %s, %s, %s, %s" % (
+            self.name, self.num, render_type(self.type),
+            render_value(self.scale), render_value(self.offset),
+            repr(self.units) if self.units else 'None')
+        # sorted(self.ref_fields, key=lambda rf: (rf.name, rf.value))
+        assert self.ref_fields
+        s, comment = render_sequence(s, self.ref_fields, comment)
+        # Leave components sorted as is (order matters because of bit layout)
+        s, comment = render_sequence(s, self.components, comment)
         s += ")"
         return s
 
 
 class ReferenceFieldInfo(namedtuple('ReferenceFieldInfo', ('name', 'value', 'num', 'raw_value'))):
     def __str__(self):
-        s = 'ReferenceField(\n'
-        s += "    name='%s',\n" % self.name
-        s += '    def_num=%d,\n' % self.num
-        s += "    value='%s',\n" % self.value
-        s += '    raw_value=%d,\n' % self.raw_value
-        s += ')'
-        return s
+        # (name, def_num, value, raw_value)
+        return "('%s', %d, '%s', %d)" % (
+            self.name, self.num, self.value, self.raw_value)
 
 
 def render_comment(comment):
@@ -652,9 +670,10 @@ def main(input_xls_or_zip, output_py_path=None):
         output += '\n\n' + '\n'.join(field_num_declarations) + '\n'
 
     output += '\n\n' + '\n'.join([
+        message_list.render_nums(), '\n',
         str(type_list), '\n',
-        SPECIAL_FIELD_DECLARATIONS, '\n',
-        str(message_list), ''
+        str(message_list), '\n',
+        PROFILE_DECLARATIONS, ''
     ])
 
     # TODO: Apply an additional layer of monkey patching to match reference/component